@@ -0,0 +1,32 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+
+import checkedframe as cf
+
+
+class UnionSchema(cf.Schema):
+    a = cf.Union(
+        cf.UInt8(cast=True),
+        cf.Int8(cast=True),
+        cf.UInt16(cast=True),
+        cf.Int32(cast=True),
+    )
+
+
+# Only the last member of the union fits. Whether each member fits is decided from the
+# minimum and maximum of the column, so the column is scanned once rather than once per
+# member.
+VALUES = np.random.default_rng(0).integers(-100_000, 100_000, 10_000_000)
+DFS = {
+    "pandas": pd.DataFrame({"a": VALUES}),
+    "polars": pl.DataFrame({"a": VALUES}),
+}
+
+
+def bench_union_pandas():
+    UnionSchema.validate(DFS["pandas"])
+
+
+def bench_union_polars():
+    UnionSchema.validate(DFS["polars"])
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+import checkedframe as cf
+
+
+def make_schema(n_columns: int) -> type[cf.Schema]:
+    class WideSchema(cf.Schema):
+        pass
+
+    for i in range(n_columns):
+        setattr(WideSchema, f"col{i}", cf.Int64(cast=True))
+
+    return WideSchema
+
+
+# Every column has to be cast from Int32 to Int64. All casts are applied with a single
+# `with_columns`, so pandas rebuilds the frame once rather than once per column.
+SIZES = [100, 250, 500]
+SCHEMAS = {n: make_schema(n) for n in SIZES}
+DFS = {
+    n: pd.DataFrame({f"col{i}": np.arange(100_000, dtype="int32") for i in range(n)})
+    for n in SIZES
+}
+
+
+def _validate(n: int):
+    SCHEMAS[n].validate(DFS[n])
+
+
+def bench_validate_100():
+    _validate(100)
+
+
+def bench_validate_250():
+    _validate(250)
+
+
+def bench_validate_500():
+    _validate(500)
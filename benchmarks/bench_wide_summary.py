@@ -0,0 +1,56 @@
+import polars as pl
+
+import checkedframe as cf
+
+
+def make_schema(n_columns: int) -> type[cf.Schema]:
+    class WideSchema(cf.Schema):
+        pass
+
+    for i in range(n_columns):
+        setattr(WideSchema, f"col{i}", cf.Int64())
+
+    return WideSchema
+
+
+# Every column has an existence and a `nullable=False` check, so the number of checks is
+# twice the number of columns. Interrogation time should grow linearly with it.
+SIZES = [2_500, 5_000, 10_000, 20_000]
+SCHEMAS = {n: make_schema(n) for n in SIZES}
+DFS = {n: pl.DataFrame({f"col{i}": [1, 2, 3] for i in range(n)}) for n in SIZES}
+
+
+def _interrogate(n: int, mask: bool = True):
+    SCHEMAS[n].interrogate(DFS[n], mask=mask)
+
+
+def bench_interrogate_2_500():
+    _interrogate(2_500)
+
+
+def bench_interrogate_5_000():
+    _interrogate(5_000)
+
+
+def bench_interrogate_10_000():
+    _interrogate(10_000)
+
+
+def bench_interrogate_20_000():
+    _interrogate(20_000)
+
+
+def bench_summarize_2_500():
+    _interrogate(2_500, mask=False)
+
+
+def bench_summarize_5_000():
+    _interrogate(5_000, mask=False)
+
+
+def bench_summarize_10_000():
+    _interrogate(10_000, mask=False)
+
+
+def bench_summarize_20_000():
+    _interrogate(20_000, mask=False)
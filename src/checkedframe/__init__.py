@@ -3,7 +3,15 @@ from checkedframe import exceptions, selectors
 
 from ._checks import Check
 from ._config import Config, apply_configs
-from ._core import Schema
+from ._core import (
+    FailureIndex,
+    FailureSample,
+    PlanCacheInfo,
+    Schema,
+    clear_plan_cache,
+    plan_cache_info,
+    set_plan_cache_maxsize,
+)
 from ._dtypes import Array, Binary, Boolean, Categorical
 from ._dtypes import CfUnion as Union
 from ._dtypes import (
@@ -30,6 +38,7 @@ from ._dtypes import (
     UInt128,
     Unknown,
 )
+from ._incremental import IncrementalValidator
 from ._narwhals_reexport import (
     DataFrame,
     Expr,
@@ -160,16 +160,18 @@ def _get_repr(x: Any) -> str:
 ClosedInterval = Literal["left", "right", "none", "both"]
 
 
-def _is_not_null(name: str) -> nw.Expr:
-    return nw.col(name).is_null().__invert__()
+# These take any number of columns so that the built-in checks of many columns can be
+# evaluated as a single multi-output expression
+def _is_not_null(*names: str) -> nw.Expr:
+    return nw.col(*names).is_null().__invert__()
 
 
-def _is_not_nan(name: str) -> nw.Expr:
-    return nw.col(name).is_nan().__invert__()
+def _is_not_nan(*names: str) -> nw.Expr:
+    return nw.col(*names).is_nan().__invert__()
 
 
-def _is_not_inf(name: str) -> nw.Expr:
-    return nw.col(name).is_in((INF, NEG_INF)).__invert__()
+def _is_not_inf(*names: str) -> nw.Expr:
+    return nw.col(*names).is_in((INF, NEG_INF)).__invert__()
 
 
 def _is_between(
@@ -182,23 +184,23 @@ def _is_between(
 
 
 def _lt(name: str, other) -> nw.Expr:
-    return nw.col(name) < other
+    return nw.col(name) < _numeric_to_expr(other)
 
 
 def _le(name: str, other) -> nw.Expr:
-    return nw.col(name) <= other
+    return nw.col(name) <= _numeric_to_expr(other)
 
 
 def _gt(name: str, other) -> nw.Expr:
-    return nw.col(name) > other
+    return nw.col(name) > _numeric_to_expr(other)
 
 
 def _ge(name: str, other) -> nw.Expr:
-    return nw.col(name) >= other
+    return nw.col(name) >= _numeric_to_expr(other)
 
 
 def _eq(name: str, other) -> nw.Expr:
-    return nw.col(name) == other
+    return nw.col(name) == _numeric_to_expr(other)
 
 
 def _private_approx_eq(
@@ -221,7 +223,9 @@ def _private_approx_eq(
 
 
 def _approx_eq(name: str, other, rtol, atol, nan_equal) -> nw.Expr:
-    return _private_approx_eq(nw.col(name), other, rtol, atol, nan_equal)
+    return _private_approx_eq(
+        nw.col(name), _numeric_to_expr(other), rtol, atol, nan_equal
+    )
 
 
 def _series_lit_approx_eq(
@@ -359,6 +363,81 @@ def _str_contains(name: str, pattern: str, literal: bool = False) -> nw.Expr:
     return nw.col(name).str.contains(pattern, literal=literal)
 
 
+# Built-in checks whose result for a row only depends on that row, as long as none of
+# their arguments is an expression (which may aggregate, e.g. `nw.col("a").mean()`)
+_ROW_LOCAL_CHECKS = frozenset(
+    {
+        _is_not_null,
+        _is_not_nan,
+        _is_not_inf,
+        _is_between,
+        _lt,
+        _le,
+        _gt,
+        _ge,
+        _eq,
+        _approx_eq,
+        _is_in,
+        _is_finite,
+        _str_ends_with,
+        _str_starts_with,
+        _str_contains,
+    }
+)
+
+
+# The arguments of built-in checks that are interpreted as column names if they are
+# strings
+_COLUMN_ARGUMENTS = {
+    _is_between: ("lower_bound", "upper_bound"),
+    _lt: ("other",),
+    _le: ("other",),
+    _gt: ("other",),
+    _ge: ("other",),
+    _eq: ("other",),
+    _approx_eq: ("other",),
+}
+
+
+def _as_columns(x: str | Sequence[str]) -> list[str]:
+    return [x] if isinstance(x, str) else list(x)
+
+
+def _check_dependencies(check: Check) -> Optional[list[str]]:
+    """The columns `check` reads other than the column it is attached to, or None if it
+    may read any column."""
+    if check.depends_on is not None:
+        return check.depends_on
+
+    if check.input_type == "Series":
+        return []
+
+    if not isinstance(check.func, functools.partial):
+        return None
+
+    func, kwargs = check.func.func, check.func.keywords
+
+    if func in _ROW_LOCAL_CHECKS:
+        if any(isinstance(v, nw.Expr) for v in kwargs.values()):
+            return None
+
+        return [
+            kwargs[arg]
+            for arg in _COLUMN_ARGUMENTS.get(func, ())
+            if isinstance(kwargs.get(arg), str)
+        ]
+    elif func is _is_id:
+        return _as_columns(kwargs["subset"])
+    elif func is _frame_is_sorted:
+        # Comparing every column means the result depends on every column
+        return None if kwargs["compare_all"] else _as_columns(kwargs["by"])
+    elif func is _cardinality_ratio:
+        by = [] if kwargs["by"] is None else _as_columns(kwargs["by"])
+        return [kwargs["left"], kwargs["right"], *by]
+
+    return None
+
+
 CardinalityRatio = Literal["1:1", "1:m", "m:1"]
 
 
@@ -449,6 +528,11 @@ class Check:
     description : Optional[str], optional
         The description of the check. If None, attempts to read from the __doc__
         attribute, by default None
+    depends_on : Optional[str | list[str]], optional
+        The columns the check reads, other than the column it is attached to. Declaring
+        them lets validation read only the columns it needs from LazyFrames. If None,
+        the check is assumed to read any column, unless it only takes a Series, by
+        default None
     """
 
     def __init__(
@@ -460,6 +544,7 @@ class Check:
         native: bool | Literal["auto"] = "auto",
         name: Optional[str] = None,
         description: Optional[str] = None,
+        depends_on: Optional[str | list[str]] = None,
     ):
         self.func = func
         self.input_type = input_type
@@ -468,6 +553,7 @@ class Check:
         self.name = name
         self.description = description
         self.columns = [columns] if isinstance(columns, str) else columns
+        self.depends_on = [depends_on] if isinstance(depends_on, str) else depends_on
 
         if self.func is not None:
             self._set_params()
@@ -521,6 +607,7 @@ class Check:
             native=self.native,
             name=self.name,
             description=self.description,
+            depends_on=self.depends_on,
         )
 
     @staticmethod
@@ -775,7 +862,7 @@ class Check:
                 - less_than failed for 1 / 3 (33.33%) rows: Must be < max_age
         """
         return Check(
-            func=functools.partial(_lt, other=_numeric_to_expr(other)),
+            func=functools.partial(_lt, other=other),
             input_type="str",
             return_type="Expr",
             native=False,
@@ -831,7 +918,7 @@ class Check:
                 - less_than_or_equal_to failed for 1 / 3 (33.33%) rows: Must be <= 10
         """
         return Check(
-            func=functools.partial(_le, other=_numeric_to_expr(other)),
+            func=functools.partial(_le, other=other),
             input_type="str",
             return_type="Expr",
             native=False,
@@ -888,7 +975,7 @@ class Check:
                 - greater_than failed for 1 / 3 (33.33%) rows: Must be > min_age
         """
         return Check(
-            func=functools.partial(_gt, other=_numeric_to_expr(other)),
+            func=functools.partial(_gt, other=other),
             input_type="str",
             return_type="Expr",
             native=False,
@@ -945,7 +1032,7 @@ class Check:
                 - greater_than_or_equal_to failed for 1 / 3 (33.33%) rows: Must be >= min_age
         """
         return Check(
-            func=functools.partial(_ge, other=_numeric_to_expr(other)),
+            func=functools.partial(_ge, other=other),
             input_type="str",
             return_type="Expr",
             native=False,
@@ -990,7 +1077,7 @@ class Check:
                 - equal_to failed for 1 / 3 (33.33%) rows: Must be = A
         """
         return Check(
-            func=functools.partial(_eq, other=_numeric_to_expr(other)),
+            func=functools.partial(_eq, other=other),
             input_type="str",
             return_type="Expr",
             native=False,
@@ -1048,7 +1135,7 @@ class Check:
         return Check(
             func=functools.partial(
                 _approx_eq,
-                other=_numeric_to_expr(other),
+                other=other,
                 rtol=rtol,
                 atol=atol,
                 nan_equal=nan_equal,
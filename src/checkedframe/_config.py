@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from typing import TYPE_CHECKING, TypedDict
+from typing import TYPE_CHECKING, Literal, TypedDict
 
 from .selectors import Selector, by_name
 
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
 class _PossibleConfigs(TypedDict):
     nullable: bool
     required: bool
-    cast: bool
+    cast: bool | Literal["coerce"]
     allow_nan: bool
     allow_inf: bool
 
@@ -31,8 +31,8 @@ class Config:
             Whether the column is nullable or not
         required : bool
             Whether the column is required to exist or not
-        cast : bool
-            Whether to cast to the specified datatype
+        cast : bool | Literal["coerce"]
+            Whether to cast to the specified datatype, see `cast` of the column
         allow_nan : bool
             Whether the column can have NaNs or not
         allow_inf : bool
@@ -2,16 +2,37 @@ from __future__ import annotations
 
 import copy
 import dataclasses
+import functools
+import itertools
+import multiprocessing
+import random
 import string
-from collections.abc import Iterable, Mapping
-from typing import Any, Optional
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Literal, NamedTuple, Optional
 
 import narwhals.stable.v1 as nw
 import narwhals.stable.v1.typing as nwt
 
-from ._checks import Check, _infer_return_type
+from ._checks import (
+    _ROW_LOCAL_CHECKS,
+    Check,
+    _check_dependencies,
+    _infer_return_type,
+)
 from ._config import ConfigList
-from ._dtypes import CastError, CfUnion, TypedColumn, _nw_type_to_cf_type
+from ._dtypes import (
+    CastError,
+    CfUnion,
+    TypedColumn,
+    _cast_errors,
+    _CastExpr,
+    _nw_type_to_cf_type,
+    _unsupported_cast_message,
+)
 from ._utils import get_class_members
 from .exceptions import SchemaError
 from .selectors import Selector
@@ -26,6 +47,16 @@ class _ResultWrapper:
     operation: str
     native: bool = False
     is_expr: bool = False
+    # If set, `res` is a single boolean that holds for every row, e.g. existence and
+    # data types. These are never broadcast into a column.
+    is_scalar: bool = False
+    # Set for built-in checks that can be evaluated for many columns at once, see
+    # `_batched_exprs`. Takes the column names and returns a multi-output expression.
+    batch: Optional[Callable[..., nw.Expr]] = None
+
+
+def _check_identifier(check_name: str, series_name: Optional[str] = None) -> str:
+    return f"__checkedframe_{'' if series_name is None else series_name}_{check_name}__"
 
 
 def _run_check(
@@ -64,9 +95,7 @@ def _run_check(
     """
     assert check.func is not None
 
-    new_check_name = (
-        f"__checkedframe_{'' if series_name is None else series_name}_{check_name}__"
-    )
+    new_check_name = _check_identifier(check_name, series_name)
     column_name = "__dataframe__" if series_name is None else series_name
 
     err_msg = string.Template(
@@ -135,15 +164,14 @@ def _run_check(
             is_expr=False,
         )
     elif check_return_type == "bool":
-        res = nw.lit(res)
         return _ResultWrapper(
-            res,
+            bool(res),
             msg=err_msg,
             identifier=new_check_name,
             column=column_name,
             operation=check_name,
             native=False,
-            is_expr=True,
+            is_scalar=True,
         )
     else:
         raise ValueError(f"Invalid return_type {check_return_type}")
@@ -151,29 +179,41 @@ def _run_check(
 
 @dataclasses.dataclass
 class _PrivateInterrogationResult:
-    df: nw.DataFrame
-    mask: nw.DataFrame
-    is_good: nw.Series
-    summary: nw.DataFrame
+    df: nw.DataFrame | nw.LazyFrame
+    # Not computed if only the summary was asked for
+    mask: Optional[nw.DataFrame | nw.LazyFrame]
+    is_good: Optional[nw.Series | nw.LazyFrame]
+    summary: nw.DataFrame | nw.LazyFrame
+    # Only set for lazy inputs. This is the input frame with one boolean column per
+    # check plus the `is_good` column appended, which lets us filter without having to
+    # align two LazyFrames by position.
+    annotated: Optional[nw.LazyFrame] = None
 
 
 @dataclasses.dataclass
 class InterrogationResult:
     """
     All DataFrames and Series are of the same type as the original input DataFrame, e.g.
-    pandas in, pandas out.
+    pandas in, pandas out. If the input is a LazyFrame (e.g. a Polars LazyFrame), every
+    attribute is a LazyFrame and nothing is computed until you collect it. In that case,
+    `is_good` is a LazyFrame with a single boolean column, "is_good".
 
     Attributes
     ----------
 
     df: nwt.IntoDataFrame
         The input DataFrame with sucessful transforms (casting) applied
-    mask: nwt.IntoDataFrame
+    mask: Optional[nwt.IntoDataFrame | FailureIndex]
         A boolean DataFrame in the same row order as the input DataFrame where each
-        column is whether the specified check passed or not
-    is_good: nwt.IntoSeries
+        column is whether the specified check passed or not. Checks with a single
+        outcome for the whole DataFrame (existence, data types, and checks that return
+        a boolean) are not in the mask, but are in the summary and `is_good`. None if
+        interrogated with `mask=False`, and a `FailureIndex` if interrogated with
+        `mask="compact"`
+    is_good: Optional[nwt.IntoSeries]
         A boolean Series in the same row order as the input DataFrame that indicates
-        whether the row passed all checks or not
+        whether the row passed all checks or not. None if interrogated with
+        `mask=False`
     summary: nwt.IntoDataFrame
         A DataFrame of `id`, `column`, `operation`, `n_failed`, and `pct_failed`
         identified by `id`. Usually, `column` and `operation` are enough, but it is
@@ -182,22 +222,536 @@ class InterrogationResult:
         "__dataframe__") for frame-level checks. `operation` describes the check done to
         the column, e.g. "cast" or "check_length_lt_3". `n_failed` and `pct_failed` are
         the number / percent of rows that fail the `operation` for that `column`.
+        Rows are in the order of the columns of the schema, each followed by its
+        checks in the order they were declared, including checks that take a Series,
+        and then the frame-level checks.
+    samples: list[FailureSample]
+        Up to `n_samples` failing rows of each failing check, in the order of the
+        summary. Checks with a single outcome for the whole DataFrame, e.g. data types
+        or `is_id`, have no failing rows to sample. Empty unless interrogated with
+        `n_samples`
     """
 
     df: nwt.IntoDataFrame
-    mask: nwt.IntoDataFrame
-    is_good: nwt.IntoSeries
+    mask: Optional[nwt.IntoDataFrame | FailureIndex]
+    is_good: Optional[nwt.IntoSeries]
     summary: nwt.IntoDataFrame
+    samples: list[FailureSample] = dataclasses.field(default_factory=list)
 
 
-def _private_interrogate(
-    schema: Schema, df: nwt.IntoDataFrameT
-) -> _PrivateInterrogationResult:
-    nw_df = nw.from_native(df, eager_only=True)
-    df_schema = nw_df.collect_schema()  # type: ignore[attribute]
+class FailureSample(NamedTuple):
+    """A row that failed a check, see `InterrogationResult.samples`.
+
+    Attributes
+    ----------
+    column : str
+        The column the check is attached to, or "__dataframe__" for frame-level checks
+    operation : str
+        The check, as in the summary
+    row : int
+        The position of the row in the DataFrame, starting from 0
+    value : Any
+        The value of `column` in that row, after casting. None for frame-level checks
+        and missing columns
+    """
+
+    column: str
+    operation: str
+    row: int
+    value: Any
+
+
+class FailureIndex:
+    """A compact alternative to the validation mask that only stores, for each check,
+    which rows failed. Failures are stored as an array of row indices, or as a bitmap
+    with one bit per row if that is smaller, i.e. if more than 1 in 32 rows fail
+    (1 in 64 for frames with 2^32 rows or more). Requires NumPy.
+
+    As in the summary, rows where a check evaluates to null count as passing.
+
+    Attributes
+    ----------
+    n_rows : int
+        The number of rows of the interrogated DataFrame
+    """
+
+    def __init__(
+        self,
+        n_rows: int,
+        failures: dict[str, tuple[bool, Any]],
+        native_namespace: Any,
+    ):
+        self.n_rows = n_rows
+        # identifier -> (is_bitmap, row indices or packed bitmap)
+        self._failures = failures
+        self._native_namespace = native_namespace
+
+    @classmethod
+    def _from_mask(cls, mask: nw.DataFrame) -> FailureIndex:
+        import numpy as np
+
+        n_rows = mask.shape[0]
+        index_dtype = np.uint32 if n_rows < 2**32 else np.uint64
+        bitmap_nbytes = -(-n_rows // 8)
+
+        failures = {}
+        for name in mask.columns:
+            failed = mask[name].__invert__().fill_null(False).to_numpy()
+            indices = np.flatnonzero(failed).astype(index_dtype, copy=False)
+
+            if indices.nbytes > bitmap_nbytes:
+                failures[name] = (True, np.packbits(failed))
+            else:
+                failures[name] = (False, indices)
+
+        return cls(n_rows, failures, nw.get_native_namespace(mask))
+
+    @property
+    def columns(self) -> list[str]:
+        """The checks, in the same order as the columns of the mask.
+
+        Returns
+        -------
+        list[str]
+        """
+        return list(self._failures.keys())
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used to store the failures.
+
+        Returns
+        -------
+        int
+        """
+        return sum(arr.nbytes for _, arr in self._failures.values())
+
+    def n_failed(self, column: str) -> int:
+        """The number of rows that failed the given check.
+
+        Parameters
+        ----------
+        column : str
+            The check, as in the columns of the mask
+
+        Returns
+        -------
+        int
+        """
+        is_bitmap, arr = self._failures[column]
+        if is_bitmap:
+            import numpy as np
+
+            return int(np.unpackbits(arr, count=self.n_rows).sum())
+
+        return len(arr)
+
+    def failing_rows(self, column: str) -> Any:
+        """The sorted indices of the rows that failed the given check, as a NumPy
+        array. If the failures are stored as row indices, the array is returned
+        without copying, so it must not be modified.
+
+        Parameters
+        ----------
+        column : str
+            The check, as in the columns of the mask
+
+        Returns
+        -------
+        np.ndarray
+        """
+        is_bitmap, arr = self._failures[column]
+        if is_bitmap:
+            import numpy as np
+
+            return np.flatnonzero(np.unpackbits(arr, count=self.n_rows)).astype(
+                np.uint32 if self.n_rows < 2**32 else np.uint64, copy=False
+            )
+
+        return arr
+
+    def to_arrow(self, column: str) -> Any:
+        """The sorted indices of the rows that failed the given check, as a pyarrow
+        Array. The Array shares its memory with `failing_rows`.
+
+        Parameters
+        ----------
+        column : str
+            The check, as in the columns of the mask
+
+        Returns
+        -------
+        pa.Array
+        """
+        import pyarrow as pa
+
+        return pa.array(self.failing_rows(column))
+
+    def to_mask(self) -> nwt.IntoDataFrame:
+        """Expands the failures into the dense validation mask, a boolean DataFrame of
+        the same type as the interrogated DataFrame with one column per check.
+
+        Returns
+        -------
+        nwt.IntoDataFrame
+        """
+        import numpy as np
+
+        data = {}
+        for column in self._failures:
+            passed = np.ones(self.n_rows, dtype=bool)
+            passed[self.failing_rows(column)] = False
+            data[column] = passed
+
+        return nw.from_dict(data, native_namespace=self._native_namespace).to_native()
+
+
+_IS_GOOD_COL = "__checkedframe_is_good__"
+
+
+def _collect(lf: nw.LazyFrame, engine: Optional[str] = None) -> nw.DataFrame:
+    if engine is None:
+        return lf.collect()
+
+    return lf.collect(engine=engine)
+
+
+def _collect_projection(
+    lf: nw.LazyFrame, plan: _ValidationPlan, engine: Optional[str] = None
+) -> tuple[nw.DataFrame, list[str]]:
+    """Collects only the columns that validation reads, so that columns that are
+    neither in the schema nor read by a check are never loaded. Returns the collected
+    frame and the names of the columns that were left out."""
+    names = lf.collect_schema().names()
+    if plan.projection is None or len(plan.projection) == len(names):
+        return _collect(lf, engine), []
+
+    return (
+        _collect(lf.select(plan.projection), engine),
+        [name for name in names if name not in plan.projection],
+    )
+
+
+def _with_unread_columns(
+    lf: nw.LazyFrame, original: nw.LazyFrame, unread: list[str]
+) -> nw.LazyFrame:
+    """Adds the columns left out by `_collect_projection` back to `lf`, in their
+    original position. They are joined by row lazily, so they are only read if the
+    output is collected."""
+    if len(unread) == 0:
+        return lf
+
+    names = original.collect_schema().names()
+    added = [name for name in lf.collect_schema().names() if name not in names]
+
+    return (
+        lf.with_row_index(_ROW_INDEX_COL)
+        .join(
+            original.select(unread).with_row_index(_ROW_INDEX_COL),
+            on=_ROW_INDEX_COL,
+            how="left",
+        )
+        .sort(_ROW_INDEX_COL)
+        .select(*names, *added)
+    )
+
+
+def _evaluate_results(
+    nw_df: nw.DataFrame, results: list[_ResultWrapper]
+) -> nw.DataFrame:
+    """Evaluates the results of eager checks into a boolean DataFrame with one column
+    per result, named by its identifier. Scalar results are skipped."""
+    native_exprs = []
+    native_identifiers = []
+    exprs = []
+    series_store = []
+    for result in results:
+        if result.is_scalar:
+            continue
+
+        if result.is_expr:
+            if result.native:
+                native_exprs.append(result.res.alias(result.identifier))
+                native_identifiers.append(result.identifier)
+            else:
+                exprs.append(result)
+        else:
+            series_store.append(result.res.alias(result.identifier))
+
+    lf = nw_df.lazy()
+    if len(native_exprs) > 0:
+        # Native expressions are added to the native LazyFrame first, so that they are
+        # selected in the same query as the narwhals expressions and the data is only
+        # scanned once
+        lf = nw.from_native(lf.to_native().with_columns(*native_exprs))
+
+    temp_index_col = "__checkedframe_temporary_index_sdlfjksnwoiedflkj__"
+    check_lf = (
+        lf.with_row_index(temp_index_col)
+        .select(temp_index_col, *_batched_exprs(exprs), *native_identifiers)
+        .drop(temp_index_col)
+    )
+    if any(r.batch is not None for r in exprs):
+        # Batching groups the columns by check, so restore the order of the results
+        check_lf = check_lf.select(*(r.identifier for r in exprs), *native_identifiers)
 
-    results: list[_ResultWrapper] = []
-    for expected_name, expected_col in schema.expected_schema.items():
+    check_df = check_lf.collect()
+
+    if len(series_store) > 0:
+        check_df = check_df.with_columns(*series_store)
+
+    return check_df
+
+
+def _cast_identifier(column: str) -> str:
+    return f"__checkedframe_{column}_cast__"
+
+
+@dataclasses.dataclass
+class _CheckStep:
+    check: Check
+    check_name: str
+    series_name: Optional[str]
+    identifier: str
+    # Checks that take a column name or no input don't need the data, so their result is
+    # built once when the plan is compiled
+    result: Optional[_ResultWrapper] = None
+    # Whether the check has to wait until the fused casts have been applied
+    deferred: bool = False
+
+
+@dataclasses.dataclass
+class _ColumnPlan:
+    name: str
+    # Results that are known without looking at the data, e.g. existence and dtypes
+    results: list[_ResultWrapper]
+    checks: list[_CheckStep] = dataclasses.field(default_factory=list)
+    actual_cf_type: Optional[TypedColumn] = None
+    # The column to cast to if the column has to be cast eagerly
+    cast_to: Optional[TypedColumn] = None
+    fused_cast: Optional[_CastExpr] = None
+    # Set if the member of a union can only be resolved by trying to cast the data. The
+    # checks of every member are compiled up front, in the order of the members
+    union: Optional[CfUnion] = None
+    union_checks: list[list[_CheckStep]] = dataclasses.field(default_factory=list)
+    # Templates for results that are only known once the data has been cast
+    cast_result: Optional[_ResultWrapper] = None
+    dtype_result: Optional[_ResultWrapper] = None
+
+
+@dataclasses.dataclass
+class _ValidationPlan:
+    """Everything about validating a frame that only depends on the schema of the frame,
+    not on its data."""
+
+    columns: list[_ColumnPlan]
+    frame_checks: list[_CheckStep]
+    fused_casts: dict[str, _CastExpr]
+    # Missing columns and data types that can't be cast, which fail regardless of data
+    static_failures: list[_ResultWrapper]
+    # Whether some cast or check operates on a Series / DataFrame instead of an
+    # expression, i.e. needs the data in memory
+    requires_eager: bool
+    # The columns of the frame that validation reads, in the order of the frame, or None
+    # if some check may read any column
+    projection: Optional[list[str]] = None
+
+
+def _named_check(check: Check, name: str) -> Check:
+    check.name = name
+
+    return check
+
+
+# The built-in checks are shared by every column. A Check is never modified once
+# compiled, so this saves building three new Check objects per column.
+_NOT_NULL_CHECK = _named_check(Check.is_not_null(), "`nullable=False`")
+_NOT_NAN_CHECK = _named_check(Check.is_not_nan(), "`allow_nan=False`")
+_NOT_INF_CHECK = _named_check(Check.is_not_inf(), "`allow_inf=False`")
+
+
+class _CompiledColumn(NamedTuple):
+    """The parts of a column of a schema that validation needs, resolved once."""
+
+    name: str
+    column: TypedColumn | CfUnion
+    required: bool
+    # The Narwhals data type to compare against, None for unions
+    dtype: Optional[Any]
+    builtin_checks: tuple[Check, ...]
+    # The user checks along with their resolved names
+    checks: tuple[tuple[str, Check], ...]
+    # The compiled members of a union, in order
+    members: tuple[_CompiledColumn, ...] = ()
+
+
+class _CompiledSchema(NamedTuple):
+    """An immutable version of a `Schema` that every entry point reuses, built when the
+    schema is parsed and rebuilt if it is modified."""
+
+    columns: tuple[_CompiledColumn, ...]
+    checks: tuple[tuple[str, Check], ...]
+
+
+def _compile_column(name: str, col: TypedColumn | CfUnion) -> _CompiledColumn:
+    if isinstance(col, CfUnion):
+        return _CompiledColumn(
+            name=name,
+            column=col,
+            required=col.required,
+            dtype=None,
+            builtin_checks=(),
+            checks=(),
+            members=tuple(_compile_column(name, c) for c in col.columns),
+        )
+
+    builtin_checks = []
+    if not col.nullable:
+        builtin_checks.append(_NOT_NULL_CHECK)
+
+    if hasattr(col, "allow_nan") and not col.allow_nan:
+        builtin_checks.append(_NOT_NAN_CHECK)
+
+    if hasattr(col, "allow_inf") and not col.allow_inf:
+        builtin_checks.append(_NOT_INF_CHECK)
+
+    return _CompiledColumn(
+        name=name,
+        column=col,
+        required=col.required,
+        dtype=col.to_narwhals(),
+        builtin_checks=tuple(builtin_checks),
+        checks=tuple(
+            (f"check_{i}" if check.name is None else check.name, check)
+            for i, check in enumerate(col.checks)
+        ),
+    )
+
+
+def _compile_schema(
+    expected_schema: Mapping[str, TypedColumn | CfUnion], checks: Iterable[Check]
+) -> _CompiledSchema:
+    return _CompiledSchema(
+        columns=tuple(
+            _compile_column(name, col) for name, col in expected_schema.items()
+        ),
+        checks=tuple(
+            (f"frame_check_{i}" if check.name is None else check.name, check)
+            for i, check in enumerate(checks)
+        ),
+    )
+
+
+def _column_state(col: TypedColumn | CfUnion) -> tuple:
+    # Copies of the containers, since they would otherwise be modified along with the
+    # column
+    state = tuple(
+        tuple(v) if isinstance(v, list) else dict(v) if isinstance(v, dict) else v
+        for v in vars(col).values()
+    )
+    if isinstance(col, CfUnion):
+        return (state, tuple(_column_state(c) for c in col.columns))
+
+    return state
+
+
+def _fingerprint(
+    expected_schema: Mapping[str, TypedColumn | CfUnion], checks: list[Check]
+) -> tuple:
+    """A snapshot of the contents of a schema, so that modifying a schema in place can be
+    detected by comparing it to a previous snapshot. Columns and checks are compared by
+    identity, and the attributes of columns by value."""
+    return (
+        tuple((name, col, _column_state(col)) for name, col in expected_schema.items()),
+        tuple(checks),
+    )
+
+
+def _compile_check(
+    check: Check,
+    check_name: str,
+    series_name: Optional[str] = None,
+    fuse_casts: bool = False,
+    is_fused: bool = False,
+) -> _CheckStep:
+    step = _CheckStep(
+        check=check,
+        check_name=check_name,
+        series_name=series_name,
+        identifier=_check_identifier(check_name, series_name),
+        deferred=fuse_casts
+        and (
+            check.input_type == "Frame" or (check.input_type == "Series" and is_fused)
+        ),
+    )
+
+    if check.input_type in ("str", None):
+        step.result = _run_check(check, check_name, None, series_name)  # type: ignore[arg-type]
+
+    return step
+
+
+def _compile_column_checks(
+    expected_col: _CompiledColumn,
+    series_name: str,
+    fuse_casts: bool = False,
+    is_fused: bool = False,
+) -> list[_CheckStep]:
+    # nullable / nanable checks
+    steps = []
+    for check in expected_col.builtin_checks:
+        assert check.name is not None
+
+        step = _compile_check(check, check.name, series_name, fuse_casts, is_fused)
+        assert step.result is not None
+        step.result.batch = check.func
+        steps.append(step)
+
+    # user checks
+    for check_name, check in expected_col.checks:
+        steps.append(
+            _compile_check(check, check_name, series_name, fuse_casts, is_fused)
+        )
+
+    return steps
+
+
+def _projection(
+    compiled: _CompiledSchema, df_schema: Mapping[str, Any]
+) -> Optional[list[str]]:
+    """The columns of the schema that are in the frame, plus the columns the checks
+    read, or None if a check may read any column."""
+    needed = {col.name for col in compiled.columns}
+
+    checks = [check for _, check in compiled.checks]
+    for col in compiled.columns:
+        for c in (col, *col.members):
+            checks.extend(check for _, check in c.checks)
+
+    for check in checks:
+        dependencies = _check_dependencies(check)
+        if dependencies is None:
+            return None
+
+        needed.update(dependencies)
+
+    return [name for name in df_schema if name in needed]
+
+
+def _compile_plan(
+    schema: Schema, df_schema: Mapping[str, Any], fuse_casts: bool = False
+) -> _ValidationPlan:
+    columns: list[_ColumnPlan] = []
+    # With `fuse_casts`, casts are expressions that are evaluated in the same query as
+    # the checks. Since no data has been cast yet when the checks are planned, checks
+    # that need the cast data itself (Series / Frame inputs) are deferred until after
+    # the query, and the checks attached to a column are dropped if its cast fails.
+    fused_casts: dict[str, _CastExpr] = {}
+    static_failures: list[_ResultWrapper] = []
+
+    compiled = schema._compiled
+    for expected_col in compiled.columns:
+        expected_name = expected_col.name
         # Check existence. There are three possible states:
         # 1. The column exists
         # 2. The column exists but is not required
@@ -206,275 +760,1544 @@ def _private_interrogate(
         # If the column exists but is not required, the check shouldn't error, but we
         # can't perform any of the next steps like casting or checks, so we have to skip
         # them.
-        check_name = f"__checkedframe_{expected_name}_existence__"
         existence_message = ""
         if expected_name in df_schema:
             actually_exists = True
-            existence_check = nw.lit(True)
+            existence_check = True
         else:
             actually_exists = False
             if expected_col.required:
-                existence_check = nw.lit(False)
+                existence_check = False
                 existence_message = "Column marked as required but not found"
             else:
-                existence_check = nw.lit(True)
-
-        results.append(
-            _ResultWrapper(
-                existence_check,
-                msg=existence_message,
-                identifier=check_name,
-                column=expected_name,
-                operation="existence",
-                native=False,
-                is_expr=True,
-            )
+                existence_check = True
+
+        column_plan = _ColumnPlan(
+            name=expected_name,
+            results=[
+                _ResultWrapper(
+                    existence_check,
+                    msg=existence_message,
+                    identifier=f"__checkedframe_{expected_name}_existence__",
+                    column=expected_name,
+                    operation="existence",
+                    native=False,
+                    is_scalar=True,
+                )
+            ],
         )
+        columns.append(column_plan)
 
         if not actually_exists:
+            if expected_col.required:
+                static_failures.append(column_plan.results[-1])
+
             continue
 
         # check data types
         actual_dtype = df_schema[expected_name]
         actual_cf_type = _nw_type_to_cf_type(actual_dtype)
+        column_plan.actual_cf_type = actual_cf_type
+
+        dtype_identifier = f"__checkedframe_{expected_name}_dtype__"
+        cast_identifier = _cast_identifier(expected_name)
+        column_plan.cast_result = _ResultWrapper(
+            None,
+            msg="",
+            identifier=cast_identifier,
+            column=expected_name,
+            operation="cast",
+            native=False,
+        )
 
-        if isinstance(expected_col, CfUnion):
-            try:
-                expected_col, s_cast = expected_col._resolve(
-                    nw_df[expected_name], actual_cf_type
-                )
-
-                if s_cast is not None:
-                    nw_df = nw_df.with_columns(s_cast)
-                else:  # this means no casting is needed but we passed sucessfully
-                    pass
-            except CastError as e:
-                identifier = f"__checkedframe_{expected_name}_cast__"
-
-                results.append(
+        if isinstance(expected_col.column, CfUnion):
+            union = expected_col.column
+            # Mirrors `CfUnion._resolve`: the first member that matches exactly or can
+            # be cast wins, so the data is only needed if a cast is tried first
+            resolved = None
+            for c in expected_col.members:
+                if c.column == actual_cf_type or c.column.cast:
+                    resolved = c
+                    break
+
+            if resolved is None:
+                column_plan.results.append(
                     _ResultWrapper(
-                        e.element_passes,
-                        msg=e.msg,
-                        identifier=identifier,
+                        False,
+                        msg=f"Expected one of {union.columns}, got {actual_dtype}",
+                        identifier=dtype_identifier,
                         column=expected_name,
-                        operation="cast",
+                        operation="dtype",
                         native=False,
-                        is_expr=isinstance(e.element_passes, nw.Expr),
+                        is_scalar=True,
                     )
                 )
+                static_failures.append(column_plan.results[-1])
                 continue
-            except TypeError:
-                identifier = f"__checkedframe_{expected_name}_dtype__"
-                results.append(
-                    _ResultWrapper(
-                        nw.lit(False),
-                        msg=f"Expected one of {expected_col.columns}, got {actual_dtype}",
-                        identifier=identifier,
-                        column=expected_name,
-                        operation="dtype",
-                        native=False,
-                        is_expr=False,
-                    )
+
+            if union.per_row:
+                # Every member is tried for every row, so the checks of the members
+                # can't be fused with the casts
+                column_plan.union = union
+                column_plan.union_checks = [
+                    _compile_column_checks(c, expected_name)
+                    for c in expected_col.members
+                ]
+                column_plan.dtype_result = _ResultWrapper(
+                    None,
+                    msg=(
+                        f"Expected one of {union.columns} for every row; {{summary}} "
+                        "rows match none of them"
+                    ),
+                    identifier=dtype_identifier,
+                    column=expected_name,
+                    operation="dtype",
+                    native=False,
                 )
                 continue
 
-        if actual_dtype == expected_col.to_narwhals():
-            pass
-        else:
-            if expected_col.cast:
-                try:
-                    nw_df = nw_df.with_columns(
-                        actual_cf_type._safe_cast(nw_df[expected_name], expected_col)
+            if resolved.column != actual_cf_type:
+                column_plan.union = union
+                column_plan.union_checks = [
+                    _compile_column_checks(c, expected_name, fuse_casts)
+                    for c in expected_col.members
+                ]
+                column_plan.dtype_result = _ResultWrapper(
+                    False,
+                    msg=f"Expected one of {union.columns}, got {actual_dtype}",
+                    identifier=dtype_identifier,
+                    column=expected_name,
+                    operation="dtype",
+                    native=False,
+                    is_scalar=True,
+                )
+                continue
+
+            expected_col = resolved
+
+        if actual_dtype != expected_col.dtype:
+            if expected_col.column.cast:
+                cast_expr = None
+                # Coerced casts keep the checks of the column, so they are cast eagerly
+                if fuse_casts and expected_col.column.cast != "coerce":
+                    cast_expr = actual_cf_type._safe_cast_expr(
+                        expected_name, actual_dtype, expected_col.column
                     )
-                except CastError as e:
-                    identifier = f"__checkedframe_{expected_name}_cast__"
 
-                    results.append(
+                if cast_expr is not None:
+                    fused_casts[expected_name] = cast_expr
+                    column_plan.fused_cast = cast_expr
+                    column_plan.results.append(
                         _ResultWrapper(
-                            e.element_passes,
-                            msg=e.msg,
-                            identifier=identifier,
+                            nw.col(cast_identifier),
+                            msg=cast_expr.msg,
+                            identifier=cast_identifier,
                             column=expected_name,
                             operation="cast",
                             native=False,
-                            is_expr=isinstance(e.element_passes, nw.Expr),
+                            is_expr=True,
                         )
                     )
-                    continue
+                else:
+                    column_plan.cast_to = expected_col.column
             else:
-                identifier = f"__checkedframe_{expected_name}_dtype__"
-                results.append(
+                column_plan.results.append(
                     _ResultWrapper(
-                        nw.lit(False),
-                        msg=f"Expected {expected_col}, got {actual_dtype}",
-                        identifier=identifier,
+                        False,
+                        msg=f"Expected {expected_col.column}, got {actual_dtype}",
+                        identifier=dtype_identifier,
                         column=expected_name,
                         operation="dtype",
                         native=False,
-                        is_expr=False,
+                        is_scalar=True,
                     )
                 )
+                static_failures.append(column_plan.results[-1])
                 continue
 
-        # nullable / nanable checks
-        builtin_checks = []
+        column_plan.checks = _compile_column_checks(
+            expected_col,
+            expected_name,
+            fuse_casts,
+            is_fused=column_plan.fused_cast is not None,
+        )
+
+    frame_checks = [
+        _compile_check(check, check_name, fuse_casts=fuse_casts)
+        for check_name, check in compiled.checks
+    ]
+
+    # The identifier is constructed as the column and the check name, but it is possible
+    # that two of the "same" check are attached to the same column, e.g. cf.Check.lt(7)
+    # and cf.Check.lt("other"). Every result that could be produced is renamed here, so
+    # identifiers are unique no matter which casts succeed.
+    candidates: list[_ResultWrapper | _CheckStep] = []
+    for column_plan in columns:
+        candidates.extend(column_plan.results)
+        if column_plan.cast_to is not None or column_plan.union is not None:
+            candidates.append(column_plan.cast_result)  # type: ignore[arg-type]
+        if column_plan.union is not None:
+            candidates.append(column_plan.dtype_result)  # type: ignore[arg-type]
+            for steps in column_plan.union_checks:
+                candidates.extend(steps)
+        candidates.extend(column_plan.checks)
+    candidates.extend(frame_checks)
+
+    seen = set()
+    i = 0
+    for candidate in candidates:
+        if candidate.identifier in seen:
+            candidate.identifier = f"{candidate.identifier}_{i}"
+            i += 1
+
+        seen.add(candidate.identifier)
+
+        if isinstance(candidate, _CheckStep) and candidate.result is not None:
+            candidate.result.identifier = candidate.identifier
+
+    all_steps = [
+        step
+        for column_plan in columns
+        for steps in (column_plan.checks, *column_plan.union_checks)
+        for step in steps
+    ] + frame_checks
+
+    return _ValidationPlan(
+        columns=columns,
+        frame_checks=frame_checks,
+        fused_casts=fused_casts,
+        static_failures=static_failures,
+        requires_eager=any(
+            c.cast_to is not None or c.union is not None for c in columns
+        )
+        or any(step.result is None for step in all_steps),
+        projection=_projection(compiled, df_schema),
+    )
+
+
+class PlanCacheInfo(NamedTuple):
+    """Statistics of the validation plan cache, see `plan_cache_info`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class _PlanCache:
+    """A bounded LRU cache of validation plans, keyed by the compiled schema and the
+    column names and data types of the frame being validated."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._plans: OrderedDict[Any, _ValidationPlan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(
+        self, schema: Schema, df_schema: Mapping[str, Any], fuse_casts: bool = False
+    ) -> _ValidationPlan:
+        # The compiled schema is rebuilt if the schema is modified, so keying on it
+        # instead of the schema itself never returns the plan of an outdated schema
+        key = (schema._compiled, tuple(df_schema.items()), fuse_casts)
+
+        try:
+            with self._lock:
+                plan = self._plans.get(key)
+                if plan is not None:
+                    self._plans.move_to_end(key)
+                    self.hits += 1
+
+                    return plan
+
+                self.misses += 1
+        except TypeError:  # a data type that can't be hashed
+            return _compile_plan(schema, df_schema, fuse_casts=fuse_casts)
+
+        plan = _compile_plan(schema, df_schema, fuse_casts=fuse_casts)
+
+        with self._lock:
+            if self.maxsize > 0:
+                self._plans[key] = plan
+                while len(self._plans) > self.maxsize:
+                    self._plans.popitem(last=False)
+
+        return plan
+
+    def info(self) -> PlanCacheInfo:
+        with self._lock:
+            return PlanCacheInfo(self.hits, self.misses, self.maxsize, len(self._plans))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._plans.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._plans) > max(maxsize, 0):
+                self._plans.popitem(last=False)
+
+
+_PLAN_CACHE = _PlanCache()
+
+
+def plan_cache_info() -> PlanCacheInfo:
+    """Returns the hits, misses, maximum size, and current size of the validation plan
+    cache.
+
+    Validating a frame is split into planning, i.e. resolving data types, casts, and
+    checks, and executing the plan. Planning only depends on the schema and on the
+    column names and data types of the frame, so plans are cached and repeated calls
+    with frames of the same shape only pay for execution.
+
+    Returns
+    -------
+    PlanCacheInfo
+
+    Examples
+    --------
+    .. code-block:: python
 
-        if not expected_col.nullable:
-            check = Check.is_not_null()
-            check.name = "`nullable=False`"
-            builtin_checks.append(check)
+        import checkedframe as cf
+        import polars as pl
 
-        if hasattr(expected_col, "allow_nan") and not expected_col.allow_nan:
-            check = Check.is_not_nan()
-            check.name = "`allow_nan=False`"
-            builtin_checks.append(check)
 
-        if hasattr(expected_col, "allow_inf") and not expected_col.allow_inf:
-            check = Check.is_not_inf()
-            check.name = "`allow_inf=False`"
-            builtin_checks.append(check)
+        class S(cf.Schema):
+            x = cf.Int64()
 
-        for check in builtin_checks:
-            assert check.name is not None
 
+        cf.clear_plan_cache()
+
+        for _ in range(3):
+            S.validate(pl.DataFrame({"x": [1, 2, 3]}))
+
+        cf.plan_cache_info()
+
+    .. code-block:: text
+
+        PlanCacheInfo(hits=2, misses=1, maxsize=128, currsize=1)
+    """
+    return _PLAN_CACHE.info()
+
+
+def clear_plan_cache() -> None:
+    """Removes every cached validation plan and resets the hit / miss counters.
+
+    Plans are keyed by the contents of the schema, so a schema that is modified in
+    place, e.g. by adding a check to one of its columns, gets a new plan on its next
+    validation without clearing the cache. Class-based schemas are parsed on first use,
+    so modifying their class attributes afterwards has no effect."""
+    _PLAN_CACHE.clear()
+
+
+def set_plan_cache_maxsize(maxsize: int) -> None:
+    """Sets the maximum number of cached validation plans, evicting the least recently
+    used plans if the cache is too large. A size of 0 disables caching.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of plans to keep, by default 128
+    """
+    _PLAN_CACHE.resize(maxsize)
+
+
+def _run_checks(
+    nw_df: nw.DataFrame, steps: list[_CheckStep], n_threads: Optional[int] = None
+) -> list[_ResultWrapper]:
+    """Runs checks that take a Series or DataFrame, in order. With `n_threads`, the
+    checks are run concurrently on a thread pool; Polars, pyarrow, and NumPy release
+    the GIL in their kernels, so this can use multiple cores."""
+
+    def _run(step: _CheckStep) -> _ResultWrapper:
+        result = _run_check(step.check, step.check_name, nw_df, step.series_name)
+        result.identifier = step.identifier
+
+        return result
+
+    if n_threads is None or n_threads <= 1 or len(steps) <= 1:
+        return [_run(step) for step in steps]
+
+    with ThreadPoolExecutor(max_workers=n_threads) as pool:
+        # `map` returns results in the order of the inputs
+        return list(pool.map(_run, steps))
+
+
+def _member_row_matches(
+    nw_df: nw.DataFrame,
+    name: str,
+    actual_cf_type: TypedColumn,
+    member: TypedColumn,
+    steps: list[_CheckStep],
+) -> Optional[nw.Series]:
+    """Whether each row of `nw_df` matches a member of a union, i.e. can be cast to it
+    and passes its checks. Checks are run on the rows that can be cast. Returns None if
+    no row can be cast."""
+    if member == actual_cf_type:
+        can_cast = None
+    elif not member.cast:
+        return None
+    else:
+        try:
+            _, error = actual_cf_type._coerce_cast(nw_df[name], member)
+            can_cast = None if error is None else error.element_passes
+        except CastError as e:
+            can_cast = e.element_passes
+
+        if isinstance(can_cast, bool):
+            return None
+
+    indexed = nw_df.with_row_index(_ROW_INDEX_COL)
+    if can_cast is not None:
+        indexed = nw.maybe_reset_index(indexed.filter(can_cast))
+
+    try:
+        indexed = indexed.with_columns(actual_cf_type._safe_cast(indexed[name], member))
+    except CastError:
+        return None
+
+    results = []
+    for step in steps:
+        if step.result is not None:
+            result = dataclasses.replace(step.result)
+        else:
+            result = _run_check(step.check, step.check_name, indexed, step.series_name)
+            result.identifier = step.identifier
+
+        if result.is_scalar:
+            if not result.res:
+                return None
+            continue
+
+        results.append(result)
+
+    matches = indexed.select(_ROW_INDEX_COL)
+    if len(results) > 0:
+        # Nulls pass, see `_failure_count`
+        passes = _evaluate_results(indexed, results).select(
+            nw.all_horizontal(
+                *(nw.col(r.identifier).fill_null(True) for r in results)
+            ).alias(name)
+        )
+        matches = matches.with_columns(passes[name])
+    else:
+        matches = matches.with_columns(nw.lit(True).alias(name))
+
+    return (
+        nw_df.with_row_index(_ROW_INDEX_COL)
+        .select(_ROW_INDEX_COL)
+        .join(matches, on=_ROW_INDEX_COL, how="left")
+        .sort(_ROW_INDEX_COL)[name]
+        .fill_null(False)
+    )
+
+
+def _union_row_matches(nw_df: nw.DataFrame, column_plan: _ColumnPlan) -> nw.Series:
+    """Whether each row matches any member of a `per_row` union."""
+    name = column_plan.name
+    matches = None
+    for member, steps in zip(column_plan.union.columns, column_plan.union_checks):
+        member_matches = _member_row_matches(
+            nw_df, name, column_plan.actual_cf_type, member, steps
+        )
+        if member_matches is None:
+            continue
+
+        matches = member_matches if matches is None else matches.__or__(member_matches)
+
+    if matches is None:
+        return nw_df.select(nw.lit(False).alias(name))[name]
+
+    return matches
+
+
+def _execute_plan(
+    plan: _ValidationPlan, nw_df: nw.DataFrame, defer_eager_checks: bool = False
+) -> tuple[
+    list[Optional[_ResultWrapper]],
+    nw.DataFrame,
+    dict[str, range],
+    list[tuple[int, _CheckStep]],
+]:
+    """Runs the data dependent parts of a plan, i.e. eager casts and Series / Frame
+    checks, and returns the results in order alongside the cast frame.
+
+    Deferred checks are returned as (index, step) pairs with a placeholder result at
+    that index. With `defer_eager_checks`, every Series / Frame check is deferred.
+    """
+    results: list[Optional[_ResultWrapper]] = []
+    fused_check_indices: dict[str, range] = {}
+    deferred: list[tuple[int, _CheckStep]] = []
+
+    def _add_check(step: _CheckStep):
+        if step.deferred or (defer_eager_checks and step.result is None):
+            deferred.append((len(results), step))
+            results.append(
+                _ResultWrapper(
+                    None,
+                    msg="",
+                    identifier=step.identifier,
+                    column=(
+                        "__dataframe__"
+                        if step.series_name is None
+                        else step.series_name
+                    ),
+                    operation=step.check_name,
+                )
+            )
+        elif step.result is not None:
+            results.append(dataclasses.replace(step.result))
+        else:
+            result = _run_check(step.check, step.check_name, nw_df, step.series_name)
+            result.identifier = step.identifier
+            results.append(result)
+
+    # Every column is cast before it is checked, and the casts are applied with a
+    # single `with_columns`, which e.g. for pandas rebuilds the frame once instead of
+    # once per cast column
+    cast_series = []
+    cast_errors: dict[str, CastError] = {}
+    coerced: dict[str, Optional[CastError]] = {}
+    row_matches: dict[str, nw.Series] = {}
+    unresolved: set[str] = set()
+    members: dict[str, TypedColumn] = {}
+    for column_plan in plan.columns:
+        name = column_plan.name
+        s_cast = None
+        try:
+            if column_plan.union is not None and column_plan.union.per_row:
+                row_matches[name] = _union_row_matches(nw_df, column_plan)
+            elif column_plan.union is not None:
+                try:
+                    members[name], s_cast = column_plan.union._resolve(
+                        nw_df[name], column_plan.actual_cf_type
+                    )
+                except TypeError:
+                    unresolved.add(name)
+            elif column_plan.cast_to is not None:
+                if column_plan.cast_to.cast == "coerce":
+                    s_cast, coerced[name] = column_plan.actual_cf_type._coerce_cast(
+                        nw_df[name], column_plan.cast_to
+                    )
+                else:
+                    s_cast = column_plan.actual_cf_type._safe_cast(
+                        nw_df[name], column_plan.cast_to
+                    )
+        except CastError as e:
+            cast_errors[name] = e
+
+        if s_cast is not None:
+            cast_series.append(s_cast)
+
+    if len(cast_series) > 0:
+        nw_df = nw_df.with_columns(*cast_series)
+
+    for column_plan in plan.columns:
+        results.extend(dataclasses.replace(r) for r in column_plan.results)
+
+        name = column_plan.name
+        checks = column_plan.checks
+        if name in unresolved:
+            results.append(dataclasses.replace(column_plan.dtype_result))
+            continue
+        elif name in row_matches:
+            results.append(
+                dataclasses.replace(column_plan.dtype_result, res=row_matches[name])
+            )
+            continue
+        elif name in cast_errors:
+            e = cast_errors[name]
             results.append(
-                _run_check(
-                    check=check,
-                    check_name=check.name,
-                    nw_df=nw_df,
-                    series_name=expected_name,
+                dataclasses.replace(
+                    column_plan.cast_result,
+                    res=e.element_passes,
+                    msg=e.msg,
+                    is_expr=isinstance(e.element_passes, nw.Expr),
+                    is_scalar=isinstance(e.element_passes, bool),
                 )
             )
+            continue
+        elif name in coerced:
+            # Elements that failed to cast are null, and the checks still run on the
+            # rest of the column
+            e = coerced[name]
+            results.append(
+                dataclasses.replace(column_plan.cast_result, res=True, is_scalar=True)
+                if e is None
+                else dataclasses.replace(
+                    column_plan.cast_result, res=e.element_passes, msg=e.msg
+                )
+            )
+        elif name in members:
+            checks = next(
+                steps
+                for c, steps in zip(column_plan.union.columns, column_plan.union_checks)
+                if c is members[name]
+            )
+
+        first_check_index = len(results)
 
-        # user checks
-        for i, check in enumerate(expected_col.checks):
-            check_name = f"check_{i}" if check.name is None else check.name
+        for step in checks:
+            _add_check(step)
 
-            result = _run_check(
-                check,
-                check_name,
-                nw_df,
-                series_name=expected_name,
+        if column_plan.fused_cast is not None:
+            fused_check_indices[column_plan.name] = range(
+                first_check_index, len(results)
             )
 
-            results.append(result)
+    for step in plan.frame_checks:
+        _add_check(step)
+
+    return results, nw_df, fused_check_indices, deferred
+
+
+def _is_row_local(check: Check) -> bool:
+    func = check.func
+    kwargs: dict[str, Any] = {}
+    if isinstance(func, functools.partial):
+        func, kwargs = func.func, func.keywords
+
+    return func in _ROW_LOCAL_CHECKS and not any(
+        isinstance(v, nw.Expr) for v in kwargs.values()
+    )
+
 
-    for i, check in enumerate(schema.checks):
-        check_name = f"frame_check_{i}" if check.name is None else check.name
+def _row_local_steps(plan: _ValidationPlan) -> dict[str, _CheckStep]:
+    """The built-in checks of a plan that can be run on any partition of the rows, by
+    identifier. These are stripped down to what is needed to run them so that they can
+    be sent to other processes."""
+    steps = {}
+    for column_plan in plan.columns:
+        for step in itertools.chain(column_plan.checks, *column_plan.union_checks):
+            if _is_row_local(step.check):
+                check = copy.copy(step.check)
+                # Selectors are only needed to parse the schema
+                check.columns = None
+                steps[step.identifier] = dataclasses.replace(
+                    step, check=check, result=None
+                )
+
+    return steps
 
-        result = _run_check(check, check_name, nw_df)
+
+def _interrogate_partition(
+    df: nwt.IntoDataFrame, steps: list[_CheckStep], mask: bool
+) -> Any:
+    """Runs row-local checks on a partition of the rows in a worker process. Returns the
+    native mask of the partition or, if `mask` is False, the number of failures per
+    check."""
+    nw_df = nw.from_native(df, eager_only=True)
+
+    results = []
+    for step in steps:
+        result = _run_check(step.check, step.check_name, None, step.series_name)  # type: ignore[arg-type]
+        result.identifier = step.identifier
         results.append(result)
 
-    # The identifier is constructed as the column and the check name, but it is possible
-    # that two of the "same" check are attached to the same column, e.g. cf.Check.lt(7)
-    # and cf.Check.lt("other").
-    seen = set()
-    i = 0
+    if mask:
+        return _evaluate_results(nw_df, results).to_native()
+
+    return (
+        nw_df.lazy()
+        .with_row_index(_ROW_INDEX_COL)
+        .select(_failure_count(r.res).alias(r.identifier) for r in results)
+        .collect()
+        .row(0)
+    )
+
+
+def _run_partitioned(
+    nw_df: nw.DataFrame, steps: list[_CheckStep], n_processes: int, mask: bool
+) -> list[Any]:
+    """Splits `nw_df` into `n_processes` contiguous ranges of rows and runs `steps` on
+    each of them in a process pool, see `_interrogate_partition`. The outputs are in
+    the order of the rows."""
+    n_rows = nw_df.shape[0]
+    size = -(-n_rows // n_processes)
+    partitions = [nw_df[i : i + size].to_native() for i in range(0, n_rows, size)]
+
+    # Forked workers inherit the locks of Polars' thread pool in whatever state they are
+    # in and can deadlock on them, so Polars workers are started from a fresh
+    # interpreter. Other backends keep the platform's default, which is cheaper.
+    mp_context = (
+        multiprocessing.get_context("spawn")
+        if nw_df.implementation.is_polars()
+        else None
+    )
+    try:
+        with ProcessPoolExecutor(
+            max_workers=n_processes, mp_context=mp_context
+        ) as pool:
+            return list(
+                pool.map(
+                    _interrogate_partition,
+                    partitions,
+                    itertools.repeat(steps),
+                    itertools.repeat(mask),
+                )
+            )
+    except BrokenProcessPool as e:
+        raise RuntimeError(
+            "A worker process of `n_processes` died. Workers started from a fresh "
+            "interpreter (always for Polars, and by default on Windows and macOS) "
+            "re-import your main module, so calls with `n_processes` in a script have "
+            'to be under an `if __name__ == "__main__":` guard'
+        ) from e
+
+
+def _split_row_local(
+    plan: _ValidationPlan, results: list[_ResultWrapper]
+) -> tuple[list[_CheckStep], list[_ResultWrapper]]:
+    """Splits `results` into the steps of row-local checks, which can be run per
+    partition, and everything else, which has to be run on the whole frame (e.g. casts
+    and checks that take a Series or DataFrame)."""
+    row_local = _row_local_steps(plan)
+
+    local_steps = []
+    rest = []
     for result in results:
-        if result.identifier in seen:
-            result.identifier = f"{result.identifier}_{i}"
-            i += 1
+        if result.is_expr and not result.native and result.identifier in row_local:
+            local_steps.append(row_local[result.identifier])
+        else:
+            rest.append(result)
 
-        seen.add(result.identifier)
+    return local_steps, rest
 
+
+def _private_interrogate(
+    schema: Schema,
+    df: nwt.IntoFrameT,
+    engine: Optional[str] = None,
+    fuse_casts: bool = False,
+    n_threads: Optional[int] = None,
+    mask: bool = True,
+    n_processes: Optional[int] = None,
+) -> _PrivateInterrogationResult:
+    nw_df = nw.from_native(df)
+    plan = _PLAN_CACHE.get(
+        schema,
+        nw_df.collect_schema(),  # type: ignore[attribute]
+        fuse_casts=fuse_casts,
+    )
+
+    is_lazy = isinstance(nw_df, nw.LazyFrame)
+    original = nw_df
+    unread: list[str] = []
+    if is_lazy and plan.requires_eager:
+        # Series / Frame checks and eager casts need the actual data. Collect once up
+        # front and hand back a LazyFrame at the end so the output type is stable.
+        nw_df, unread = _collect_projection(nw_df, plan, engine)
+
+    fused_casts = plan.fused_casts
+    results, nw_df, fused_check_indices, deferred = _execute_plan(
+        plan, nw_df, defer_eager_checks=n_threads is not None
+    )
+
+    if isinstance(nw_df, nw.LazyFrame):
+        return _lazy_interrogate(
+            _with_fused_casts(nw_df, fused_casts),
+            results=results,
+            cast_identifiers=[_cast_identifier(name) for name in fused_casts],
+            mask=mask,
+            cast_dependents=_skip_checks_of_failed_casts(results, fused_check_indices),
+        )
+
+    if len(fused_casts) > 0:
+        try:
+            results, nw_df = _apply_fused_casts(
+                nw_df, results, fused_casts, fused_check_indices
+            )
+        except _cast_errors():
+            # Elements that fail to cast are nulled out, which some backends (e.g.
+            # pandas with NumPy integer dtypes) cannot represent, so fall back to
+            # casting eagerly. Only the casts are evaluated here, so errors from checks
+            # still propagate.
+            return _private_interrogate(
+                schema,
+                df,
+                engine=engine,
+                fuse_casts=False,
+                n_threads=n_threads,
+                mask=mask,
+                n_processes=n_processes,
+            )
+
+    # Skip the checks of columns that failed to cast
+    deferred = [(idx, step) for idx, step in deferred if results[idx] is not None]
+    deferred_results = _run_checks(
+        nw_df, [step for _, step in deferred], n_threads=n_threads
+    )
+    for (idx, _), result in zip(deferred, deferred_results):
+        results[idx] = result
+
+    results = [r for r in results if r is not None]
+
+    local_steps: list[_CheckStep] = []
+    if (
+        n_processes is not None
+        and n_processes > 1
+        and not is_lazy
+        and nw_df.shape[0] > 0
+    ):
+        local_steps, rest = _split_row_local(plan, results)
+
+    if len(local_steps) > 0:
+        outputs = _run_partitioned(nw_df, local_steps, n_processes, mask)  # type: ignore[arg-type]
+
+    if not mask:
+        # Only the number of failures per check is computed, in a single aggregation
+        if len(local_steps) > 0:
+            counts = {
+                step.identifier: sum(n_failed)
+                for step, n_failed in zip(local_steps, zip(*outputs))
+            }
+            summary = _summarize_results(nw_df, results, counts)
+        else:
+            summary = _summarize_results(nw_df, results)
+
+        return _PrivateInterrogationResult(
+            df=_with_unread_columns(nw_df.lazy(), original, unread)
+            if is_lazy
+            else nw_df,
+            mask=None,
+            is_good=None,
+            summary=summary if is_lazy else summary.collect(),
+        )
+
+    if len(local_steps) > 0:
+        check_dfs = [nw.concat([nw.from_native(o, eager_only=True) for o in outputs])]
+        if len(rest) > 0:
+            check_dfs.append(_evaluate_results(nw_df, rest))
+
+        check_df_all = nw.concat(check_dfs, how="horizontal").select(
+            r.identifier for r in results if not r.is_scalar
+        )
+    else:
+        check_df_all = _evaluate_results(nw_df, results)
+
+    scalars_pass = all(r.res for r in results if r.is_scalar)
+    has_columns = len(check_df_all.columns) > 0
+
+    if has_columns:
+        is_good = check_df_all.select(
+            nw.all_horizontal(nw.all(), nw.lit(scalars_pass)).alias("is_good")
+        )["is_good"]
+    else:
+        # Every result is a scalar, so broadcast to the length of the input
+        is_good = (
+            nw_df.lazy()
+            .with_row_index(_ROW_INDEX_COL)
+            .select(
+                nw.col(_ROW_INDEX_COL)
+                .is_null()
+                .__invert__()
+                .__and__(scalars_pass)
+                .alias("is_good")
+            )
+            .collect()["is_good"]
+        )
+
+    # Scalar results are counted from the number of rows, which a frame without columns
+    # doesn't have
+    summary_df = _summarize(
+        check_df_all.lazy() if has_columns else nw_df.lazy(), results
+    ).collect()
+
+    if is_lazy:
+        return _PrivateInterrogationResult(
+            df=_with_unread_columns(nw_df.lazy(), original, unread),
+            mask=check_df_all.lazy(),
+            is_good=is_good.to_frame().lazy(),
+            summary=summary_df.lazy(),
+            annotated=_with_unread_columns(
+                nw_df.with_columns(
+                    *(check_df_all[c] for c in check_df_all.columns),
+                    is_good.alias(_IS_GOOD_COL),
+                ).lazy(),
+                original,
+                unread,
+            ),
+        )
+
+    return _PrivateInterrogationResult(
+        df=nw_df,
+        mask=check_df_all,  # type: ignore
+        is_good=is_good,  # type: ignore
+        summary=summary_df,  # type: ignore
+    )
+
+
+def _with_fused_casts(
+    lf: nw.LazyFrame, fused_casts: dict[str, _CastExpr]
+) -> nw.LazyFrame:
+    """Replaces each column with its cast and adds a boolean column per cast of whether
+    each element could be cast."""
+    if len(fused_casts) == 0:
+        return lf
+
+    return lf.with_columns(
+        *(
+            (nw.lit(True) if c.passes is None else c.passes).alias(
+                _cast_identifier(name)
+            )
+            for name, c in fused_casts.items()
+        ),
+        *(c.cast.alias(name) for name, c in fused_casts.items()),
+    )
+
+
+def _apply_fused_casts(
+    nw_df: nw.DataFrame,
+    results: list[Optional[_ResultWrapper]],
+    fused_casts: dict[str, _CastExpr],
+    fused_check_indices: dict[str, range],
+) -> tuple[list[Optional[_ResultWrapper]], nw.DataFrame]:
+    """Evaluates every cast in one query. Successful casts are applied to `nw_df`; for
+    failed casts, the column is left as is and the checks attached to it are dropped
+    (set to None), which matches what happens when casting eagerly."""
+    cast_df = (
+        _with_fused_casts(nw_df.lazy(), fused_casts)
+        .select(*fused_casts.keys(), *(_cast_identifier(n) for n in fused_casts))
+        .collect()
+    )
+
+    all_pass = cast_df.select(
+        nw.col(_cast_identifier(name)).all() for name in fused_casts
+    ).row(0)
+
+    new_results = list(results)
+    results_by_id = {r.identifier: i for i, r in enumerate(results) if r is not None}
+    cast_values = []
+    for (name, cast_expr), passes in zip(fused_casts.items(), all_pass):
+        cast_idx = results_by_id[_cast_identifier(name)]
+        cast_passes = cast_df[_cast_identifier(name)]
+        expected_dtype = cast_expr.to_dtype
+
+        if cast_df[name].dtype != expected_dtype:
+            # The backend silently didn't cast, see `_checked_cast`
+            cast_passes = False
+            new_results[cast_idx].msg = _unsupported_cast_message(  # type: ignore[union-attr]
+                cast_expr.from_dtype, expected_dtype
+            )
+            passes = False
+
+        if passes:
+            new_results[cast_idx] = None
+            cast_values.append(cast_df[name])
+        else:
+            new_results[cast_idx] = dataclasses.replace(
+                new_results[cast_idx],  # type: ignore[arg-type]
+                res=cast_passes,
+                is_expr=False,
+                is_scalar=isinstance(cast_passes, bool),
+            )
+            for idx in fused_check_indices[name]:
+                new_results[idx] = None
+
+    if len(cast_values) > 0:
+        nw_df = nw_df.with_columns(*cast_values)
+
+    return new_results, nw_df
+
+
+def _with_results(lf: nw.LazyFrame, results: list[_ResultWrapper]) -> nw.LazyFrame:
+    """Appends one boolean column per result, named by its identifier. Scalar results
+    are skipped."""
     native_exprs = []
     exprs = []
-    series_store = []
-    id_col_mapper = {}
-    id_op_mapper = {}
-    id_msg_mapper = {}
     for result in results:
-        id_op_mapper[result.identifier] = result.operation
-        id_col_mapper[result.identifier] = result.column
-        id_msg_mapper[result.identifier] = result.msg
+        if result.is_scalar:
+            continue
+
+        res = result.res.alias(result.identifier)
+        if not result.is_expr:
+            raise ValueError(
+                "Checks that take a column name or no input must return an expression "
+                "or a boolean to be evaluated on a LazyFrame"
+            )
+
+        if result.native:
+            native_exprs.append(res)
+        else:
+            exprs.append(result)
+
+    # Native expressions are appended to the native LazyFrame first so that they are
+    # part of the same query plan as the narwhals expressions
+    if len(native_exprs) > 0:
+        lf = nw.from_native(lf.to_native().with_columns(*native_exprs))
+
+    if len(exprs) > 0:
+        lf = lf.with_columns(*_batched_exprs(exprs))
+
+    return lf
+
+
+def _batched_exprs(
+    results: list[_ResultWrapper],
+    transform: Optional[Callable[[nw.Expr], nw.Expr]] = None,
+) -> list[nw.Expr]:
+    """The expressions of `results`, named by identifier. Built-in checks that are
+    applied to many columns (e.g. `nullable=False`) are evaluated as a single
+    multi-output expression per check instead of one expression per column, which is
+    much cheaper to plan for wide frames. The batched expressions come last.
+
+    `transform` is applied to each expression before it is named, e.g. to aggregate it.
+    """
+    exprs = []
+    # (batch, operation) -> column -> identifier
+    batches: dict[tuple[Callable[..., nw.Expr], str], dict[str, str]] = {}
+    for result in results:
+        if result.batch is None:
+            res = result.res if transform is None else transform(result.res)
+            exprs.append(res.alias(result.identifier))
+        else:
+            batches.setdefault((result.batch, result.operation), {})[result.column] = (
+                result.identifier
+            )
+
+    for (batch, _), identifiers in batches.items():
+        res = batch(*identifiers)
+        if transform is not None:
+            res = transform(res)
+
+        exprs.append(res.name.map(identifiers.__getitem__))
+
+    return exprs
+
+
+_ROW_INDEX_COL = "__checkedframe_row_index__"
+
+
+def _failure_count(res: nw.Expr) -> nw.Expr:
+    """The number of rows for which `res` is False. Checks may return scalars, e.g.
+    `nw.lit(False)`, so `res` is combined with an expression on the row index (which is
+    always True) to count scalars once per row."""
+    return (
+        res.__invert__()
+        .fill_null(False)
+        .__and__(nw.col(_ROW_INDEX_COL).is_null().__invert__())
+        .sum()
+    )
+
+
+_POSITION_COL = "__checkedframe_position__"
+_SCALAR_FAILED_COL = "__checkedframe_scalar_failed__"
+
+
+def _summary_metadata(
+    results: list[_ResultWrapper], native_namespace: Any
+) -> nw.LazyFrame:
+    """A table of everything about `results` that is known without the data, with one
+    row per result in order. Scalar results are counted here, since they fail either
+    none or all of the rows."""
+    return nw.from_dict(
+        {
+            "id": [r.identifier for r in results],
+            "column": [r.column for r in results],
+            "operation": [r.operation for r in results],
+            "message": [r.msg for r in results],
+            _POSITION_COL: list(range(len(results))),
+            _SCALAR_FAILED_COL: [r.is_scalar and not r.res for r in results],
+        },
+        schema={
+            "id": nw.String(),
+            "column": nw.String(),
+            "operation": nw.String(),
+            "message": nw.String(),
+            _POSITION_COL: nw.Int64(),
+            _SCALAR_FAILED_COL: nw.Boolean(),
+        },
+        native_namespace=native_namespace,
+    ).lazy()
+
+
+def _summarize(
+    lf: nw.LazyFrame,
+    results: list[_ResultWrapper],
+    failure_counts: Optional[list[nw.Expr]] = None,
+) -> nw.LazyFrame:
+    """Aggregates `results` into a summary with one row per result. By default, each
+    result that isn't a scalar is expected to be a boolean column of `lf`, named by its
+    identifier.
+
+    The failure counts are computed in a single aggregation and joined to the metadata
+    of the results, so the cost is linear in the number of results.
+    """
+    if failure_counts is None:
+        identifiers = [r.identifier for r in results if not r.is_scalar]
+        failure_counts = (
+            [nw.col(*identifiers).__invert__().sum()] if len(identifiers) > 0 else []
+        )
+
+    native_namespace = nw.get_native_namespace(lf)
+    summary = _summary_metadata(results, native_namespace).join(
+        lf.select(nw.len().alias("n_rows")), how="cross"
+    )
+    scalar_counts = (
+        nw.when(nw.col(_SCALAR_FAILED_COL)).then(nw.col("n_rows")).otherwise(0)
+    )
+
+    if len(failure_counts) > 0:
+        counts = lf.select(*failure_counts)
+        n_failed = nw.col("n_failed").fill_null(scalar_counts)
+        if lf.implementation.is_polars():
+            counts = counts.unpivot(variable_name="id", value_name="n_failed")
+        else:
+            # Other backends are eager, where unpivoting a wide frame is much slower
+            # than reading its only row
+            row = counts.collect()
+            counts = nw.from_dict(
+                {"id": row.columns, "n_failed": list(row.row(0))},
+                native_namespace=native_namespace,
+            ).lazy()
+            # Missing values of the join make pandas counts floats
+            n_failed = n_failed.cast(nw.Int64)
+
+        summary = summary.join(counts, on="id", how="left").with_columns(n_failed)
+    else:
+        summary = summary.with_columns(scalar_counts.alias("n_failed"))
+
+    return (
+        summary.with_columns(
+            nw.col("n_failed").__truediv__(nw.col("n_rows")).alias("pct_failed")
+        )
+        # Joins don't necessarily keep the order of the results
+        .sort(_POSITION_COL)
+        .select(
+            "n_rows", "id", "n_failed", "pct_failed", "column", "operation", "message"
+        )
+    )
+
+
+def _summarize_results(
+    nw_df: nw.DataFrame | nw.LazyFrame,
+    results: list[_ResultWrapper],
+    counts: Optional[dict[str, int]] = None,
+) -> nw.LazyFrame:
+    """Computes the summary of `results` in a single aggregation, without building the
+    mask. Only Series results and native expressions are added as columns first.
+
+    `counts` holds the number of failures of results that were already counted, by
+    identifier, e.g. by `_run_partitioned`.
+    """
+    series = [
+        r.res.alias(r.identifier) for r in results if not r.is_expr and not r.is_scalar
+    ]
+    if len(series) > 0:
+        nw_df = nw_df.with_columns(*series)
+
+    lf = _with_results(
+        nw_df.lazy(), [r for r in results if r.is_expr and r.native]
+    ).with_row_index(_ROW_INDEX_COL)
+
+    failure_counts = []
+    exprs = []
+    for r in results:
+        if counts is not None and r.identifier in counts:
+            failure_counts.append(nw.lit(counts[r.identifier]).alias(r.identifier))
+        elif r.is_scalar:
+            continue
+        elif r.is_expr and not r.native:
+            exprs.append(r)
+        else:
+            failure_counts.append(
+                _failure_count(nw.col(r.identifier)).alias(r.identifier)
+            )
+
+    failure_counts.extend(_batched_exprs(exprs, _failure_count))
+
+    if counts is not None:
+        # Counts must have the same data type to be unpivoted together
+        failure_counts = [count.cast(nw.Int64) for count in failure_counts]
+
+    return _summarize(lf, results, failure_counts)
+
+
+_CAST_ID_COL = "__checkedframe_cast_id__"
+_CAST_FAILED_COL = "__checkedframe_cast_failed__"
+
+
+def _skip_checks_of_failed_casts(
+    results: list[Optional[_ResultWrapper]], fused_check_indices: dict[str, range]
+) -> dict[str, str]:
+    """Makes the checks of fused casts that are evaluated lazily pass every row if any
+    element of their column fails to cast, since eagerly, they aren't run at all. See
+    `_drop_skipped_checks` for their rows of the summary. Returns the identifier of the
+    cast of each check, by identifier of the check."""
+    cast_dependents = {}
+    for name, indices in fused_check_indices.items():
+        cast_passes = nw.col(_cast_identifier(name))
+        for idx in indices:
+            result = results[idx]
+            if result is None or result.res is None:
+                continue
+
+            cast_dependents[result.identifier] = _cast_identifier(name)
+            if not result.native and not result.is_scalar:
+                result.res = cast_passes.all().__invert__().__or__(result.res)
+                result.batch = None
+
+    return cast_dependents
+
+
+def _drop_skipped_checks(
+    summary: nw.LazyFrame, cast_dependents: dict[str, str]
+) -> nw.LazyFrame:
+    """Drops the rows of checks whose column failed to cast from a summary, which
+    matches casting eagerly, where these checks aren't run. `cast_dependents` is the
+    identifier of the cast of each check, by identifier of the check."""
+    if len(cast_dependents) == 0:
+        return summary
+
+    casts = nw.from_dict(
+        {"id": list(cast_dependents), _CAST_ID_COL: list(cast_dependents.values())},
+        schema={"id": nw.String(), _CAST_ID_COL: nw.String()},
+        native_namespace=nw.get_native_namespace(summary),
+    ).lazy()
+    cast_failed = summary.select(
+        nw.col("id").alias(_CAST_ID_COL),
+        nw.col("n_failed").__gt__(0).alias(_CAST_FAILED_COL),
+    )
+
+    return (
+        summary.with_row_index(_POSITION_COL)
+        .join(casts, on="id", how="left")
+        .join(cast_failed, on=_CAST_ID_COL, how="left")
+        .filter(nw.col(_CAST_FAILED_COL).fill_null(False).__invert__())
+        # Joins don't necessarily keep the order of the rows
+        .sort(_POSITION_COL)
+        .drop(_POSITION_COL, _CAST_ID_COL, _CAST_FAILED_COL)
+    )
+
+
+def _lazy_interrogate(
+    lf: nw.LazyFrame,
+    results: list[_ResultWrapper],
+    cast_identifiers: list[str],
+    mask: bool = True,
+    cast_dependents: Optional[dict[str, str]] = None,
+) -> _PrivateInterrogationResult:
+    cast_dependents = {} if cast_dependents is None else cast_dependents
+    if not mask:
+        return _PrivateInterrogationResult(
+            df=lf.drop(cast_identifiers),
+            mask=None,
+            is_good=None,
+            summary=_drop_skipped_checks(
+                _summarize_results(lf, results), cast_dependents
+            ),
+        )
 
-        res = result.res.alias(result.identifier)
-        if result.is_expr:
-            if result.native:
-                native_exprs.append(res)
-            else:
-                exprs.append(res)
-        else:
-            series_store.append(res)
+    identifiers = [r.identifier for r in results if not r.is_scalar]
+    scalars_pass = all(r.res for r in results if r.is_scalar)
 
-    temp_index_col = "__checkedframe_temporary_index_sdlfjksnwoiedflkj__"
-    check_df = (
-        nw_df.lazy()
-        .with_row_index(temp_index_col)
-        .select(temp_index_col, *exprs)
-        .drop(temp_index_col)
-        .collect()
+    annotated = _with_results(lf, results).with_columns(
+        nw.all_horizontal(
+            *(nw.col(i) for i in identifiers), nw.lit(scalars_pass)
+        ).alias(_IS_GOOD_COL)
     )
 
-    if len(native_exprs) > 0:
-        check_df_native = nw.from_native(nw_df.to_native().lazy().select(*native_exprs).collect())  # type: ignore
-        check_df = nw.concat([check_df, check_df_native], how="horizontal")  # type: ignore
+    return _PrivateInterrogationResult(
+        df=lf.drop(cast_identifiers),
+        mask=annotated.select(identifiers),
+        is_good=annotated.select(nw.col(_IS_GOOD_COL).alias("is_good")),
+        summary=_drop_skipped_checks(_summarize(annotated, results), cast_dependents),
+        annotated=annotated,
+    )
 
-    check_df_all = check_df.with_columns(*series_store)
 
-    n_rows = nw_df.shape[0]
+def _failure_samples(
+    res: _PrivateInterrogationResult,
+    n_samples: int,
+    engine: Optional[str] = None,
+) -> dict[str, list[FailureSample]]:
+    """Takes up to `n_samples` failing rows of each failing check from the mask, by
+    identifier. The first `n_samples` failures of every check are kept in a single
+    filter over the mask and the checked columns; the data isn't checked again."""
+    summary = res.summary
+    if isinstance(summary, nw.LazyFrame):
+        summary = _collect(summary, engine)
+
+    failing = (
+        summary.filter(nw.col("n_failed").__gt__(0))
+        .select("id", "column", "operation")
+        .rows()
+    )
+    if n_samples <= 0 or len(failing) == 0:
+        return {}
 
-    is_good = check_df_all.select(nw.all_horizontal(nw.all()).alias("is_good"))[
-        "is_good"
-    ]
+    if res.annotated is not None:
+        frame = res.annotated
+    else:
+        assert isinstance(res.mask, nw.DataFrame)
+        frame = res.df.with_columns(
+            res.mask[i] for i, _, _ in failing if i in res.mask.columns
+        )
 
-    summary_df = (
-        check_df_all.lazy()
-        .select(nw.all().__invert__().sum())
-        .unpivot(variable_name="id", value_name="n_failed")
-        .with_columns(
-            nw.col("n_failed").__truediv__(n_rows).alias("pct_failed"),
-            nw.col("id").replace_strict(id_col_mapper).alias("column"),
-            nw.col("id").replace_strict(id_op_mapper).alias("operation"),
-            nw.col("id").replace_strict(id_msg_mapper).alias("message"),
+    names = frame.collect_schema().names()
+    # Scalar results (e.g. missing columns, data types, or checks that return a
+    # boolean) aren't in the mask. They fail the frame as a whole rather than any
+    # particular row, so they have no rows to sample.
+    failing = [(i, c, op) for i, c, op in failing if i in names]
+    if len(failing) == 0:
+        return {}
+
+    value_columns = list(dict.fromkeys(c for _, c, _ in failing if c in names))
+
+    # As in the summary, null counts as passing
+    failed = [nw.col(i).__invert__().fill_null(False) for i, _, _ in failing]
+    sample = frame.with_row_index(_ROW_INDEX_COL).filter(
+        nw.any_horizontal(
+            *(f.__and__(f.cast(nw.Int64).cum_sum().__le__(n_samples)) for f in failed)
         )
-        .collect()
+    )
+    sample = sample.select(
+        _ROW_INDEX_COL,
+        *value_columns,
+        *(f.alias(i) for f, (i, _, _) in zip(failed, failing)),
+    )
+    if isinstance(sample, nw.LazyFrame):
+        sample = _collect(sample, engine)
+
+    samples = {}
+    for identifier, column, operation in failing:
+        # Rows kept for other checks may fail this check too
+        rows = sample.filter(nw.col(identifier)).head(n_samples)
+        values = (
+            rows[column].to_list()
+            if column in value_columns
+            else [None] * rows.shape[0]
+        )
+        samples[identifier] = [
+            FailureSample(column, operation, row, value)
+            for row, value in zip(rows[_ROW_INDEX_COL].to_list(), values)
+        ]
+
+    return samples
+
+
+# A prime larger than the number of rows of any frame we expect to sample from, see
+# `_sample_rows`
+_SAMPLE_PRIME = 2**31 - 1
+
+
+def _sample_rows(
+    nw_df: nw.DataFrame | nw.LazyFrame,
+    sample: float,
+    seed: Optional[int] = None,
+    engine: Optional[str] = None,
+) -> tuple[nw.DataFrame | nw.LazyFrame, int]:
+    """Returns a uniform random sample of the rows of `nw_df` in their original order,
+    along with the number of rows of `nw_df`. `sample` is either a number of rows or a
+    fraction of the rows; each row is kept with that probability, so the sample has
+    about that many rows. LazyFrames are only scanned to count their rows, the sample
+    itself stays lazy."""
+    if isinstance(sample, float):
+        if not 0 < sample <= 1:
+            raise ValueError(f"`sample` must be a fraction in (0, 1], got {sample}")
+    elif sample <= 0:
+        raise ValueError(f"`sample` must be a positive number of rows, got {sample}")
+
+    if isinstance(nw_df, nw.LazyFrame):
+        n_total = _collect(nw_df.select(nw.len()), engine).item()
+    else:
+        n_total = nw_df.shape[0]
+
+    fraction = sample if isinstance(sample, float) else sample / max(n_total, 1)
+    if fraction >= 1:
+        return nw_df, n_total
+
+    # Rows are kept if a hash of their index is below the fraction. (a * i + b) mod p
+    # with a random `a` and `b` is uniform for every row and independent between any
+    # two rows, so this is a uniform random sample that is computed in a single filter,
+    # without materializing any row indices.
+    rng = random.Random(seed)
+    a, b = rng.randrange(1, _SAMPLE_PRIME), rng.randrange(_SAMPLE_PRIME)
+    index = nw.col(_ROW_INDEX_COL).cast(nw.Int64).__mod__(_SAMPLE_PRIME)
+    sampled = (
+        nw_df.with_row_index(_ROW_INDEX_COL)
+        .filter(
+            index.__mul__(a)
+            .__add__(b)
+            .__mod__(_SAMPLE_PRIME)
+            .__lt__(fraction * _SAMPLE_PRIME)
+        )
+        .drop(_ROW_INDEX_COL)
+    )
+    if isinstance(sampled, nw.DataFrame):
+        # pandas keeps the index of the sampled rows
+        sampled = nw.maybe_reset_index(sampled)
+
+    return sampled, n_total
+
+
+# The quantile of the standard normal distribution for a two-sided 95% interval
+_Z_95 = 1.959963984540054
+
+
+def _with_failure_bounds(
+    summary: nw.DataFrame | nw.LazyFrame, n_total: int
+) -> nw.DataFrame | nw.LazyFrame:
+    """Adds a 95% Wilson score interval of `pct_failed` to the summary of a sample of
+    `n_total` rows. The variance is scaled by the finite population correction, so the
+    interval is exact if every row was sampled. Existence and data types don't depend on
+    the rows, so they are always exact. A sample without rows says nothing about the
+    frame, so its `pct_failed` is null and its interval is [0, 1]."""
+    n = nw.col("n_rows")
+    p = nw.col("pct_failed")
+    # z^2 over the effective sample size, n * (N - 1) / (N - n)
+    q = (
+        nw.when(
+            nw.col("operation").is_in(["existence", "dtype"]).__or__(n.__ge__(n_total))
+        )
+        .then(0.0)
+        .otherwise(
+            nw.lit(n_total)
+            .__sub__(n)
+            .__mul__(_Z_95**2)
+            .__truediv__(n.__mul__(max(n_total - 1, 1)))
+        )
+    )
+    center = p.__add__(q.__truediv__(2)).__truediv__(q.__add__(1))
+    half_width = (
+        q.__mul__(p)
+        .__mul__(p.__rsub__(1))
+        .__add__(q.__pow__(2).__truediv__(4))
+        .__pow__(0.5)
+        .__truediv__(q.__add__(1))
     )
 
-    return _PrivateInterrogationResult(
-        df=nw_df,
-        mask=check_df_all,  # type: ignore
-        is_good=is_good,  # type: ignore
-        summary=summary_df,  # type: ignore
+    is_empty = n.__eq__(0)
+
+    return summary.with_columns(
+        nw.when(is_empty.__invert__()).then(p).alias("pct_failed"),
+        nw.when(is_empty)
+        .then(0.0)
+        .otherwise(center.__sub__(half_width).clip(0, 1))
+        .alias("pct_failed_lower"),
+        nw.when(is_empty)
+        .then(1.0)
+        .otherwise(center.__add__(half_width).clip(0, 1))
+        .alias("pct_failed_upper"),
     )
 
 
+def _summary_columns(summary: nw.DataFrame | nw.LazyFrame) -> list[str]:
+    """The columns of the summary that are shown to users."""
+    columns = ["column", "operation", "n_failed", "pct_failed"]
+    if "pct_failed_lower" in summary.collect_schema().names():
+        columns.extend(["pct_failed_lower", "pct_failed_upper"])
+
+    return columns
+
+
 def _interrogate(
     schema: Schema,
-    df: nwt.IntoDataFrameT,
+    df: nwt.IntoFrameT,
+    engine: Optional[str] = None,
+    fuse_casts: bool = False,
+    n_threads: Optional[int] = None,
+    mask: bool | Literal["compact"] = True,
+    n_processes: Optional[int] = None,
+    n_samples: int = 0,
+    sample: Optional[int | float] = None,
+    seed: Optional[int] = None,
+) -> InterrogationResult:
+    n_total = None
+    if sample is not None:
+        sampled, n_total = _sample_rows(nw.from_native(df), sample, seed, engine)
+        df = sampled.to_native()
+
+    res = _private_interrogate(
+        schema=schema,
+        df=df,
+        engine=engine,
+        fuse_casts=fuse_casts,
+        n_threads=n_threads,
+        mask=bool(mask),
+        n_processes=n_processes,
+    )
+    if n_total is not None:
+        res.summary = _with_failure_bounds(res.summary, n_total)
+
+    result = _to_interrogation_result(res, engine, compact=mask == "compact")
+    if n_samples > 0 and res.mask is not None:
+        result.samples = [
+            sample
+            for samples in _failure_samples(res, n_samples, engine).values()
+            for sample in samples
+        ]
+
+    return result
+
+
+def _to_interrogation_result(
+    res: _PrivateInterrogationResult,
+    engine: Optional[str] = None,
+    compact: bool = False,
 ) -> InterrogationResult:
-    res = _private_interrogate(schema=schema, df=df)
+    mask: Optional[nwt.IntoDataFrame | FailureIndex] = None
+    if res.mask is not None:
+        if compact:
+            mask = FailureIndex._from_mask(
+                _collect(res.mask, engine)
+                if isinstance(res.mask, nw.LazyFrame)
+                else res.mask
+            )
+        else:
+            mask = res.mask.to_native()
 
     return InterrogationResult(
         df=res.df.to_native(),
-        mask=res.mask.to_native(),
-        is_good=res.is_good.to_native(),
-        summary=res.summary.select(
-            "column", "operation", "n_failed", "pct_failed"
-        ).to_native(),
+        mask=mask,
+        is_good=None if res.is_good is None else res.is_good.to_native(),
+        summary=res.summary.select(_summary_columns(res.summary)).to_native(),
     )
 
 
-def _filter(schema: Schema, df: nwt.IntoDataFrameT) -> nwt.IntoDataFrameT:
-    res = _private_interrogate(schema=schema, df=df)
+def _filter(
+    schema: Schema,
+    df: nwt.IntoFrameT,
+    engine: Optional[str] = None,
+    fuse_casts: bool = False,
+    n_threads: Optional[int] = None,
+    n_processes: Optional[int] = None,
+) -> nwt.IntoFrameT:
+    res = _private_interrogate(
+        schema=schema,
+        df=df,
+        engine=engine,
+        fuse_casts=fuse_casts,
+        n_threads=n_threads,
+        n_processes=n_processes,
+    )
+
+    if res.annotated is not None:
+        return (
+            res.annotated.filter(nw.col(_IS_GOOD_COL))
+            .select(res.df.collect_schema().names())
+            .to_native()
+        )
 
     return res.df.filter(res.is_good).to_native()
 
 
 def _generate_error_message(
-    summary_df: nwt.IntoDataFrame, columns: list[str], n_rows: int
+    summary_df: nwt.IntoDataFrame,
+    columns: list[str],
+    n_rows: int,
+    samples: Optional[dict[str, list[FailureSample]]] = None,
+    n_total: Optional[int] = None,
 ) -> str:
     failures = (
         nw.from_native(summary_df, eager_only=True)
         .filter(nw.col("n_failed").__gt__(0))
-        .with_columns(
-            nw.len().over("column").alias("error_count"),
-            nw.col("column").__ne__("__dataframe__").alias("is_column_check"),
-        )
+        .select("column", "message", "n_failed", "pct_failed", "id")
     )
-
-    column_failures = failures.filter(nw.col("is_column_check"))
-    frame_failures = failures.filter(nw.col("is_column_check").__invert__())
     total_error_count = failures.shape[0]
 
     n_rows_str = f"{n_rows:,}"
@@ -482,57 +2305,428 @@ def _generate_error_message(
     def _wrap_err(e: str) -> str:
         return f"    - {e}"
 
-    relevant_info = ["message", "n_failed", "pct_failed", "error_count"]
-    output = []
-    for column in columns:
-        bullets: list[str] = []
+    def _format_samples(identifier: str, indent: str) -> list[str]:
+        if samples is None or identifier not in samples:
+            return []
 
-        tmp = column_failures.filter(nw.col("column") == column)
+        examples = ", ".join(
+            f"row {s.row}" if s.value is None else f"row {s.row} = {s.value!r}"
+            for s in samples[identifier]
+        )
 
-        if tmp.is_empty():
-            continue
+        return [f"{indent}e.g. {examples}"]
 
-        for (
-            message,
-            n_failed,
-            pct_failed,
-            error_count,
-        ) in tmp.select(
-            relevant_info
-        ).iter_rows(named=False):
+    # Group the failures by column in a single pass, keeping the order of the summary
+    column_failures: dict[str, list[tuple[Any, ...]]] = {}
+    frame_failures = []
+    for column, *info in failures.iter_rows(named=False):
+        if column == "__dataframe__":
+            frame_failures.append(info)
+        else:
+            column_failures.setdefault(column, []).append(info)
+
+    output = []
+    for column in columns:
+        if column not in column_failures:
+            continue
 
+        bullets: list[str] = []
+        for message, n_failed, pct_failed, identifier in column_failures[column]:
             summary = f"{n_failed:,} / {n_rows_str} ({pct_failed:.2%})"
             message = message.format(summary=summary)
             bullets.append(_wrap_err(message))
+            bullets.extend(_format_samples(identifier, "        "))
 
-        output.append(f"  {column}: {error_count} error(s)")
+        output.append(f"  {column}: {len(column_failures[column])} error(s)")
         output.extend(bullets)
 
-    for message, n_failed, pct_failed, error_count in frame_failures.select(
-        relevant_info
-    ).iter_rows(named=False):
+    for message, n_failed, pct_failed, identifier in frame_failures:
         summary = f"{n_failed:,} / {n_rows_str} ({pct_failed:.2%})"
         message = message.format(summary=summary)
         output.append(f"  * {message}")
+        output.extend(_format_samples(identifier, "      "))
 
     error_summary = [f"Found {total_error_count} error(s)"]
+    if n_total is not None:
+        error_summary[0] += f" in a sample of {n_rows_str} / {n_total:,} rows"
 
     return "\n".join(error_summary + output)
 
 
-def _validate(schema: Schema, df: nwt.IntoDataFrameT) -> nwt.IntoDataFrameT:
-    res = _private_interrogate(schema, df)
+def _raise_if_failed(
+    schema: Schema,
+    summary: nw.DataFrame | nw.LazyFrame,
+    engine: Optional[str] = None,
+    samples: Optional[dict[str, list[FailureSample]]] = None,
+    n_total: Optional[int] = None,
+) -> None:
+    """Raises a `SchemaError` if any check in the summary failed. `n_total` is the
+    number of rows of the frame if only a sample of them was validated."""
+    summary_df = (
+        _collect(summary, engine) if isinstance(summary, nw.LazyFrame) else summary
+    )
+
+    if summary_df["n_failed"].__gt__(0).any():
+        if n_total is not None:
+            summary_df = _with_failure_bounds(summary_df, n_total)
 
-    if not res.is_good.all():
+        # The message is only rendered if the error is formatted
         raise SchemaError(
-            _generate_error_message(
-                summary_df=res.summary, columns=schema.columns(), n_rows=res.df.shape[0]
+            functools.partial(
+                _generate_error_message,
+                summary_df=summary_df,
+                columns=schema.columns(),
+                n_rows=summary_df["n_rows"][0],
+                samples=samples,
+                n_total=n_total,
+            ),
+            samples=(
+                None
+                if samples is None
+                else [sample for s in samples.values() for sample in s]
+            ),
+            summary=summary_df.select(_summary_columns(summary_df)).to_native(),
+        )
+
+
+def _fail_fast_validate(
+    schema: Schema,
+    df: nwt.IntoFrameT,
+    engine: Optional[str] = None,
+    fuse_casts: bool = False,
+    n_threads: Optional[int] = None,
+    n_total: Optional[int] = None,
+) -> nwt.IntoFrameT:
+    """Validates `df` in stages of increasing cost, raising at the end of the first
+    stage that has a failure:
+
+    1. Existence and data types, which only need the schema of `df`
+    2. Casts and checks that are expressions, in a single aggregation
+    3. Checks that take a Series
+    4. Checks that take a DataFrame
+
+    No mask is ever materialized, only the number of failures per check.
+    """
+    nw_df = nw.from_native(df)
+    plan = _PLAN_CACHE.get(
+        schema,
+        nw_df.collect_schema(),  # type: ignore[attribute]
+        fuse_casts=fuse_casts,
+    )
+
+    is_lazy = isinstance(nw_df, nw.LazyFrame)
+
+    if len(plan.static_failures) > 0:
+        _raise_if_failed(
+            schema,
+            _summarize_results(
+                nw_df, [dataclasses.replace(r) for r in plan.static_failures]
+            ),
+            engine,
+            n_total=n_total,
+        )
+
+    original = nw_df
+    unread: list[str] = []
+    if is_lazy and plan.requires_eager:
+        nw_df, unread = _collect_projection(nw_df, plan, engine)
+
+    results, nw_df, fused_check_indices, deferred = _execute_plan(
+        plan, nw_df, defer_eager_checks=True
+    )
+
+    cast_identifiers = [_cast_identifier(name) for name in plan.fused_casts]
+    cast_dependents: dict[str, str] = {}
+    if len(plan.fused_casts) > 0:
+        # As for LazyFrames, we don't know yet which casts fail
+        cast_dependents = _skip_checks_of_failed_casts(results, fused_check_indices)
+
+        try:
+            cast_lf = _with_fused_casts(nw_df.lazy(), plan.fused_casts)
+            nw_df = cast_lf if isinstance(nw_df, nw.LazyFrame) else cast_lf.collect()
+        except _cast_errors():
+            # See `_private_interrogate`
+            return _fail_fast_validate(
+                schema,
+                df,
+                engine=engine,
+                fuse_casts=False,
+                n_threads=n_threads,
+                n_total=n_total,
+            )
+
+    _raise_if_failed(
+        schema,
+        _drop_skipped_checks(
+            _summarize_results(nw_df, [r for r in results if r.res is not None]),
+            cast_dependents,
+        ),
+        engine,
+        n_total=n_total,
+    )
+
+    nw_df = nw_df.drop(cast_identifiers)
+    if isinstance(nw_df, nw.DataFrame):
+        out_schema = nw_df.collect_schema()
+        if any(out_schema[n] != c.to_dtype for n, c in plan.fused_casts.items()):
+            # The backend silently didn't cast, see `_apply_fused_casts`
+            return _fail_fast_validate(
+                schema,
+                df,
+                engine=engine,
+                fuse_casts=False,
+                n_threads=n_threads,
+                n_total=n_total,
+            )
+
+    for input_type in ("Series", "Frame"):
+        stage = _run_checks(
+            nw_df,
+            [step for _, step in deferred if step.check.input_type == input_type],
+            n_threads=n_threads,
+        )
+
+        if len(stage) > 0:
+            _raise_if_failed(
+                schema, _summarize_results(nw_df, stage), engine, n_total=n_total
+            )
+
+    if is_lazy:
+        return _with_unread_columns(nw_df.lazy(), original, unread).to_native()
+
+    return nw_df.to_native()
+
+
+def _validate(
+    schema: Schema,
+    df: nwt.IntoFrameT,
+    engine: Optional[str] = None,
+    fuse_casts: bool = False,
+    n_threads: Optional[int] = None,
+    fail_fast: bool = False,
+    n_processes: Optional[int] = None,
+    n_samples: int = 0,
+    sample: Optional[int | float] = None,
+    seed: Optional[int] = None,
+    n_total: Optional[int] = None,
+) -> nwt.IntoFrameT:
+    """Validates `df`. `n_total` is the number of rows of the frame that `df` was
+    sampled from, if any."""
+    if sample is not None:
+        # Only the sample is checked, so the input is returned as is, which would have
+        # different data types than the output of a full validation if anything is cast
+        cast_columns = [
+            compiled.name
+            for compiled in schema._compiled.columns
+            if not getattr(compiled.column, "per_row", False)
+            and any(c.column.cast for c in compiled.members or (compiled,))
+        ]
+        if len(cast_columns) > 0:
+            raise ValueError(
+                "`sample` can't be used to validate schemas that cast columns, since "
+                "only the sample would be cast; cast columns: "
+                f"{', '.join(cast_columns)}"
             )
+
+        sampled, n_total = _sample_rows(nw.from_native(df), sample, seed, engine)
+        _validate(
+            schema,
+            sampled.to_native(),
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+            fail_fast=fail_fast,
+            n_processes=n_processes,
+            n_samples=n_samples,
+            n_total=n_total,
+        )
+
+        return df
+
+    if fail_fast:
+        return _fail_fast_validate(
+            schema,
+            df,
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+            n_total=n_total,
         )
 
+    # Only the per-check failure counts are computed (and collected, for LazyFrames);
+    # the mask is only built if samples of the failures are needed
+    res = _private_interrogate(
+        schema,
+        df,
+        engine=engine,
+        fuse_casts=fuse_casts,
+        n_threads=n_threads,
+        mask=n_samples > 0,
+        n_processes=n_processes,
+    )
+
+    samples = None
+    if n_samples > 0:
+        # Collect the summary once, since both the samples and the error need it
+        if isinstance(res.summary, nw.LazyFrame):
+            res.summary = _collect(res.summary, engine)
+
+        samples = _failure_samples(res, n_samples, engine)
+
+    _raise_if_failed(schema, res.summary, engine, samples, n_total=n_total)
+
     return res.df.to_native()
 
 
+def _from_batch(batch: Any) -> Any:
+    # Narwhals doesn't support pyarrow RecordBatches, which is what iterating over a
+    # RecordBatchReader gives you
+    if type(batch).__name__ == "RecordBatch" and type(batch).__module__.startswith(
+        "pyarrow"
+    ):
+        import pyarrow as pa
+
+        return pa.Table.from_batches([batch])
+
+    return batch
+
+
+class BatchIterator:
+    """An iterator over validated or interrogated batches, see `Schema.validate_batches`
+    and `Schema.interrogate_batches`. Batches are processed one at a time as you
+    iterate, and their summaries are merged into a single summary of every row seen so
+    far.
+
+    Attributes
+    ----------
+    n_rows : int
+        The number of rows seen so far
+    """
+
+    def __init__(self):
+        self.n_rows = 0
+        self._batches: Iterator[Any] = iter(())
+        # id -> [column, operation, n_failed]
+        self._counts: dict[str, list[Any]] = {}
+        self._native_namespace: Any = None
+
+    def __iter__(self) -> BatchIterator:
+        return self
+
+    def __next__(self) -> Any:
+        return next(self._batches)
+
+    def _update(
+        self, res: _PrivateInterrogationResult, engine: Optional[str] = None
+    ) -> nw.DataFrame:
+        summary = res.summary
+        if isinstance(summary, nw.LazyFrame):
+            summary = _collect(summary, engine)
+
+        if "n_rows" in summary.columns:
+            n_rows = summary["n_rows"][0] if summary.shape[0] > 0 else 0
+        else:
+            n_rows = res.df.shape[0]  # type: ignore[union-attr]
+
+        self.n_rows += n_rows
+        self._native_namespace = nw.get_native_namespace(summary)
+
+        for identifier, column, operation, n_failed in summary.select(
+            "id", "column", "operation", "n_failed"
+        ).iter_rows(named=False):
+            if identifier in self._counts:
+                self._counts[identifier][2] += n_failed
+            else:
+                self._counts[identifier] = [column, operation, n_failed]
+
+        return summary
+
+    @property
+    def summary(self) -> Optional[nwt.IntoDataFrame]:
+        """The merged summary of every batch seen so far, with the same columns as
+        `InterrogationResult.summary`. The DataFrame is of the same type as the batches,
+        or None if no batch has been seen yet.
+
+        Returns
+        -------
+        Optional[nwt.IntoDataFrame]
+        """
+        if self._native_namespace is None:
+            return None
+
+        counts = list(self._counts.values())
+
+        return nw.from_dict(
+            {
+                "column": [c[0] for c in counts],
+                "operation": [c[1] for c in counts],
+                "n_failed": [c[2] for c in counts],
+                "pct_failed": [
+                    c[2] / self.n_rows if self.n_rows > 0 else float("nan")
+                    for c in counts
+                ],
+            },
+            native_namespace=self._native_namespace,
+        ).to_native()
+
+
+def _interrogate_batches(
+    schema: Schema,
+    batches: Iterable[nwt.IntoFrameT],
+    engine: Optional[str] = None,
+    fuse_casts: bool = False,
+    n_threads: Optional[int] = None,
+    mask: bool | Literal["compact"] = True,
+) -> BatchIterator:
+    iterator = BatchIterator()
+
+    def _interrogate_all():
+        for batch in batches:
+            res = _private_interrogate(
+                schema,
+                _from_batch(batch),
+                engine=engine,
+                fuse_casts=fuse_casts,
+                n_threads=n_threads,
+                mask=bool(mask),
+            )
+            iterator._update(res, engine)
+
+            yield _to_interrogation_result(res, engine, compact=mask == "compact")
+
+    iterator._batches = _interrogate_all()
+
+    return iterator
+
+
+def _validate_batches(
+    schema: Schema,
+    batches: Iterable[nwt.IntoFrameT],
+    engine: Optional[str] = None,
+    fuse_casts: bool = False,
+    n_threads: Optional[int] = None,
+) -> BatchIterator:
+    iterator = BatchIterator()
+
+    def _validate_all():
+        for batch in batches:
+            res = _private_interrogate(
+                schema,
+                _from_batch(batch),
+                engine=engine,
+                fuse_casts=fuse_casts,
+                n_threads=n_threads,
+                mask=False,
+            )
+            _raise_if_failed(schema, iterator._update(res, engine))
+
+            yield res.df.to_native()
+
+    iterator._batches = _validate_all()
+
+    return iterator
+
+
 class _SchemaCacheMeta(type):
     def __new__(cls, name, bases, namespace):
         new_class = super().__new__(cls, name, bases, namespace)
@@ -567,12 +2761,28 @@ class Schema(metaclass=_SchemaCacheMeta):
         checks: Optional[Iterable[Check]] = None,
     ):
         self.expected_schema = expected_schema
-        self.checks = [] if checks is None else checks
+        self.checks = [] if checks is None else list(checks)
+        self._compiled_fingerprint = _fingerprint(self.expected_schema, self.checks)
+        self.__compiled = _compile_schema(self.expected_schema, self.checks)
         self.interrogate = self.__interrogate  # type: ignore
         self.validate = self.__validate  # type: ignore
         self.filter = self.__filter  # type: ignore
+        self.validate_batches = self.__validate_batches  # type: ignore
+        self.interrogate_batches = self.__interrogate_batches  # type: ignore
+        self.validate_parquet = self.__validate_parquet  # type: ignore
+        self.optimize = self.__optimize  # type: ignore
         self.columns = self.__columns  # type: ignore
 
+    @property
+    def _compiled(self) -> _CompiledSchema:
+        # Recompile if the columns or checks were modified since the last access
+        fingerprint = _fingerprint(self.expected_schema, self.checks)
+        if fingerprint != self._compiled_fingerprint:
+            self._compiled_fingerprint = fingerprint
+            self.__compiled = _compile_schema(self.expected_schema, self.checks)
+
+        return self.__compiled
+
     @classmethod
     def columns(cls) -> list[str]:
         """Returns the column names of the schema.
@@ -619,7 +2829,7 @@ class Schema(metaclass=_SchemaCacheMeta):
 
                     new_vals.append(new_val)
 
-                schema_dict[col_name] = CfUnion(*new_vals)
+                schema_dict[col_name] = CfUnion(*new_vals, per_row=val.per_row)
 
         for attr, val in attr_list:
             if isinstance(val, Check):
@@ -652,44 +2862,195 @@ class Schema(metaclass=_SchemaCacheMeta):
         return res
 
     @classmethod
-    def interrogate(cls, df: nwt.IntoDataFrameT) -> InterrogationResult:
+    def interrogate(
+        cls,
+        df: nwt.IntoFrameT,
+        engine: Optional[str] = None,
+        fuse_casts: bool = False,
+        n_threads: Optional[int] = None,
+        mask: bool | Literal["compact"] = True,
+        n_processes: Optional[int] = None,
+        n_samples: int = 0,
+        sample: Optional[int | float] = None,
+        seed: Optional[int] = None,
+    ) -> InterrogationResult:
         """Interrogate the DataFrame, returning the input DataFrame, a validation mask,
         a boolean Series indicating which rows pass, and a summary of passes / failures.
 
         Parameters
         ----------
-        df : nwt.IntoDataFrameT
-            Any Narwhals-compatible DataFrame, see https://narwhals-dev.github.io/narwhals/
-            for more information
+        df : nwt.IntoFrameT
+            Any Narwhals-compatible DataFrame or LazyFrame, see
+            https://narwhals-dev.github.io/narwhals/ for more information. LazyFrames
+            are not collected; all results are returned as LazyFrames
+        engine : Optional[str], optional
+            The Polars engine to use whenever a LazyFrame has to be collected, e.g.
+            "streaming", by default None
+        fuse_casts : bool, optional
+            Whether to evaluate casts as expressions in the same query as the checks
+            instead of casting each column eagerly beforehand. This also lets
+            LazyFrames with casts be validated without collecting them first. Casts
+            that can only be done eagerly are still done eagerly. As when casting
+            eagerly, the checks of a column that fails to cast aren't in the summary;
+            for LazyFrames, whose columns can't depend on the data, they are still in
+            the mask but pass every row, by default False
+        n_threads : Optional[int], optional
+            The number of threads to run checks that take a Series or DataFrame on.
+            Polars, pyarrow, and NumPy release the GIL in their kernels, so these
+            checks can run concurrently. Results are the same as when running
+            sequentially, by default None
+        mask : bool | Literal["compact"], optional
+            Whether to compute the validation mask and `is_good`. If False, only the
+            number of failures per check is computed, in a single aggregation, and
+            `mask` and `is_good` are None. This is much cheaper in memory for large
+            frames with many checks. If "compact", `mask` is a `FailureIndex`, which
+            only stores the failing rows of each check, by default True
+        n_processes : Optional[int], optional
+            The number of processes to split the rows of an eager DataFrame across.
+            Built-in checks that only look at one row at a time are run on each range
+            of rows in a process pool; casts and every other check are run on the
+            whole DataFrame, so results are the same as in a single process. Meant for
+            single-threaded backends like pandas and pyarrow. Workers may re-import
+            your main module (always for Polars), so scripts have to call this under
+            an `if __name__ == "__main__":` guard, by default None
+        n_samples : int, optional
+            The number of failing rows to keep as examples for each failing check, see
+            `InterrogationResult.samples`. They are taken from the mask, so this has
+            no effect with `mask=False`, by default 0
+        sample : Optional[int | float], optional
+            If given, only a uniform random sample of about this many rows (if an
+            int) or this fraction of the rows (if a float) is interrogated, so
+            `sample=1` is a single row while `sample=1.0` is every row. Each row is
+            kept at random on its own, so the size of the sample may be off by a few
+            rows. Every attribute of the result is then about the sampled rows, and the
+            summary also has a 95% confidence interval of `pct_failed` for the whole
+            frame, `pct_failed_lower` and `pct_failed_upper`. If the sample has no
+            rows, `pct_failed` is null and the interval is [0, 1]. Existence and data
+            types are always exact. Rows are sampled uniformly, not stratified by any column,
+            so rare groups of rows may not be in the sample at all, by default None
+        seed : Optional[int], optional
+            The seed of the random sample, by default None
 
         Returns
         -------
         InterrogationResult
         """
-        return _interrogate(cls._parse_into_schema(), df)
+        return _interrogate(
+            cls._parse_into_schema(),
+            df,
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+            mask=mask,
+            n_processes=n_processes,
+            n_samples=n_samples,
+            sample=sample,
+            seed=seed,
+        )
 
-    def __interrogate(self, df: nwt.IntoDataFrameT) -> InterrogationResult:
-        return _interrogate(self, df)
+    def __interrogate(
+        self,
+        df: nwt.IntoFrameT,
+        engine: Optional[str] = None,
+        fuse_casts: bool = False,
+        n_threads: Optional[int] = None,
+        mask: bool | Literal["compact"] = True,
+        n_processes: Optional[int] = None,
+        n_samples: int = 0,
+        sample: Optional[int | float] = None,
+        seed: Optional[int] = None,
+    ) -> InterrogationResult:
+        return _interrogate(
+            self,
+            df,
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+            mask=mask,
+            n_processes=n_processes,
+            n_samples=n_samples,
+            sample=sample,
+            seed=seed,
+        )
 
     @classmethod
-    def validate(cls, df: nwt.IntoDataFrameT) -> nwt.IntoDataFrameT:
+    def validate(
+        cls,
+        df: nwt.IntoFrameT,
+        engine: Optional[str] = None,
+        fuse_casts: bool = False,
+        n_threads: Optional[int] = None,
+        fail_fast: bool = False,
+        n_processes: Optional[int] = None,
+        n_samples: int = 0,
+        sample: Optional[int | float] = None,
+        seed: Optional[int] = None,
+    ) -> nwt.IntoFrameT:
         """Validate the given DataFrame.
 
         Parameters
         ----------
-        df : nwt.IntoDataFrameT
-            Any Narwhals-compatible DataFrame, see https://narwhals-dev.github.io/narwhals/
-            for more information
+        df : nwt.IntoFrameT
+            Any Narwhals-compatible DataFrame or LazyFrame, see
+            https://narwhals-dev.github.io/narwhals/ for more information. For
+            LazyFrames, only the failure counts are collected and the validated
+            LazyFrame is returned
+        engine : Optional[str], optional
+            The Polars engine to use whenever a LazyFrame has to be collected, e.g.
+            "streaming", by default None
+        fuse_casts : bool, optional
+            Whether to evaluate casts as expressions in the same query as the checks
+            instead of casting each column eagerly beforehand. This also lets
+            LazyFrames with casts be validated without collecting them first. Casts
+            that can only be done eagerly are still done eagerly, by default False
+        n_threads : Optional[int], optional
+            The number of threads to run checks that take a Series or DataFrame on.
+            Polars, pyarrow, and NumPy release the GIL in their kernels, so these
+            checks can run concurrently. Results are the same as when running
+            sequentially, by default None
+        fail_fast : bool, optional
+            Whether to raise as soon as a stage of validation fails instead of running
+            every check. Missing columns and data types are checked first, then casts
+            and expression checks in a single aggregation, then checks that take a
+            Series, and finally checks that take a DataFrame. The error message only
+            contains the failures of the first failing stage, by default False
+        n_processes : Optional[int], optional
+            The number of processes to split the rows of an eager DataFrame across.
+            Built-in checks that only look at one row at a time are run on each range
+            of rows in a process pool; casts and every other check are run on the
+            whole DataFrame, so results are the same as in a single process. Meant for
+            single-threaded backends like pandas and pyarrow. Workers may re-import
+            your main module (always for Polars), so scripts have to call this under
+            an `if __name__ == "__main__":` guard. Not used with
+            `fail_fast`, by default None
+        n_samples : int, optional
+            The number of failing rows to show as examples for each failing check in
+            the error, also available as `SchemaError.samples`. This builds the mask,
+            like `interrogate`. Not used with `fail_fast`, by default 0
+        sample : Optional[int | float], optional
+            If given, only a uniform random sample of about this many rows (if an
+            int) or this fraction of the rows (if a float) is validated, so
+            `sample=1` is a single row while `sample=1.0` is every row. The input is
+            returned as is. Since the rest of the rows isn't cast, schemas with
+            `cast=True` columns can't be validated on a sample. `SchemaError.summary`
+            then also has a 95% confidence interval of `pct_failed` for the whole
+            frame. Existence and data types are always checked exactly. Rows are
+            sampled uniformly, not stratified by any column, so rare groups of rows may
+            not be in the sample at all, by default None
+        seed : Optional[int], optional
+            The seed of the random sample, by default None
 
         Returns
         -------
-        nwt.IntoDataFrameT
+        nwt.IntoFrameT
             Your original DataFrame
 
         Raises
         ------
         SchemaError
             If validation fails
+        ValueError
+            If `sample` is given and the schema casts columns
 
         Examples
         --------
@@ -731,27 +3092,382 @@ class Schema(metaclass=_SchemaCacheMeta):
 
             MySchema.validate(df)
         """
-        return _validate(cls._parse_into_schema(), df)
+        return _validate(
+            cls._parse_into_schema(),
+            df,
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+            fail_fast=fail_fast,
+            n_processes=n_processes,
+            n_samples=n_samples,
+            sample=sample,
+            seed=seed,
+        )
 
-    def __validate(self, df: nwt.IntoDataFrameT) -> nwt.IntoDataFrameT:
-        return _validate(self, df)
+    def __validate(
+        self,
+        df: nwt.IntoFrameT,
+        engine: Optional[str] = None,
+        fuse_casts: bool = False,
+        n_threads: Optional[int] = None,
+        fail_fast: bool = False,
+        n_processes: Optional[int] = None,
+        n_samples: int = 0,
+        sample: Optional[int | float] = None,
+        seed: Optional[int] = None,
+    ) -> nwt.IntoFrameT:
+        return _validate(
+            self,
+            df,
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+            fail_fast=fail_fast,
+            n_processes=n_processes,
+            n_samples=n_samples,
+            sample=sample,
+            seed=seed,
+        )
 
     @classmethod
-    def filter(cls, df: nwt.IntoDataFrameT) -> nwt.IntoDataFrameT:
+    def filter(
+        cls,
+        df: nwt.IntoFrameT,
+        engine: Optional[str] = None,
+        fuse_casts: bool = False,
+        n_threads: Optional[int] = None,
+        n_processes: Optional[int] = None,
+    ) -> nwt.IntoFrameT:
         """Filter the given DataFrame to passing rows.
 
         Parameters
         ----------
-        df : nwt.IntoDataFrameT
-            Any Narwhals-compatible DataFrame, see https://narwhals-dev.github.io/narwhals/
-            for more information
+        df : nwt.IntoFrameT
+            Any Narwhals-compatible DataFrame or LazyFrame, see
+            https://narwhals-dev.github.io/narwhals/ for more information. LazyFrames
+            are filtered lazily
+        engine : Optional[str], optional
+            The Polars engine to use whenever a LazyFrame has to be collected, e.g.
+            "streaming", by default None
+        fuse_casts : bool, optional
+            Whether to evaluate casts as expressions in the same query as the checks
+            instead of casting each column eagerly beforehand. This also lets
+            LazyFrames with casts be validated without collecting them first. Casts
+            that can only be done eagerly are still done eagerly, by default False
+        n_threads : Optional[int], optional
+            The number of threads to run checks that take a Series or DataFrame on.
+            Polars, pyarrow, and NumPy release the GIL in their kernels, so these
+            checks can run concurrently. Results are the same as when running
+            sequentially, by default None
+        n_processes : Optional[int], optional
+            The number of processes to split the rows of an eager DataFrame across.
+            Built-in checks that only look at one row at a time are run on each range
+            of rows in a process pool; casts and every other check are run on the
+            whole DataFrame, so results are the same as in a single process. Meant for
+            single-threaded backends like pandas and pyarrow. Workers may re-import
+            your main module (always for Polars), so scripts have to call this under
+            an `if __name__ == "__main__":` guard, by default None
 
         Returns
         -------
-        nwt.IntoDataFrameT
+        nwt.IntoFrameT
             The input DataFrame filtered to passing rows
         """
-        return _filter(cls._parse_into_schema(), df)
+        return _filter(
+            cls._parse_into_schema(),
+            df,
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+            n_processes=n_processes,
+        )
+
+    def __filter(
+        self,
+        df: nwt.IntoFrameT,
+        engine: Optional[str] = None,
+        fuse_casts: bool = False,
+        n_threads: Optional[int] = None,
+        n_processes: Optional[int] = None,
+    ) -> nwt.IntoFrameT:
+        return _filter(
+            self,
+            df,
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+            n_processes=n_processes,
+        )
+
+    @classmethod
+    def validate_batches(
+        cls,
+        batches: Iterable[nwt.IntoFrameT],
+        engine: Optional[str] = None,
+        fuse_casts: bool = False,
+        n_threads: Optional[int] = None,
+    ) -> BatchIterator:
+        """Validate an iterable of DataFrames (batches) one at a time, e.g. a pyarrow
+        `RecordBatchReader`, `pl.DataFrame.iter_slices`, or
+        `pd.read_csv(..., chunksize=...)`. Only one batch needs to be in memory at a
+        time.
+
+        Parameters
+        ----------
+        batches : Iterable[nwt.IntoFrameT]
+            An iterable of Narwhals-compatible DataFrames or LazyFrames. pyarrow
+            RecordBatches are converted to Tables
+        engine : Optional[str], optional
+            The Polars engine to use whenever a LazyFrame has to be collected, e.g.
+            "streaming", by default None
+        fuse_casts : bool, optional
+            Whether to evaluate casts as expressions in the same query as the checks
+            instead of casting each column eagerly beforehand, by default False
+        n_threads : Optional[int], optional
+            The number of threads to run checks that take a Series or DataFrame on.
+            Polars, pyarrow, and NumPy release the GIL in their kernels, so these
+            checks can run concurrently. Results are the same as when running
+            sequentially, by default None
+
+        Returns
+        -------
+        BatchIterator
+            An iterator over the validated batches. Once exhausted, its `summary` is
+            the summary of every batch merged together
+
+        Raises
+        ------
+        SchemaError
+            As soon as a batch fails validation
+
+        Examples
+        --------
+        .. code-block:: python
+
+            import checkedframe as cf
+            import polars as pl
+
+
+            class MySchema(cf.Schema):
+                customer_id = cf.String()
+                balance = cf.Float64(cast=True)
+
+
+            batches = MySchema.validate_batches(
+                pl.read_parquet("customers.parquet").iter_slices(100_000)
+            )
+
+            for batch in batches:
+                ...  # every batch here is valid
+
+            batches.summary
+        """
+        return _validate_batches(
+            cls._parse_into_schema(),
+            batches,
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+        )
+
+    def __validate_batches(
+        self,
+        batches: Iterable[nwt.IntoFrameT],
+        engine: Optional[str] = None,
+        fuse_casts: bool = False,
+        n_threads: Optional[int] = None,
+    ) -> BatchIterator:
+        return _validate_batches(
+            self, batches, engine=engine, fuse_casts=fuse_casts, n_threads=n_threads
+        )
+
+    @classmethod
+    def interrogate_batches(
+        cls,
+        batches: Iterable[nwt.IntoFrameT],
+        engine: Optional[str] = None,
+        fuse_casts: bool = False,
+        n_threads: Optional[int] = None,
+        mask: bool | Literal["compact"] = True,
+    ) -> BatchIterator:
+        """Interrogate an iterable of DataFrames (batches) one at a time, see
+        `Schema.validate_batches`.
+
+        Parameters
+        ----------
+        batches : Iterable[nwt.IntoFrameT]
+            An iterable of Narwhals-compatible DataFrames or LazyFrames. pyarrow
+            RecordBatches are converted to Tables
+        engine : Optional[str], optional
+            The Polars engine to use whenever a LazyFrame has to be collected, e.g.
+            "streaming", by default None
+        fuse_casts : bool, optional
+            Whether to evaluate casts as expressions in the same query as the checks
+            instead of casting each column eagerly beforehand, by default False
+        n_threads : Optional[int], optional
+            The number of threads to run checks that take a Series or DataFrame on.
+            Polars, pyarrow, and NumPy release the GIL in their kernels, so these
+            checks can run concurrently. Results are the same as when running
+            sequentially, by default None
+        mask : bool | Literal["compact"], optional
+            Whether to compute the validation mask and `is_good` of each batch. If
+            "compact", the mask of each batch is a `FailureIndex`, by default True
+
+        Returns
+        -------
+        BatchIterator
+            An iterator over the `InterrogationResult` of each batch. Once exhausted,
+            its `summary` is the summary of every batch merged together
+        """
+        return _interrogate_batches(
+            cls._parse_into_schema(),
+            batches,
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+            mask=mask,
+        )
+
+    def __interrogate_batches(
+        self,
+        batches: Iterable[nwt.IntoFrameT],
+        engine: Optional[str] = None,
+        fuse_casts: bool = False,
+        n_threads: Optional[int] = None,
+        mask: bool | Literal["compact"] = True,
+    ) -> BatchIterator:
+        return _interrogate_batches(
+            self,
+            batches,
+            engine=engine,
+            fuse_casts=fuse_casts,
+            n_threads=n_threads,
+            mask=mask,
+        )
+
+    @classmethod
+    def validate_parquet(
+        cls,
+        source: Any,
+        engine: Optional[str] = None,
+        n_threads: Optional[int] = None,
+    ) -> Any:
+        """Validate a Parquet file, skipping row groups whose statistics prove that they
+        pass. Null checks, comparisons against literals (`lt`, `le`, `gt`, `ge`,
+        `is_between`), and `is_in` can be proven from the minimum, maximum, and null
+        count of each column chunk. The minimum and maximum are only bounds of the
+        values, so a row group is only decided to fail if the null count is positive
+        for `nullable=False` or every value within the bounds fails, e.g. the minimum
+        is above the upper bound of `is_between`. Such failures are reported without
+        reading any data; every other row group is read and validated, one at a time.
+        Requires `pyarrow`.
+
+        If the schema has frame checks or checks that aren't row-local, whether a row
+        passes may depend on other row groups, so every row group is read.
+
+        Parameters
+        ----------
+        source : Any
+            A path or file-like object that `pyarrow.parquet.ParquetFile` accepts
+        engine : Optional[str], optional
+            The Polars engine to use whenever a LazyFrame has to be collected, by
+            default None
+        n_threads : Optional[int], optional
+            The number of threads to run checks that take a Series or DataFrame on, by
+            default None
+
+        Returns
+        -------
+        pa.Table
+            One row per row group with its index (`row_group`), number of rows
+            (`n_rows`), and `status`: "passed" if it was decided from statistics alone
+            or "scanned" if it was read
+
+        Raises
+        ------
+        SchemaError
+            If the statistics of any row group prove a failure, reported per row group
+            without the number of failing rows, or else for the first row group that
+            fails validation when read
+
+        Examples
+        --------
+        .. code-block:: python
+
+            import checkedframe as cf
+
+
+            class MySchema(cf.Schema):
+                age = cf.Int64(checks=[cf.Check.is_between(0, 128)])
+
+
+            MySchema.validate_parquet("people.parquet")
+        """
+        from ._parquet import _validate_parquet
+
+        return _validate_parquet(
+            cls._parse_into_schema(), source, engine=engine, n_threads=n_threads
+        )
+
+    def __validate_parquet(
+        self,
+        source: Any,
+        engine: Optional[str] = None,
+        n_threads: Optional[int] = None,
+    ) -> Any:
+        from ._parquet import _validate_parquet
+
+        return _validate_parquet(self, source, engine=engine, n_threads=n_threads)
+
+    @classmethod
+    def optimize(cls, df: nwt.IntoFrameT, engine: Optional[str] = None) -> Any:
+        """Validate `df` and shrink each of its integer and float columns to the
+        smallest data type that holds every value and that the schema still accepts,
+        i.e. that matches the column (or a member of a union) or is always safely cast
+        to it with `cast=True`. The minimum and maximum of every column are computed in
+        a single aggregation. Floats are shrunk to Float32 if every value survives the
+        round trip.
+
+        Parameters
+        ----------
+        df : nwt.IntoFrameT
+            The DataFrame to validate and shrink
+        engine : Optional[str], optional
+            The Polars engine to use whenever a LazyFrame has to be collected, by
+            default None
+
+        Returns
+        -------
+        OptimizationResult
+            The shrunk DataFrame, and the data type and bytes saved of each column
+
+        Raises
+        ------
+        SchemaError
+            If validation fails
+
+        Examples
+        --------
+        .. code-block:: python
+
+            import checkedframe as cf
+            import polars as pl
+
+
+            class MySchema(cf.Schema):
+                age = cf.Int64(cast=True, checks=[cf.Check.ge(0)])
+
+
+            res = MySchema.optimize(pl.DataFrame({"age": [25, 40, 61]}))
+            res.df  # age is Int8
+            res.bytes_saved  # 21
+        """
+        from ._optimize import _optimize
+
+        return _optimize(cls._parse_into_schema(), df, engine=engine)
+
+    def __optimize(self, df: nwt.IntoFrameT, engine: Optional[str] = None) -> Any:
+        from ._optimize import _optimize
 
-    def __filter(self, df: nwt.IntoDataFrameT) -> nwt.IntoDataFrameT:
-        return _filter(self, df)
+        return _optimize(self, df, engine=engine)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import string
+import sys
 from abc import abstractmethod
 from collections.abc import Iterable, Mapping
 from typing import TYPE_CHECKING
@@ -27,7 +28,7 @@ class _DType:
 
     @staticmethod
     @abstractmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType) -> nw.Series: ...
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy: ...
 
     @staticmethod
     @abstractmethod
@@ -50,9 +51,10 @@ class _Column:
         Whether to allow nulls, by default False
     required : bool, optional
         Whether the column is required to be present, by default True
-    cast : bool, optional
+    cast : bool | Literal["coerce"], optional
         Whether to automatically try to cast the column to the expected data type, by
-        default False
+        default False. With "coerce", elements that can't be cast are set to null and
+        reported as failing the cast, and the checks of the column still run.
     checks : Optional[Iterable[Check]], optional
         Checks to run on the column, by default None
     """
@@ -62,7 +64,7 @@ class _Column:
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         self.name = name
@@ -72,7 +74,27 @@ class _Column:
         self.checks = [] if checks is None else list(checks)
 
 
-class TypedColumn(NarwhalsDType, _DType, _Column): ...
+class TypedColumn(NarwhalsDType, _DType, _Column):
+    @classmethod
+    def _safe_cast(cls, s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
+        if isinstance(to_dtype, CfUnion):
+            return _union_cast(cls, s, to_dtype)
+
+        return _lookup_cast_strategy(cls, to_dtype).cast(s, to_dtype)
+
+    @classmethod
+    def _coerce_cast(
+        cls, s: nw.Series, to_dtype: _DType
+    ) -> tuple[nw.Series, Optional[CastError]]:
+        return _lookup_cast_strategy(cls, to_dtype).coerce(s, to_dtype)
+
+    @classmethod
+    def _safe_cast_expr(
+        cls, name: str, from_dtype: NarwhalsDType, to_dtype: _DType
+    ) -> Optional[_CastExpr]:
+        return _lookup_cast_strategy(cls, to_dtype).cast_expr(
+            name, from_dtype, to_dtype
+        )
 
 
 def _checked_cast(s: nw.Series, to_dtype: _DType) -> nw.Series:
@@ -89,126 +111,514 @@ def _checked_cast(s: nw.Series, to_dtype: _DType) -> nw.Series:
             string.Template("Cannot cast ${from_dtype} to ${to_dtype}").safe_substitute(
                 {"from_dtype": s.dtype, "to_dtype": to_dtype}
             ),
-            nw.lit(False),
+            False,
         )
 
     if s_cast.dtype != to_nw_dtype:
         raise CastError(
-            string.Template(
-                "Cannot cast ${from_dtype} to ${to_dtype}; failed for {summary} rows ${to_dtype} not supported by your DataFrame library"
-            ).safe_substitute({"from_dtype": s.dtype, "to_dtype": to_dtype}),
-            element_passes=nw.lit(False),
+            _unsupported_cast_message(s.dtype, to_dtype),
+            element_passes=False,
         )
 
     return s_cast
 
 
-def _int_to_uint_cast(s: nw.Series, to_dtype: _DType) -> nw.Series:
-    passes = s >= 0
+def _cast_errors() -> tuple[type[Exception], ...]:
+    """The exceptions that backends raise when values can't be cast, or can't be
+    compared against the bounds of a data type. Backends that haven't been imported
+    can't have raised, so they aren't imported here."""
+    errors: list[type[Exception]] = [OverflowError]
+
+    if (pl := sys.modules.get("polars")) is not None:
+        errors.extend([pl.exceptions.InvalidOperationError, pl.exceptions.ComputeError])
+
+    if (pd := sys.modules.get("pandas")) is not None:
+        errors.append(pd.errors.IntCastingNaNError)
+
+    if (pa := sys.modules.get("pyarrow")) is not None:
+        errors.extend([pa.ArrowInvalid, pa.ArrowNotImplementedError])
+
+    return tuple(errors)
+
+
+def _unsupported_cast_message(from_dtype, to_dtype) -> str:
+    return string.Template(
+        "Cannot cast ${from_dtype} to ${to_dtype}; failed for {summary} rows ${to_dtype} not supported by your DataFrame library"
+    ).safe_substitute({"from_dtype": from_dtype, "to_dtype": to_dtype})
+
+
+class _CastExpr:
+    """The expression form of a safe cast.
+
+    Parameters
+    ----------
+    cast : nw.Expr
+        The cast values. Elements that cannot be safely cast are null.
+    passes : Optional[nw.Expr]
+        Whether each element can be safely cast, or None if every element can
+    msg : str
+        The error message if any element cannot be safely cast
+    from_dtype : NarwhalsDType
+        The data type being cast from
+    to_dtype : NarwhalsDType
+        The data type being cast to
+    """
+
+    def __init__(
+        self,
+        cast: nw.Expr,
+        passes: Optional[nw.Expr],
+        msg: str,
+        from_dtype: NarwhalsDType,
+        to_dtype: NarwhalsDType,
+    ):
+        self.cast = cast
+        self.passes = passes
+        self.msg = msg
+        self.from_dtype = from_dtype
+        self.to_dtype = to_dtype
+
+
+_COERCE_PASSES_COL = "__checkedframe_coerce_passes__"
+
+
+class _CastStrategy:
+    """A way to safely cast from one data type to another. Subclasses define which
+    elements can be cast via `_passes`, which works on both Series and expressions. This
+    lets the same strategy either cast a Series eagerly, raising a CastError if any
+    element fails, or build the cast as expressions that can be evaluated in the same
+    query as the checks.
+    """
+
+    # Whether the cast can be evaluated as part of a larger query. Casts that may error
+    # out in the backend instead of producing a mask are not fusable, since one bad
+    # column would otherwise take down the whole query.
+    fusable = True
+
+    def _passes(self, x, to_dtype):
+        return None
+
+    def _bounds(self, to_dtype) -> Optional[tuple[Optional[float], Optional[float]]]:
+        """The (lower, upper) bounds, inclusive and None if unbounded, that every element
+        has to be within if `_passes` is just a range check, else None."""
+        return None
+
+    def _message(self, from_dtype, to_dtype) -> str:
+        return string.Template(
+            "Cannot cast ${from_dtype} to ${to_dtype}"
+        ).safe_substitute({"from_dtype": from_dtype, "to_dtype": to_dtype})
+
+    def cast(self, s: nw.Series, to_dtype: _DType) -> nw.Series:
+        passes = self._passes(s, to_dtype)
+
+        if passes is None or passes.all():
+            return _checked_cast(s, to_dtype)
+
+        raise CastError(self._message(s.dtype, to_dtype), passes)
+
+    def coerce(
+        self, s: nw.Series, to_dtype: _DType
+    ) -> tuple[nw.Series, Optional[CastError]]:
+        """Casts `s`, setting elements that can't be cast to null. Returns the cast
+        Series and the CastError describing the elements that couldn't be cast, if any.
+        Casts that the backend has to attempt as a whole can't be coerced and raise as
+        in `cast`."""
+        try:
+            passes = self._passes(s, to_dtype)
+        except _cast_errors():
+            # The backend can't compare against the bounds of the data type
+            passes = None
+
+        if passes is None or passes.all():
+            return self.cast(s, to_dtype), None
+
+        # Nulls can always be cast
+        passes = passes.__or__(s.is_null())
+        error = CastError(self._message(s.dtype, to_dtype), passes)
+        name = s.name
+        kept = (
+            s.to_frame()
+            .with_columns(passes.alias(_COERCE_PASSES_COL))
+            .select(nw.when(nw.col(_COERCE_PASSES_COL)).then(nw.col(name)).alias(name))
+        )
+
+        try:
+            return _checked_cast(kept[name], to_dtype), error
+        except CastError:
+            # Some backends can't represent nulls in the data type, e.g. pandas with
+            # NumPy integer dtypes, so the column fails as a whole
+            raise error
+
+    def cast_expr(
+        self, name: str, from_dtype: NarwhalsDType, to_dtype: _DType
+    ) -> Optional[_CastExpr]:
+        if not self.fusable:
+            return None
+
+        col = nw.col(name)
+        passes = self._passes(col, to_dtype)
+        to_nw_dtype = to_dtype.to_narwhals()
+
+        if passes is None:
+            return _CastExpr(col.cast(to_nw_dtype), None, "", from_dtype, to_nw_dtype)
+
+        # Null out elements that fail so that strict backends don't raise on the cast
+        return _CastExpr(
+            nw.when(passes).then(col).cast(to_nw_dtype),
+            passes,
+            self._message(from_dtype, to_dtype),
+            from_dtype,
+            to_nw_dtype,
+        )
+
+
+class _IdentityCast(_CastStrategy):
+    def cast(self, s: nw.Series, to_dtype: _DType) -> nw.Series:
+        return s
+
+    def cast_expr(
+        self, name: str, from_dtype: NarwhalsDType, to_dtype: _DType
+    ) -> Optional[_CastExpr]:
+        return _CastExpr(nw.col(name), None, "", from_dtype, from_dtype)
 
-    if passes.all():
-        return _checked_cast(s, to_dtype)
 
-    raise CastError(
-        string.Template(
+class _LosslessCast(_CastStrategy):
+    """Casts that cannot lose information, e.g. Int8 -> Int16."""
+
+
+class _DefaultCast(_CastStrategy):
+    """Casts that we know nothing about, so we just let the backend try."""
+
+    fusable = False
+
+
+class _IntToUIntCast(_CastStrategy):
+    def _passes(self, x, to_dtype):
+        return x >= 0
+
+    def _bounds(self, to_dtype):
+        return 0, None
+
+    def _message(self, from_dtype, to_dtype) -> str:
+        return string.Template(
             "Cannot safely cast ${from_dtype} to ${to_dtype}; {summary} rows < allowed min 0"
-        ).safe_substitute({"from_dtype": s.dtype, "to_dtype": to_dtype}),
-        element_passes=passes,
-    )
+        ).safe_substitute({"from_dtype": from_dtype, "to_dtype": to_dtype})
 
 
-def _allowed_max_cast(s: nw.Series, to_dtype: _BoundedDType) -> nw.Series:
-    allowed_max = to_dtype._max
-    passes = s <= allowed_max
+class _AllowedMaxCast(_CastStrategy):
+    def _passes(self, x, to_dtype):
+        return x <= to_dtype._max
 
-    if passes.all():
-        return _checked_cast(s, to_dtype)
+    def _bounds(self, to_dtype):
+        return None, to_dtype._max
 
-    raise CastError(
-        string.Template(
+    def _message(self, from_dtype, to_dtype) -> str:
+        return string.Template(
             "Cannot safely cast ${from_dtype} to ${to_dtype}; {summary} rows > allowed max ${allowed_max}"
         ).safe_substitute(
             {
-                "from_dtype": s.dtype,
+                "from_dtype": from_dtype,
                 "to_dtype": to_dtype,
-                "allowed_max": f"{allowed_max:,}",
+                "allowed_max": f"{to_dtype._max:,}",
             }
-        ),
-        passes,
-    )
+        )
 
 
-def _allowed_range_cast(s: nw.Series, to_dtype: _BoundedDType) -> nw.Series:
-    allowed_min = to_dtype._min
-    allowed_max = to_dtype._max
-    passes = s.is_between(
-        lower_bound=allowed_min, upper_bound=allowed_max, closed="both"
-    )
+class _AllowedRangeCast(_CastStrategy):
+    def _passes(self, x, to_dtype):
+        return x.is_between(
+            lower_bound=to_dtype._min, upper_bound=to_dtype._max, closed="both"
+        )
 
-    if passes.all():
-        return _checked_cast(s, to_dtype)
+    def _bounds(self, to_dtype):
+        return to_dtype._min, to_dtype._max
 
-    raise CastError(
-        string.Template(
+    def _message(self, from_dtype, to_dtype) -> str:
+        return string.Template(
             "Cannot safely cast ${from_dtype} to ${to_dtype}; {summary} rows outside of expected range [${allowed_min}, ${allowed_max}]"
         ).safe_substitute(
             {
-                "from_dtype": s.dtype,
+                "from_dtype": from_dtype,
                 "to_dtype": to_dtype,
-                "allowed_min": f"{allowed_min:,}",
-                "allowed_max": f"{allowed_max:,}",
+                "allowed_min": f"{to_dtype._min:,}",
+                "allowed_max": f"{to_dtype._max:,}",
             }
-        ),
-        passes,
-    )
-
+        )
 
-def _numeric_to_boolean_cast(s: nw.Series, to_dtype: _DType) -> nw.Series:
-    passes = (s == 1) | (s == 0)
 
-    if passes.all():
-        return _checked_cast(s, to_dtype)
+class _NumericToBooleanCast(_CastStrategy):
+    def _passes(self, x, to_dtype):
+        return (x == 1) | (x == 0)
 
-    raise CastError(
-        string.Template(
+    def _message(self, from_dtype, to_dtype) -> str:
+        return string.Template(
             "Cannot safely cast ${from_dtype} to ${to_dtype}; {summary} rows are not either 1 or 0"
-        ).safe_substitute({"from_dtype": s.dtype, "to_dtype": to_dtype}),
-        passes,
-    )
+        ).safe_substitute({"from_dtype": from_dtype, "to_dtype": to_dtype})
 
 
-def _fallback_cast(s: nw.Series, to_dtype: _DType) -> nw.Series:
-    s_cast = _checked_cast(s, to_dtype)
-    passes = s_cast == s
+class _FallbackCast(_CastStrategy):
+    """Casts the values and checks that they round-trip, e.g. Float64 -> Int64."""
 
-    if passes.all():
-        return s_cast
+    def _passes(self, x, to_dtype):
+        # Only used for expressions. Casting floats to integers errors out in strict
+        # backends if there are NaNs or out-of-range values, so check for those (and
+        # for a fractional part) up front instead of comparing after the cast.
+        if to_dtype.is_integer():
+            return x.is_between(to_dtype._min, to_dtype._max, closed="both") & (
+                x.round(0) == x
+            )
+
+        return x.cast(to_dtype.to_narwhals()) == x
 
-    raise CastError(
-        string.Template(
+    def _message(self, from_dtype, to_dtype) -> str:
+        return string.Template(
             "Cannot safely cast ${from_dtype} to ${to_dtype}; different results for {summary} rows"
-        ).safe_substitute({"from_dtype": s.dtype, "to_dtype": to_dtype}),
-        passes,
-    )
+        ).safe_substitute({"from_dtype": from_dtype, "to_dtype": to_dtype})
 
+    def cast(self, s: nw.Series, to_dtype: _DType) -> nw.Series:
+        s_cast = _checked_cast(s, to_dtype)
+        passes = s_cast == s
 
-def _union_cast(cls: type[TypedColumn], s: nw.Series, union: CfUnion) -> nw.Series:
+        if passes.all():
+            return s_cast
+
+        raise CastError(self._message(s.dtype, to_dtype), passes)
+
+
+# What pyarrow can cast from strings to numbers, since its cast errors out instead of
+# nulling out strings that fail to parse
+_INTEGER_PATTERN = r"^[+-]?\d+$"
+_FLOAT_PATTERN = r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$|^[+-]?(?i:inf|infinity|nan)$"
+
+
+def _parse_strings(s: nw.Series, to_dtype: _DType) -> Optional[nw.Series]:
+    """Parses a String Series into numbers, dates, or datetimes with the vectorized
+    parser of its backend. Strings that fail to parse are null. Returns None if the
+    backend has no parser that nulls out failures."""
+    native = s.to_native()
+    fmt = getattr(to_dtype, "format", None)
+    is_temporal = to_dtype == Date or to_dtype == Datetime
+    time_unit = getattr(to_dtype, "time_unit", "us")
+
+    if s.implementation.is_polars():
+        import polars as pl
+
+        if to_dtype == Date:
+            parsed = native.str.to_date(fmt, strict=False)
+        elif to_dtype == Datetime:
+            parsed = native.str.to_datetime(fmt, time_unit=time_unit, strict=False)
+        else:
+            parsed = native.cast(
+                pl.Int64 if to_dtype.is_integer() else pl.Float64, strict=False
+            )
+    elif s.implementation.is_pandas():
+        import pandas as pd
+
+        if is_temporal:
+            parsed = pd.to_datetime(native, format=fmt, errors="coerce")
+        else:
+            parsed = pd.to_numeric(
+                native, errors="coerce", dtype_backend="numpy_nullable"
+            )
+    elif s.implementation.is_pyarrow():
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        if is_temporal:
+            if fmt is None:
+                return None
+
+            parsed = pc.strptime(native, format=fmt, unit=time_unit, error_is_null=True)
+        else:
+            is_integer = to_dtype.is_integer()
+            valid = pc.match_substring_regex(
+                native, _INTEGER_PATTERN if is_integer else _FLOAT_PATTERN
+            )
+            try:
+                parsed = pc.cast(
+                    pc.if_else(valid, native, None),
+                    pa.int64() if is_integer else pa.float64(),
+                )
+            except pa.ArrowInvalid:
+                # Integers that don't fit into 64 bits
+                return None
+    else:
+        return None
+
+    return nw.from_native(parsed, series_only=True).alias(s.name)
+
+
+class _StringParseCast(_CastStrategy):
+    """Parses strings into numbers, dates, or datetimes, see `_parse_strings`. The
+    parsed values are then cast to the exact data type with the strategy for the data
+    type the backend parsed into, e.g. Int64 -> UInt8, so an element fails if it can't
+    be parsed or can't be cast."""
+
+    fusable = False
+
+    def _message(self, from_dtype, to_dtype) -> str:
+        return string.Template(
+            "Cannot parse ${from_dtype} as ${to_dtype}; {summary} rows are not valid ${to_dtype} values"
+        ).safe_substitute({"from_dtype": from_dtype, "to_dtype": to_dtype})
+
+    def _parse(
+        self, s: nw.Series, to_dtype: _DType
+    ) -> tuple[nw.Series, Optional[CastError]]:
+        parsed = _parse_strings(s, to_dtype)
+        if parsed is None:
+            # Let the backend try to cast the column as a whole
+            return _checked_cast(s, to_dtype), None
+
+        parsed_cls = type(_nw_type_to_cf_type(parsed.dtype))
+        s_cast, error = parsed_cls._coerce_cast(parsed, to_dtype)
+
+        passes = parsed.is_null().__invert__().__or__(s.is_null())
+        if error is not None:
+            passes = passes.__and__(error.element_passes)
+
+        if passes.all():
+            return s_cast, None
+
+        return s_cast, CastError(self._message(s.dtype, to_dtype), passes)
+
+    def cast(self, s: nw.Series, to_dtype: _DType) -> nw.Series:
+        s_cast, error = self._parse(s, to_dtype)
+
+        if error is not None:
+            raise error
+
+        return s_cast
+
+    def coerce(
+        self, s: nw.Series, to_dtype: _DType
+    ) -> tuple[nw.Series, Optional[CastError]]:
+        return self._parse(s, to_dtype)
+
+
+_IDENTITY_CAST = _IdentityCast()
+_LOSSLESS_CAST = _LosslessCast()
+_DEFAULT_CAST = _DefaultCast()
+_INT_TO_UINT_CAST = _IntToUIntCast()
+_ALLOWED_MAX_CAST = _AllowedMaxCast()
+_ALLOWED_RANGE_CAST = _AllowedRangeCast()
+_NUMERIC_TO_BOOLEAN_CAST = _NumericToBooleanCast()
+_FALLBACK_CAST = _FallbackCast()
+_STRING_PARSE_CAST = _StringParseCast()
+
+
+# (source class, target class) -> strategy. Strategies only depend on the classes of
+# the data types, not on their parameters, so each `_cast_strategy` chain of comparisons
+# is only walked once per pair.
+_CAST_STRATEGIES: dict[tuple[type, type], _CastStrategy] = {}
+
+
+def _lookup_cast_strategy(
+    from_cls: type[TypedColumn], to_dtype: _DType
+) -> _CastStrategy:
+    # Strategies only depend on the class of the data type cast to, which may also be
+    # passed as the class itself
+    key = (from_cls, to_dtype if isinstance(to_dtype, type) else type(to_dtype))
+    strategy = _CAST_STRATEGIES.get(key)
+    if strategy is None:
+        strategy = _CAST_STRATEGIES[key] = from_cls._cast_strategy(to_dtype)
+
+    return strategy
+
+
+def _all_pass(
+    s: nw.Series, strategies: list[_CastStrategy], to_dtypes: list[TypedColumn]
+) -> dict[int, bool]:
+    """Whether every element of `s` can be cast with each strategy that can tell from
+    an expression, by index, evaluated in a single query over `s`. For integers, range
+    checks are decided from the minimum and maximum, so they only take two reductions
+    no matter how many strategies there are."""
+    col = nw.col(s.name)
+    use_bounds = s.dtype.is_integer()
+    exprs = {}
+    bounded = {}
+    for i, (strategy, to) in enumerate(zip(strategies, to_dtypes)):
+        if not strategy.fusable:
+            continue
+
+        bounds = strategy._bounds(to) if use_bounds else None
+        if bounds is not None:
+            bounded[i] = bounds
+        elif (passes := strategy._passes(col, to)) is not None:
+            exprs[str(i)] = passes.all()
+
+    if len(bounded) > 0:
+        exprs["count"] = col.count()
+        exprs["min"] = col.min()
+        exprs["max"] = col.max()
+
+    if len(exprs) == 0:
+        return {}
+
+    try:
+        row = s.to_frame().select(e.alias(k) for k, e in exprs.items()).row(0)
+    except _cast_errors():
+        # E.g. pyarrow can't compare floats against the bounds of Int64, so let each
+        # strategy cast on its own
+        return {}
+
+    values = dict(zip(exprs.keys(), row))
+    all_pass = {
+        int(k): v for k, v in values.items() if k not in ("count", "min", "max")
+    }
+    for i, (lower, upper) in bounded.items():
+        # There are no bounds if every element is null
+        all_pass[i] = values["count"] == 0 or (
+            (lower is None or values["min"] >= lower)
+            and (upper is None or values["max"] <= upper)
+        )
+
+    return all_pass
+
+
+def _cast_to_first(
+    cls: type[TypedColumn], s: nw.Series, to_dtypes: list[TypedColumn]
+) -> tuple[TypedColumn, nw.Series]:
+    """Casts `s` to the first of `to_dtypes` that every element can be safely cast to.
+    Which casts pass is evaluated for every candidate at once, so the column is scanned
+    once instead of once per candidate. Raises the CastError of the first candidate if
+    none of them pass."""
+    strategies = [_lookup_cast_strategy(cls, to) for to in to_dtypes]
+    all_pass = _all_pass(s, strategies, to_dtypes)
+
+    first_failed = None
     error = None
+    for i, (strategy, to) in enumerate(zip(strategies, to_dtypes)):
+        if all_pass.get(i) is False:
+            if first_failed is None:
+                first_failed = i
+            continue
 
-    for to in union.columns:
         try:
-            return cls._safe_cast(s, to)
+            if all_pass.get(i):
+                return to, _checked_cast(s, to)
+
+            return to, strategy.cast(s, to)
         except CastError as e:
             # Keep the first error instead of the last
-            if error is None:
+            if first_failed is None:
+                first_failed = i
                 error = e
-            continue
 
     # This is fine because we will either return or raise
-    assert error is not None
+    assert first_failed is not None
+    if error is None:
+        # The error of a candidate that is known to fail is only built if no candidate
+        # passes, since it takes another pass over the column
+        to = to_dtypes[first_failed]
+        return to, strategies[first_failed].cast(s, to)
+
     raise error
 
 
+def _union_cast(cls: type[TypedColumn], s: nw.Series, union: CfUnion) -> nw.Series:
+    return _cast_to_first(cls, s, list(union.columns))[1]
+
+
 def _fmt_optional_string(s: str | None) -> str | None:
     return f'"{s}"' if s is not None else None
 
@@ -246,7 +656,7 @@ class Int8(nw.Int8, _BoundedDType, TypedColumn):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Int8.__init__(self)
@@ -264,17 +674,15 @@ class Int8(nw.Int8, _BoundedDType, TypedColumn):
         return nw.Int8
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Int8, s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype in (Int8, Int16, Int32, Int64, Int128, Float32, Float64, String):
-            return _checked_cast(s, to_dtype)
+            return _LOSSLESS_CAST
         elif to_dtype in (UInt8, UInt16, UInt32, UInt64, UInt128):
-            return _int_to_uint_cast(s, to_dtype)
+            return _INT_TO_UINT_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -291,7 +699,7 @@ class Int16(nw.Int16, _BoundedDType, TypedColumn):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Int16.__init__(self)
@@ -309,23 +717,20 @@ class Int16(nw.Int16, _BoundedDType, TypedColumn):
         return nw.Int16
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Int16, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == Int16:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype in (Int32, Int64, Int128, Float32, Float64, String):
-            return _checked_cast(s, to_dtype)
+            return _LOSSLESS_CAST
         elif to_dtype in (UInt16, UInt32, UInt64, UInt128):
-            return _int_to_uint_cast(s, to_dtype)
+            return _INT_TO_UINT_CAST
         elif to_dtype in (Int8, UInt8):
             assert isinstance(to_dtype, _BoundedDType)
-            return _allowed_range_cast(s, to_dtype)
+            return _ALLOWED_RANGE_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -342,7 +747,7 @@ class Int32(nw.Int32, _BoundedDType, TypedColumn):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Int32.__init__(self)
@@ -360,23 +765,20 @@ class Int32(nw.Int32, _BoundedDType, TypedColumn):
         return nw.Int32
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Int32, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == Int32:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype in (Int64, Int128, Float64, String):
-            return _checked_cast(s, to_dtype)
+            return _LOSSLESS_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
         elif to_dtype in (UInt32, UInt64, UInt128):
-            return _int_to_uint_cast(s, to_dtype)
+            return _INT_TO_UINT_CAST
         elif to_dtype in (Int8, Int16, UInt8, UInt16, Float32):
             assert isinstance(to_dtype, _BoundedDType)
-            return _allowed_range_cast(s, to_dtype)
+            return _ALLOWED_RANGE_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -393,7 +795,7 @@ class Int64(nw.Int64, TypedColumn, _BoundedDType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Int64.__init__(self)
@@ -411,23 +813,20 @@ class Int64(nw.Int64, TypedColumn, _BoundedDType):
         return nw.Int64
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Int64, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == Int64:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype == Int128:
-            return _checked_cast(s, to_dtype)
+            return _LOSSLESS_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
         elif to_dtype in (UInt64, UInt128):
-            return _int_to_uint_cast(s, to_dtype)
+            return _INT_TO_UINT_CAST
         elif to_dtype in (Int8, Int16, Int32, UInt8, UInt16, UInt32, Float32, Float64):
             assert isinstance(to_dtype, _BoundedDType)
-            return _allowed_range_cast(s, to_dtype)
+            return _ALLOWED_RANGE_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -444,7 +843,7 @@ class Int128(nw.Int128, TypedColumn, _BoundedDType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Int128.__init__(self)
@@ -462,16 +861,13 @@ class Int128(nw.Int128, TypedColumn, _BoundedDType):
         return nw.Int128
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Int128, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == Int128:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
         elif to_dtype == UInt128:
-            return _int_to_uint_cast(s, to_dtype)
+            return _INT_TO_UINT_CAST
         elif to_dtype in (
             Int8,
             Int16,
@@ -485,9 +881,9 @@ class Int128(nw.Int128, TypedColumn, _BoundedDType):
             Float64,
         ):
             assert isinstance(to_dtype, _BoundedDType)
-            return _allowed_range_cast(s, to_dtype)
+            return _ALLOWED_RANGE_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -504,7 +900,7 @@ class UInt8(nw.UInt8, TypedColumn, _BoundedDType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.UInt8.__init__(self)
@@ -522,12 +918,9 @@ class UInt8(nw.UInt8, TypedColumn, _BoundedDType):
         return nw.UInt8
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(UInt8, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == UInt8:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype in (
             Int16,
             Int32,
@@ -540,14 +933,14 @@ class UInt8(nw.UInt8, TypedColumn, _BoundedDType):
             Float32,
             Float64,
         ):
-            return _checked_cast(s, to_dtype)
+            return _LOSSLESS_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
         elif to_dtype == Int8:
             assert isinstance(to_dtype, _BoundedDType)
-            return _allowed_max_cast(s, to_dtype)
+            return _ALLOWED_MAX_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -564,7 +957,7 @@ class UInt16(nw.UInt16, TypedColumn, _BoundedDType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.UInt16.__init__(self)
@@ -582,12 +975,9 @@ class UInt16(nw.UInt16, TypedColumn, _BoundedDType):
         return nw.UInt16
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(UInt16, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == UInt16:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype in (
             Int32,
             Int64,
@@ -598,14 +988,14 @@ class UInt16(nw.UInt16, TypedColumn, _BoundedDType):
             Float32,
             Float64,
         ):
-            return _checked_cast(s, to_dtype)
+            return _LOSSLESS_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
         elif to_dtype in (Int8, Int16, UInt8):
             assert isinstance(to_dtype, _BoundedDType)
-            return _allowed_max_cast(s, to_dtype)
+            return _ALLOWED_MAX_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -622,7 +1012,7 @@ class UInt32(nw.UInt32, TypedColumn, _BoundedDType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.UInt32.__init__(self)
@@ -640,12 +1030,9 @@ class UInt32(nw.UInt32, TypedColumn, _BoundedDType):
         return nw.UInt32
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(UInt32, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == UInt32:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype in (
             Int64,
             Int128,
@@ -653,14 +1040,14 @@ class UInt32(nw.UInt32, TypedColumn, _BoundedDType):
             UInt128,
             Float64,
         ):
-            return _checked_cast(s, to_dtype)
+            return _LOSSLESS_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
         elif to_dtype in (Int8, Int16, Int32, UInt8, UInt16, Float32):
             assert isinstance(to_dtype, _BoundedDType)
-            return _allowed_max_cast(s, to_dtype)
+            return _ALLOWED_MAX_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -677,7 +1064,7 @@ class UInt64(nw.UInt64, TypedColumn, _BoundedDType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.UInt64.__init__(self)
@@ -695,19 +1082,16 @@ class UInt64(nw.UInt64, TypedColumn, _BoundedDType):
         return nw.UInt64
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(UInt64, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == UInt64:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype in (
             Int128,
             UInt128,
         ):
-            return _checked_cast(s, to_dtype)
+            return _LOSSLESS_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
         elif to_dtype in (
             Int8,
             Int16,
@@ -720,9 +1104,9 @@ class UInt64(nw.UInt64, TypedColumn, _BoundedDType):
             Float64,
         ):
             assert isinstance(to_dtype, _BoundedDType)
-            return _allowed_max_cast(s, to_dtype)
+            return _ALLOWED_MAX_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -739,7 +1123,7 @@ class UInt128(nw.UInt128, TypedColumn, _BoundedDType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.UInt128.__init__(self)
@@ -757,14 +1141,11 @@ class UInt128(nw.UInt128, TypedColumn, _BoundedDType):
         return nw.UInt128
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(UInt128, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == UInt128:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
         elif to_dtype in (
             Int8,
             Int16,
@@ -779,9 +1160,9 @@ class UInt128(nw.UInt128, TypedColumn, _BoundedDType):
             Float64,
         ):
             assert isinstance(to_dtype, _BoundedDType)
-            return _allowed_max_cast(s, to_dtype)
+            return _ALLOWED_MAX_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -802,7 +1183,7 @@ class Float32(nw.Float32, TypedColumn, _BoundedDType):
         allow_nan: bool = False,
         allow_inf: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Float32.__init__(self)
@@ -823,16 +1204,13 @@ class Float32(nw.Float32, TypedColumn, _BoundedDType):
         return nw.Float32
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Float32, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == Float32:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype == Float64:
-            return _checked_cast(s, to_dtype)
+            return _LOSSLESS_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
         elif to_dtype in (
             Int8,
             Int16,
@@ -845,9 +1223,9 @@ class Float32(nw.Float32, TypedColumn, _BoundedDType):
             UInt64,
             UInt128,
         ):
-            return _fallback_cast(s, to_dtype)
+            return _FALLBACK_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -866,7 +1244,7 @@ class Float64(nw.Float64, TypedColumn, _BoundedDType):
         allow_nan: bool = False,
         allow_inf: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Float64.__init__(self)
@@ -887,14 +1265,11 @@ class Float64(nw.Float64, TypedColumn, _BoundedDType):
         return nw.Float64
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Float64, s, to_dtype)
-
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
         if to_dtype == Float64:
-            return s
+            return _IDENTITY_CAST
         elif to_dtype == Boolean:
-            return _numeric_to_boolean_cast(s, to_dtype)
+            return _NUMERIC_TO_BOOLEAN_CAST
         elif to_dtype in (
             Int8,
             Int16,
@@ -908,9 +1283,9 @@ class Float64(nw.Float64, TypedColumn, _BoundedDType):
             UInt128,
             Float32,
         ):
-            return _fallback_cast(s, to_dtype)
+            return _FALLBACK_CAST
 
-        return _checked_cast(s, to_dtype)
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -924,7 +1299,7 @@ class Decimal(nw.Decimal, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Decimal.__init__(self)
@@ -942,10 +1317,8 @@ class Decimal(nw.Decimal, TypedColumn, _DType):
         return nw.Decimal
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Decimal, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -959,7 +1332,7 @@ class Binary(nw.Binary, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Binary.__init__(self)
@@ -977,10 +1350,8 @@ class Binary(nw.Binary, TypedColumn, _DType):
         return nw.Binary
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Binary, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -994,7 +1365,7 @@ class Boolean(nw.Boolean, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Boolean.__init__(self)
@@ -1012,10 +1383,8 @@ class Boolean(nw.Boolean, TypedColumn, _DType):
         return nw.Boolean
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Boolean, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -1029,7 +1398,7 @@ class Categorical(nw.Categorical, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Categorical.__init__(self)
@@ -1047,10 +1416,8 @@ class Categorical(nw.Categorical, TypedColumn, _DType):
         return nw.Categorical
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Categorical, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -1064,7 +1431,7 @@ class Enum(nw.Enum, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Enum.__init__(self)
@@ -1082,10 +1449,8 @@ class Enum(nw.Enum, TypedColumn, _DType):
         return nw.Enum
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Enum, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -1099,8 +1464,9 @@ class Date(nw.Date, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
+        format: Optional[str] = None,
     ):
         nw.Date.__init__(self)
         _Column.__init__(
@@ -1112,15 +1478,15 @@ class Date(nw.Date, TypedColumn, _DType):
             checks=checks,
         )
 
+        self.format = format
+
     @staticmethod
     def to_narwhals():
         return nw.Date
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Date, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -1136,8 +1502,9 @@ class Datetime(nw.Datetime, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
+        format: Optional[str] = None,
     ):
         nw.Datetime.__init__(self, time_unit=time_unit, time_zone=time_zone)
         _Column.__init__(
@@ -1149,6 +1516,8 @@ class Datetime(nw.Datetime, TypedColumn, _DType):
             checks=checks,
         )
 
+        self.format = format
+
         self.to_narwhals = self.__to_narwhals  # type: ignore
         self._to_repr = self.__to_repr  # type: ignore
 
@@ -1171,10 +1540,8 @@ class Datetime(nw.Datetime, TypedColumn, _DType):
         return Datetime(**column_kwargs)
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Datetime, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -1192,7 +1559,7 @@ class Duration(nw.Duration, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Duration.__init__(self, time_unit=time_unit)
@@ -1223,10 +1590,8 @@ class Duration(nw.Duration, TypedColumn, _DType):
         return Duration(**column_kwargs)
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Duration, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -1243,7 +1608,7 @@ class String(nw.String, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.String.__init__(self)
@@ -1261,10 +1626,11 @@ class String(nw.String, TypedColumn, _DType):
         return nw.String
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(String, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        if to_dtype.is_integer() or to_dtype.is_float() or to_dtype in (Date, Datetime):
+            return _STRING_PARSE_CAST
+
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -1278,7 +1644,7 @@ class Object(nw.Object, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Object.__init__(self)
@@ -1296,10 +1662,8 @@ class Object(nw.Object, TypedColumn, _DType):
         return nw.Object
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Object, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -1313,7 +1677,7 @@ class Unknown(nw.Unknown, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Unknown.__init__(self)
@@ -1331,10 +1695,8 @@ class Unknown(nw.Unknown, TypedColumn, _DType):
         return nw.Unknown
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Unknown, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     @staticmethod
     def _to_repr(prefix: str = "") -> str:
@@ -1350,7 +1712,7 @@ class Array(nw.Array, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Array.__init__(self, inner=inner, shape=shape)  # type: ignore
@@ -1375,10 +1737,8 @@ class Array(nw.Array, TypedColumn, _DType):
         )
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Array, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     def _to_repr(self, prefix="") -> str:  # type: ignore
         return f"{prefix}Array({self.inner._to_repr(prefix)})"
@@ -1392,7 +1752,7 @@ class List(nw.List, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.List.__init__(self, inner=inner)  # type: ignore
@@ -1415,10 +1775,8 @@ class List(nw.List, TypedColumn, _DType):
         return List(_nw_type_to_cf_type(nw_dtype.inner), **column_kwargs)
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(List, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     def _to_repr(self, prefix="") -> str:  # type: ignore
         return f"{prefix}List({self.inner._to_repr(prefix)})"
@@ -1441,7 +1799,7 @@ class Struct(nw.Struct, TypedColumn, _DType):
         name: Optional[str] = None,
         nullable: bool = False,
         required: bool = True,
-        cast: bool = False,
+        cast: bool | Literal["coerce"] = False,
         checks: Optional[Iterable[Check]] = None,
     ):
         nw.Struct.__init__(self, fields=fields)  # type: ignore
@@ -1472,10 +1830,8 @@ class Struct(nw.Struct, TypedColumn, _DType):
         return Struct(dct, **column_kwargs)
 
     @staticmethod
-    def _safe_cast(s: nw.Series, to_dtype: _DType | CfUnion) -> nw.Series:
-        if isinstance(to_dtype, CfUnion):
-            return _union_cast(Struct, s, to_dtype)
-        return _checked_cast(s, to_dtype)
+    def _cast_strategy(to_dtype: _DType) -> _CastStrategy:
+        return _DEFAULT_CAST
 
     def _to_repr(self, prefix="") -> str:  # type: ignore
         dct = {}
@@ -1486,7 +1842,17 @@ class Struct(nw.Struct, TypedColumn, _DType):
 
 
 class CfUnion:
-    """Union type.
+    """Union type. By default, the column has to match one of the members as a whole,
+    and the first member it matches, or can be safely cast to, is used. With
+    `per_row=True`, each row only has to match one of the members, i.e. be castable to
+    it and pass its checks, and the column is left as is.
+
+    Parameters
+    ----------
+    *columns : TypedColumn | Iterable[TypedColumn]
+        The members of the union, in order of preference
+    per_row : bool, optional
+        Whether each row may match a different member, by default False
 
     Examples
     --------
@@ -1511,9 +1877,12 @@ class CfUnion:
 
     """
 
-    def __init__(self, *columns: TypedColumn | Iterable[TypedColumn]):
+    def __init__(
+        self, *columns: TypedColumn | Iterable[TypedColumn], per_row: bool = False
+    ):
         self.columns: Iterable[TypedColumn] = _parse_args_into_iterable(columns)
         self.required = True
+        self.per_row = per_row
 
         assert _all_equal(c.name for c in self.columns)
         if not all(c.required for c in self.columns):
@@ -1550,29 +1919,31 @@ class CfUnion:
         return False
 
     def _resolve(self, s: nw.Series, actual_cf_type: TypedColumn):
-        cast_error = None
-        type_error = None
+        # The members that are tried before a member that matches exactly
+        candidates = []
+        exact = None
+        type_error = False
         for c in self.columns:
             if c == actual_cf_type:
-                return c, None
+                exact = c
+                break
+            elif c.cast:
+                candidates.append(c)
             else:
-                if c.cast:
-                    try:
-                        s_cast = actual_cf_type._safe_cast(s, c)
-                        return c, s_cast
-                    except CastError as e:
-                        if cast_error is None:
-                            cast_error = e
-                        continue
-                else:
-                    if type_error is None:
-                        type_error = TypeError()
-
-        if type_error is not None:
-            raise TypeError()
+                type_error = True
+
+        if len(candidates) > 0:
+            try:
+                return _cast_to_first(type(actual_cf_type), s, candidates)
+            except CastError:
+                if exact is None and not type_error:
+                    raise
 
-        if cast_error is not None:
-            raise cast_error
+        if exact is not None:
+            return exact, None
+
+        if type_error:
+            raise TypeError()
 
 
 _NARWHALS_DTYPE_TO_CHECKEDFRAME_DTYPE_MAPPER: dict[
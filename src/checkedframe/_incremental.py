@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import copy
+import functools
+from typing import Any, Literal, NamedTuple, Optional
+
+import narwhals.stable.v1 as nw
+import narwhals.stable.v1.typing as nwt
+
+from ._checks import (
+    Check,
+    _as_columns,
+    _cardinality_ratio,
+    _frame_is_sorted,
+    _is_id,
+    _is_sorted,
+)
+from ._core import (
+    Schema,
+    _collect,
+    _CompiledColumn,
+    _is_row_local,
+    _named_check,
+    _private_interrogate,
+    _raise_if_failed,
+    _run_check,
+    _summarize_results,
+)
+from ._dtypes import CfUnion, TypedColumn
+
+
+class _StatefulCheck(NamedTuple):
+    """A built-in check whose result depends on rows other than the one being checked,
+    but that only needs a small part of the rows validated so far to be evaluated on
+    new rows."""
+
+    check: Check
+    check_name: str
+    series_name: Optional[str]
+    # The columns of the rows validated so far that the check needs, None for all
+    columns: Optional[list[str]]
+    # Whether the check needs every row validated so far, only distinct rows, or just
+    # the last one
+    keep: Literal["all", "unique", "last"]
+
+
+def _stateful_check(
+    check: Check,
+    check_name: str,
+    series_name: Optional[str],
+) -> Optional[_StatefulCheck]:
+    """Returns how to carry the state of `check` across increments, or None if it can't
+    be evaluated incrementally."""
+    if not isinstance(check.func, functools.partial):
+        return None
+
+    func, kwargs = check.func.func, check.func.keywords
+
+    if func is _is_sorted and series_name is not None:
+        # Sorted iff the new rows are sorted and continue from the last row
+        return _StatefulCheck(check, check_name, series_name, [series_name], "last")
+    elif func is _frame_is_sorted:
+        needed = None if kwargs["compare_all"] else _as_columns(kwargs["by"])
+        return _StatefulCheck(check, check_name, series_name, needed, "last")
+    elif func is _is_id:
+        # Every key seen so far is unique, otherwise validation would have failed
+        needed = _as_columns(kwargs["subset"])
+        return _StatefulCheck(check, check_name, series_name, needed, "all")
+    elif func is _cardinality_ratio:
+        # Once a relationship holds, duplicate rows either fail it or don't change it,
+        # so the distinct (left, right, by) combinations are enough
+        by = [] if kwargs["by"] is None else _as_columns(kwargs["by"])
+        needed = list(dict.fromkeys([kwargs["left"], kwargs["right"], *by]))
+        return _StatefulCheck(check, check_name, series_name, needed, "unique")
+
+    return None
+
+
+def _with_checks(
+    col: TypedColumn, checks: list[tuple[str, Check]], relax: bool = False
+) -> TypedColumn:
+    new_col = copy.copy(col)
+    # Names are resolved up front since default names depend on the position of a check
+    new_col.checks = [_named_check(copy.copy(check), name) for name, check in checks]
+
+    if relax:
+        # The built-in checks are row-local, so they never have to be run again
+        new_col.nullable = True
+        if hasattr(new_col, "allow_nan"):
+            new_col.allow_nan = True
+
+        if hasattr(new_col, "allow_inf"):
+            new_col.allow_inf = True
+
+    return new_col
+
+
+def _split_column(
+    compiled: _CompiledColumn, stateful: list[_StatefulCheck]
+) -> tuple[TypedColumn | CfUnion, TypedColumn | CfUnion, bool]:
+    """Splits the checks of a column into the ones that only need the new rows and the
+    ones that need every row, and returns a column with each. The last element is
+    whether there are any of the latter. Checks that can be evaluated incrementally are
+    added to `stateful` instead."""
+    if compiled.members:
+        # Whether a member holds depends on the other members, so only row-local
+        # checks are split off
+        row_members = []
+        full_members = []
+        for member in compiled.members:
+            assert isinstance(member.column, TypedColumn)
+            row_checks = [(n, c) for n, c in member.checks if _is_row_local(c)]
+            full_checks = [(n, c) for n, c in member.checks if not _is_row_local(c)]
+            row_members.append(_with_checks(member.column, row_checks))
+            full_members.append(_with_checks(member.column, full_checks, relax=True))
+
+        has_full = any(len(m.checks) > 0 for m in full_members)
+        if compiled.column.per_row:
+            # A row has to pass every check of a single member, so members with only
+            # their row-local checks never fail a row that the whole union passes
+            return CfUnion(*row_members, per_row=True), compiled.column, has_full
+
+        return CfUnion(*row_members), CfUnion(*full_members), has_full
+
+    assert isinstance(compiled.column, TypedColumn)
+    row_checks = []
+    full_checks = []
+    for check_name, check in compiled.checks:
+        if _is_row_local(check):
+            row_checks.append((check_name, check))
+        elif (state := _stateful_check(check, check_name, compiled.name)) is not None:
+            stateful.append(state)
+        else:
+            full_checks.append((check_name, check))
+
+    return (
+        _with_checks(compiled.column, row_checks),
+        _with_checks(compiled.column, full_checks, relax=True),
+        len(full_checks) > 0,
+    )
+
+
+def _split_schema(
+    schema: Schema,
+) -> tuple[Schema, list[_StatefulCheck], Optional[Schema]]:
+    """Splits `schema` into a schema to run on the new rows, the checks to evaluate
+    incrementally, and a schema to run on every row, if there is anything that needs
+    every row."""
+    stateful: list[_StatefulCheck] = []
+
+    row_columns: dict[str, TypedColumn | CfUnion] = {}
+    full_columns: dict[str, TypedColumn | CfUnion] = {}
+    has_full_checks = False
+    for compiled in schema._compiled.columns:
+        row_col, full_col, has_full = _split_column(compiled, stateful)
+        row_columns[compiled.name] = row_col
+        full_columns[compiled.name] = full_col
+        has_full_checks = has_full_checks or has_full
+
+    row_checks = []
+    full_checks = []
+    for check_name, check in schema._compiled.checks:
+        if _is_row_local(check):
+            row_checks.append(_named_check(copy.copy(check), check_name))
+        elif (state := _stateful_check(check, check_name, None)) is not None:
+            stateful.append(state)
+        else:
+            full_checks.append(_named_check(copy.copy(check), check_name))
+
+    has_full_checks = has_full_checks or len(full_checks) > 0
+
+    return (
+        Schema(row_columns, row_checks),
+        stateful,
+        Schema(full_columns, full_checks) if has_full_checks else None,
+    )
+
+
+class IncrementalValidator:
+    """Validates an append-only table as it grows, only checking the rows added since
+    the last call. Checks that compare rows against each other carry just enough of the
+    rows validated so far to give the same result as validating the whole table:
+
+    - ``is_sorted`` and ``is_sorted_by`` keep the last row
+    - ``is_id`` keeps the keys
+    - ``cardinality_ratio`` keeps the distinct combinations of its columns
+
+    Every other check that isn't row-local, e.g. a custom check or a check comparing
+    against an aggregate, is run on the whole table.
+
+    Parameters
+    ----------
+    schema : type[Schema] | Schema
+        The schema to validate against
+
+    Attributes
+    ----------
+    n_rows : int
+        The number of rows validated so far, i.e. the watermark. Rows before it are
+        skipped.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        import checkedframe as cf
+        import polars as pl
+
+
+        class MySchema(cf.Schema):
+            id = cf.Int64(checks=[cf.Check.is_sorted()])
+
+
+        validator = cf.IncrementalValidator(MySchema)
+        validator.validate(pl.DataFrame({"id": [1, 2]}))
+        # Only the last row is checked
+        validator.validate(pl.DataFrame({"id": [1, 2, 3]}))
+    """
+
+    def __init__(self, schema: type[Schema] | Schema):
+        self.schema = (
+            schema._parse_into_schema() if isinstance(schema, type) else schema
+        )
+        self.n_rows = 0
+        self._row_schema, self._stateful, self._full_schema = _split_schema(self.schema)
+        self._states: list[Optional[nw.DataFrame]] = [None] * len(self._stateful)
+
+    def reset(self) -> None:
+        """Forgets every row validated so far."""
+        self.n_rows = 0
+        self._states = [None] * len(self._stateful)
+
+    def _evaluate(self, new: nw.DataFrame) -> tuple[list[Any], list[nw.DataFrame]]:
+        results = []
+        contexts = []
+        for stateful, state in zip(self._stateful, self._states):
+            context = new
+            if stateful.columns is not None:
+                context = new.select(*[c for c in stateful.columns if c in new.columns])
+
+            n_prior = 0
+            if state is not None:
+                n_prior = state.shape[0]
+                context = nw.maybe_reset_index(nw.concat([state, context]))
+
+            result = _run_check(
+                stateful.check,
+                stateful.check_name,
+                context,
+                stateful.series_name,
+            )
+            if not result.is_scalar:
+                # Only the results of the new rows are reported
+                result.res = nw.maybe_reset_index(result.res[n_prior:])
+
+            results.append(result)
+            contexts.append(context)
+
+        return results, contexts
+
+    def validate(
+        self, df: nwt.IntoFrameT, engine: Optional[str] = None
+    ) -> nwt.IntoFrameT:
+        """Validates the rows of `df` past the watermark and moves the watermark to the
+        end of `df`. If validation fails, the watermark stays where it is.
+
+        Parameters
+        ----------
+        df : nwt.IntoFrameT
+            The whole table, i.e. the rows validated so far followed by the new rows
+        engine : Optional[str], optional
+            The engine to use for collecting LazyFrames, by default None
+
+        Returns
+        -------
+        nwt.IntoFrameT
+            The new rows, validated and cast
+
+        Raises
+        ------
+        SchemaError
+            If the new rows, or the whole table for checks that need it, fail
+            validation
+        """
+        nw_df = nw.from_native(df)
+        is_lazy = isinstance(nw_df, nw.LazyFrame)
+
+        if is_lazy:
+            new = _collect(nw_df.gather_every(1, offset=self.n_rows), engine)
+        else:
+            new = nw.maybe_reset_index(nw_df[self.n_rows :])
+
+        res = _private_interrogate(self._row_schema, new, engine=engine, mask=False)
+        out = res.df
+        assert isinstance(out, nw.DataFrame)
+
+        summary = res.summary
+        if isinstance(summary, nw.LazyFrame):
+            summary = _collect(summary, engine)
+
+        contexts: list[nw.DataFrame] = []
+        if len(self._stateful) > 0:
+            results, contexts = self._evaluate(out)
+            # Counts have to be of the same data type to be concatenated
+            summary = nw.concat(
+                [
+                    s.with_columns(nw.col("n_rows", "n_failed").cast(nw.Int64))
+                    for s in (summary, _collect(_summarize_results(out, results)))
+                ]
+            )
+
+        _raise_if_failed(self.schema, summary, engine)
+
+        if self._full_schema is not None:
+            full = _private_interrogate(
+                self._full_schema, df, engine=engine, mask=False
+            )
+            _raise_if_failed(self.schema, full.summary, engine)
+
+        for i, (stateful, context) in enumerate(zip(self._stateful, contexts)):
+            if stateful.keep == "last":
+                context = context.tail(1)
+            elif stateful.keep == "unique":
+                context = context.unique()
+
+            self._states[i] = nw.maybe_reset_index(context)
+
+        self.n_rows += out.shape[0]
+
+        return out.lazy().to_native() if is_lazy else out.to_native()
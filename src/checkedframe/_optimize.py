@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, Optional
+
+import narwhals.stable.v1 as nw
+import narwhals.stable.v1.typing as nwt
+
+from ._core import Schema, _collect, _CompiledColumn, _validate
+from ._dtypes import (
+    Float32,
+    Float64,
+    Int8,
+    Int16,
+    Int32,
+    Int64,
+    Int128,
+    TypedColumn,
+    UInt8,
+    UInt16,
+    UInt32,
+    UInt64,
+    UInt128,
+    _IdentityCast,
+    _lookup_cast_strategy,
+    _LosslessCast,
+)
+
+# Data types that a column can be shrunk to, from smallest to largest, along with the
+# number of bytes per element
+_SIGNED = [(Int8, 1), (Int16, 2), (Int32, 4), (Int64, 8), (Int128, 16)]
+_UNSIGNED = [(UInt8, 1), (UInt16, 2), (UInt32, 4), (UInt64, 8), (UInt128, 16)]
+_FLOATS = [(Float32, 4), (Float64, 8)]
+
+
+@dataclasses.dataclass
+class OptimizationResult:
+    """
+    Attributes
+    ----------
+    df : nwt.IntoFrameT
+        The validated DataFrame with its integer and float columns shrunk
+    summary : nwt.IntoDataFrame
+        A DataFrame of `column`, `from_dtype`, `to_dtype`, and `bytes_saved` with one
+        row per integer or float column of the schema. `from_dtype` and `to_dtype` are
+        the same for columns that could not be shrunk
+    bytes_saved : int
+        The number of bytes saved over every column, not counting validity bitmaps
+    """
+
+    df: nwt.IntoFrameT
+    summary: nwt.IntoDataFrame
+    bytes_saved: int
+
+
+def _family(dtype: Any) -> Optional[list[tuple[type[TypedColumn], int]]]:
+    if dtype.is_float():
+        return _FLOATS
+    elif dtype.is_unsigned_integer():
+        return _UNSIGNED
+    elif dtype.is_signed_integer():
+        return _SIGNED
+
+    return None
+
+
+def _is_allowed(compiled: _CompiledColumn, candidate: TypedColumn) -> bool:
+    """Whether the schema still accepts a column of the data type of `candidate`, i.e.
+    it matches the column (or a member of a union) exactly or is always safely cast to
+    it."""
+    for c in compiled.members or (compiled,):
+        column = c.column
+        if candidate == column:
+            return True
+
+        if column.cast and isinstance(
+            _lookup_cast_strategy(type(candidate), column),  # type: ignore[arg-type]
+            (_IdentityCast, _LosslessCast),
+        ):
+            return True
+
+    return False
+
+
+def _optimize(
+    schema: Schema, df: nwt.IntoFrameT, engine: Optional[str] = None
+) -> OptimizationResult:
+    nw_df = nw.from_native(_validate(schema, df, engine=engine))
+    df_schema = nw_df.collect_schema()
+
+    # The smaller data types that each integer / float column may be shrunk to
+    candidates: dict[str, list[tuple[TypedColumn, int]]] = {}
+    widths: dict[str, int] = {}
+    for compiled in schema._compiled.columns:
+        name = compiled.name
+        if name not in df_schema or (family := _family(df_schema[name])) is None:
+            continue
+
+        dtype = df_schema[name]
+        width = next((w for cls, w in family if dtype == cls), None)
+        if width is None:
+            continue
+
+        widths[name] = width
+        candidates[name] = [
+            (candidate, w)
+            for candidate, w in ((cls(), w) for cls, w in family if w < width)
+            if _is_allowed(compiled, candidate)
+        ]
+
+    # The observed range of every column, in a single aggregation
+    col = nw.col
+    exprs = [nw.len().alias("len")]
+    for name, cands in candidates.items():
+        if len(cands) == 0:
+            continue
+
+        exprs.append(col(name).count().alias(f"{name}_count"))
+        if df_schema[name].is_float():
+            # Floats are only shrunk if every value survives the round trip
+            exprs.append(
+                (
+                    (col(name).cast(nw.Float32).cast(df_schema[name]) == col(name))
+                    | col(name).is_nan()
+                )
+                .all()
+                .alias(f"{name}_round_trips")
+            )
+        else:
+            exprs.append(col(name).min().alias(f"{name}_min"))
+            exprs.append(col(name).max().alias(f"{name}_max"))
+
+    stats = _collect(nw_df.lazy().select(*exprs), engine).rows(named=True)[0]
+    n_rows = stats["len"]
+
+    shrunk = {}
+    rows: dict[str, list[Any]] = {
+        "column": [],
+        "from_dtype": [],
+        "to_dtype": [],
+        "bytes_saved": [],
+    }
+    for name, cands in candidates.items():
+        to_dtype, to_width = df_schema[name], widths[name]
+        for candidate, width in cands:
+            if stats[f"{name}_count"] == 0:
+                fits = True
+            elif df_schema[name].is_float():
+                fits = bool(stats[f"{name}_round_trips"])
+            else:
+                fits = (
+                    stats[f"{name}_min"] >= candidate._min  # type: ignore[attr-defined]
+                    and stats[f"{name}_max"] <= candidate._max  # type: ignore[attr-defined]
+                )
+
+            if fits:
+                to_dtype, to_width = candidate.to_narwhals(), width
+                shrunk[name] = to_dtype
+                break
+
+        rows["column"].append(name)
+        rows["from_dtype"].append(str(df_schema[name]))
+        rows["to_dtype"].append(str(to_dtype))
+        rows["bytes_saved"].append(n_rows * (widths[name] - to_width))
+
+    if len(shrunk) > 0:
+        nw_df = nw_df.with_columns(
+            col(name).cast(dtype) for name, dtype in shrunk.items()
+        )
+
+    return OptimizationResult(
+        df=nw_df.to_native(),
+        summary=nw.from_dict(
+            rows,
+            schema={
+                "column": nw.String,
+                "from_dtype": nw.String,
+                "to_dtype": nw.String,
+                "bytes_saved": nw.Int64,
+            },
+            native_namespace=nw.get_native_namespace(nw_df),
+        ).to_native(),
+        bytes_saved=sum(rows["bytes_saved"]),
+    )
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import operator
+from typing import Any, Callable, NamedTuple, Optional
+
+import narwhals.stable.v1 as nw
+
+from ._checks import Check, _ge, _gt, _is_between, _is_in, _is_not_null, _le, _lt
+from ._core import (
+    _PLAN_CACHE,
+    Schema,
+    _CompiledColumn,
+    _is_row_local,
+    _raise_if_failed,
+    _summarize_results,
+    _validate,
+    _validate_batches,
+)
+from .exceptions import SchemaError
+
+# Comparisons against a bound, and whether the bound is a lower bound
+_COMPARISONS: dict[Callable, tuple[Callable[[Any, Any], bool], bool]] = {
+    _lt: (operator.lt, False),
+    _le: (operator.le, False),
+    _gt: (operator.gt, True),
+    _ge: (operator.ge, True),
+}
+
+
+class _Statistics(NamedTuple):
+    """The statistics of a column chunk. `min` and `max` ignore nulls and are None if
+    every value is null."""
+
+    null_count: int
+    min: Any
+    max: Any
+
+
+def _unwrap(check: Check) -> tuple[Any, dict[str, Any]]:
+    if isinstance(check.func, functools.partial):
+        return check.func.func, check.func.keywords
+
+    return check.func, {}
+
+
+def _decide(check: Check, stats: _Statistics) -> Optional[bool]:
+    """Whether the statistics of a column chunk prove that `check` passes for every row
+    (True) or fails for some (False), or None if they don't tell. The minimum and
+    maximum are only bounds, e.g. writers may truncate strings or round the maximum up,
+    so a failure is only proven if even the most favorable value within the bounds
+    fails."""
+    func, kwargs = _unwrap(check)
+
+    if func is _is_not_null:
+        # The null count is exact
+        return stats.null_count == 0
+
+    if stats.min is None:
+        # Every value is null, and nulls pass every other check, see `_failure_count`
+        return True if func in _COMPARISONS or func in (_is_between, _is_in) else None
+
+    if func in _COMPARISONS:
+        compare, is_lower_bound = _COMPARISONS[func]
+        other = kwargs["other"]
+        # Strings are column names
+        if isinstance(other, (str, nw.Expr)):
+            return None
+
+        # Every value is at least the minimum and at most the maximum, so a lower bound
+        # holds for every value if it holds for the minimum, and fails for every
+        # non-null value if it fails for the maximum, and vice versa
+        if compare(stats.min if is_lower_bound else stats.max, other):
+            return True
+        elif not compare(stats.max if is_lower_bound else stats.min, other):
+            return False
+
+        return None
+    elif func is _is_between:
+        lower, upper = kwargs["lower_bound"], kwargs["upper_bound"]
+        if isinstance(lower, (str, nw.Expr)) or isinstance(upper, (str, nw.Expr)):
+            return None
+
+        closed = kwargs["closed"]
+        lower_op = operator.le if closed in ("both", "left") else operator.lt
+        upper_op = operator.le if closed in ("both", "right") else operator.lt
+
+        if lower_op(lower, stats.min) and upper_op(stats.max, upper):
+            return True
+        elif not lower_op(lower, stats.max) or not upper_op(stats.min, upper):
+            # Every value is below the lower bound or above the upper bound
+            return False
+
+        return None
+    elif func is _is_in:
+        # Values between the minimum and the maximum are unknown
+        if stats.min == stats.max and stats.min in kwargs["other"]:
+            return True
+
+        return None
+
+    return None
+
+
+def _decide_row_group(
+    columns: list[_CompiledColumn],
+    df_schema: dict[str, Any],
+    statistics: dict[str, _Statistics],
+) -> tuple[bool, list[tuple[str, str, str]]]:
+    """Decides the checks of every column for a row group. Returns whether every check
+    is proven to pass and the (column, check name, description) of every check that is
+    proven to fail."""
+    all_pass = True
+    failures = []
+    for compiled in columns:
+        if len(compiled.members) > 0:
+            # Which member of a union applies may depend on the data
+            all_pass = False
+            continue
+
+        checks = [(c.name, c) for c in compiled.builtin_checks] + list(compiled.checks)
+        if len(checks) == 0:
+            continue
+
+        stats = statistics.get(compiled.name)
+        if stats is None or df_schema[compiled.name] != compiled.dtype:
+            # Statistics of data that still has to be cast don't tell anything about the
+            # data that is checked
+            all_pass = False
+            continue
+
+        for check_name, check in checks:
+            try:
+                decision = _decide(check, stats)
+            except TypeError:
+                # The statistics can't be compared to the arguments of the check
+                decision = None
+
+            if (
+                decision
+                and compiled.dtype.is_float()
+                and _unwrap(check)[0] is not _is_not_null
+            ):
+                # Statistics ignore NaNs, so checks of floats can only be proven to
+                # fail
+                decision = None
+
+            if decision is False:
+                failures.append((compiled.name, check_name, check.description or ""))
+            elif decision is None:
+                all_pass = False
+
+    return all_pass, failures
+
+
+def _row_group_statistics(row_group: Any) -> dict[str, _Statistics]:
+    statistics = {}
+    for i in range(row_group.num_columns):
+        column = row_group.column(i)
+        stats = column.statistics
+        # Nested columns have a path of several parts and aren't decided
+        if "." in column.path_in_schema or stats is None or not stats.has_null_count:
+            continue
+
+        if stats.has_min_max:
+            statistics[column.path_in_schema] = _Statistics(
+                stats.null_count, stats.min, stats.max
+            )
+        elif stats.null_count == row_group.num_rows:
+            statistics[column.path_in_schema] = _Statistics(
+                stats.null_count, None, None
+            )
+
+    return statistics
+
+
+def _generate_error_message(
+    failures: dict[tuple[str, str, str], list[int]],
+    columns: list[str],
+    n_row_groups: int,
+) -> str:
+    by_column: dict[str, list[str]] = {c: [] for c in columns}
+    for (column, check_name, description), row_groups in failures.items():
+        indices = ", ".join(str(i) for i in row_groups)
+        by_column.setdefault(column, []).append(
+            f"{check_name} failed for row group(s) {indices}: {description}"
+        )
+
+    lines = [
+        (
+            f"Found {len(failures)} error(s) in the statistics of {n_row_groups:,} "
+            "row group(s)"
+        )
+    ]
+    for column, errors in by_column.items():
+        if len(errors) == 0:
+            continue
+
+        lines.append(f"  {column}: {len(errors)} error(s)")
+        lines.extend(f"    - {e}" for e in errors)
+
+    return "\n".join(lines)
+
+
+def _validate_parquet(
+    schema: Schema,
+    source: Any,
+    engine: Optional[str] = None,
+    n_threads: Optional[int] = None,
+) -> Any:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    pf = pq.ParquetFile(source)
+    empty = nw.from_native(pf.schema_arrow.empty_table())
+    df_schema = empty.collect_schema()
+    plan = _PLAN_CACHE.get(schema, df_schema)
+
+    # Missing columns and data types only depend on the schema of the file. Reading no
+    # columns gives a frame with just the number of rows to count the failures with.
+    if len(plan.static_failures) > 0:
+        _raise_if_failed(
+            schema,
+            _summarize_results(
+                nw.from_native(pf.read(columns=[])),
+                [dataclasses.replace(r) for r in plan.static_failures],
+            ),
+        )
+
+    columns = [c for c in schema._compiled.columns if c.name in df_schema]
+    n_row_groups = pf.num_row_groups
+
+    statuses = []
+    failures: dict[tuple[str, str, str], list[int]] = {}
+    for i in range(n_row_groups):
+        all_pass, row_group_failures = _decide_row_group(
+            columns, dict(df_schema), _row_group_statistics(pf.metadata.row_group(i))
+        )
+        for failure in row_group_failures:
+            failures.setdefault(failure, []).append(i)
+
+        statuses.append("passed" if all_pass else "scanned")
+
+    # Failures proven from statistics are reported without reading any data
+    if len(failures) > 0:
+        raise SchemaError(
+            functools.partial(
+                _generate_error_message, failures, schema.columns(), n_row_groups
+            )
+        )
+
+    # Frame checks and checks that aren't row-local may depend on rows of other row
+    # groups, so every row group has to be read at once
+    row_local = len(schema._compiled.checks) == 0 and all(
+        _is_row_local(check)
+        for compiled in schema._compiled.columns
+        for c in (compiled, *compiled.members)
+        for _, check in c.checks
+    )
+
+    if row_local:
+        to_scan = [i for i, status in enumerate(statuses) if status == "scanned"]
+        # Row groups are read one at a time, and only the columns that are checked
+        for _ in _validate_batches(
+            schema,
+            (pf.read_row_group(i, columns=plan.projection) for i in to_scan),
+            engine=engine,
+            n_threads=n_threads,
+        ):
+            pass
+    else:
+        statuses = ["scanned"] * n_row_groups
+        _validate(
+            schema,
+            pf.read(columns=plan.projection),
+            engine=engine,
+            n_threads=n_threads,
+        )
+
+    return pa.table(
+        {
+            "row_group": list(range(n_row_groups)),
+            "n_rows": [pf.metadata.row_group(i).num_rows for i in range(n_row_groups)],
+            "status": statuses,
+        }
+    )
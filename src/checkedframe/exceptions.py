@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from ._core import FailureSample
 
 
 class CastError(Exception):
@@ -12,4 +15,54 @@ class CastError(Exception):
 
 
 class SchemaError(Exception):
-    """Raised when the given DataFrame does not match the given Schema."""
+    """Raised when the given DataFrame does not match the given Schema. The error
+    message is only rendered when the error is formatted, e.g. by `str()`, so catching
+    the error and only looking at `summary` is cheap even for very large schemas.
+
+    Attributes
+    ----------
+    summary : Optional[IntoDataFrame]
+        The number and percentage of failures of every check, with the same columns as
+        `InterrogationResult.summary`, if raised by validation
+    samples : list[FailureSample]
+        Sample rows of each failing check, if validated with `n_samples`
+    """
+
+    def __init__(
+        self,
+        msg: str | Callable[[], str],
+        samples: Optional[list[FailureSample]] = None,
+        summary: Any = None,
+    ):
+        super().__init__(msg)
+
+        self._msg = msg
+        self._args: Optional[tuple[Any, ...]] = None
+        self.samples = [] if samples is None else samples
+        self.summary = summary
+
+    def __str__(self) -> str:
+        if self._args is not None:
+            # Like `Exception.__str__` once `args` has been replaced
+            return str(self._args[0]) if len(self._args) == 1 else str(self._args)
+
+        if callable(self._msg):
+            self._msg = self._msg()
+
+        return self._msg
+
+    @property  # type: ignore[override]
+    def args(self) -> tuple[Any, ...]:
+        # The message is rendered on first access, like in `__str__`
+        return (str(self),) if self._args is None else self._args
+
+    @args.setter
+    def args(self, value: Any) -> None:
+        # Libraries add context to errors by replacing their `args`
+        self._args = tuple(value)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __reduce__(self):
+        return (type(self), (str(self), self.samples, self.summary))
@@ -1,6 +1,10 @@
+from datetime import date, datetime
+
 import narwhals as nw
+import pandas as pd
 import polars as pl
 import polars.testing
+import pyarrow as pa
 import pytest
 
 import checkedframe as cf
@@ -146,3 +150,200 @@ def test_union():
     # Test it correctly raises
     with pytest.raises(cf.exceptions.CastError):
         s_cast = cf.Float32._safe_cast(s, cf.Union(cf.Int32(), cf.Int64()))
+
+
+@pytest.mark.parametrize("df_type", [pl.DataFrame, pd.DataFrame])
+def test_union_first_passing_member(df_type):
+    class MySchema(cf.Schema):
+        a = cf.Union(
+            cf.UInt8(cast=True),
+            cf.Int8(cast=True),
+            cf.Int16(cast=True),
+            cf.Int32(cast=True),
+        )
+
+    out = nw.from_native(MySchema.validate(df_type({"a": [1, -5, 300]})))
+    assert out.schema["a"] == nw.Int16
+
+    # The error of the first member is raised if no member passes
+    with pytest.raises(cf.exceptions.SchemaError, match="Int64 to UInt8"):
+        MySchema.validate(df_type({"a": [1, -5, 2**40]}))
+
+
+@pytest.mark.parametrize("df_type", [pl.DataFrame, pd.DataFrame, pl.LazyFrame])
+def test_union_per_row(df_type):
+    class MySchema(cf.Schema):
+        a = cf.Union(
+            cf.UInt8(cast=True, checks=[cf.Check.lt(100)]),
+            cf.Int8(cast=True),
+            per_row=True,
+        )
+
+    df = df_type({"a": [1, 200, -5, 150, -200, 50]})
+
+    res = MySchema.interrogate(df)
+    summary = nw.from_native(res.summary).lazy().collect()
+    assert summary.select("column", "operation", "n_failed").rows() == [
+        ("a", "existence", 0),
+        ("a", "dtype", 3),
+    ]
+
+    # The column is left as is, since rows may match different members
+    out = nw.from_native(res.df).lazy().collect()
+    assert out.schema["a"] == nw.Int64
+
+    out = nw.from_native(MySchema.filter(df)).lazy().collect()
+    assert out["a"].to_list() == [1, -5, 50]
+
+
+@pytest.mark.parametrize("engine", [pl.DataFrame, pd.DataFrame])
+def test_fused_casts(engine):
+    class S(cf.Schema):
+        a = cf.Int8(cast=True, checks=[cf.Check.gt(0)])
+        b = cf.Int64(cast=True, checks=[cf.Check.gt(0)])
+        c = cf.UInt8(cast=True)
+        d = cf.Float32(cast=True)
+        e = cf.Boolean(cast=True)
+
+        @cf.Check
+        def check_a_is_cast(df: cf.DataFrame) -> bool:
+            return df["a"].dtype == cf.Int8
+
+    df = engine(
+        {
+            "a": [1, 2, 3],
+            "b": [1.0, 2.0, 3.5],
+            "c": [1, -1, 3],
+            "d": [1.0, 2.0, 3.0],
+            "e": [0, 1, 1],
+        }
+    )
+
+    expected = nw.from_native(S.interrogate(df).summary).sort("column", "operation")
+    res = S.interrogate(df, fuse_casts=True)
+    actual = nw.from_native(res.summary).sort("column", "operation")
+
+    assert actual.rows() == expected.rows()
+    assert nw.from_native(res.df).schema == nw.from_native(S.interrogate(df).df).schema
+
+
+@pytest.mark.parametrize("mask", [True, False])
+def test_fused_casts_lazy(mask):
+    class S(cf.Schema):
+        a = cf.UInt8(cast=True, checks=[cf.Check.lt(3)])
+        b = cf.Int64(cast=True, checks=[cf.Check.lt(3)])
+
+    data = {"a": [1, -1, 5], "b": [1, 2, 5]}
+
+    expected = S.interrogate(pl.DataFrame(data), fuse_casts=True, mask=mask)
+    res = S.interrogate(pl.LazyFrame(data), fuse_casts=True, mask=mask)
+
+    # The checks of a column that fails to cast aren't run, whether eager or lazy
+    assert res.summary.collect().rows() == expected.summary.rows()
+    assert ("a", "less_than") not in expected.summary.select(
+        "column", "operation"
+    ).rows()
+    if mask:
+        assert res.is_good.collect()["is_good"].to_list() == (
+            expected.is_good.to_list()
+        )
+
+    for df in (pl.DataFrame(data), pl.LazyFrame(data)):
+        with pytest.raises(cf.exceptions.SchemaError) as e:
+            S.validate(df, fuse_casts=True, fail_fast=True)
+
+        assert "a: 1 error(s)" in str(e.value)
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, pl.DataFrame])
+def test_cast_many_columns(df_type):
+    class MySchema(cf.Schema):
+        a = cf.Int64(cast=True)
+        b = cf.UInt8(cast=True, checks=[cf.Check.lt(3)])
+        c = cf.Float64(cast=True)
+        d = cf.UInt8(cast=True, checks=[cf.Check.lt(3)])
+
+    df = df_type({"a": [1, 2, 3], "b": [1, 2, -1], "c": [1, 2, 3], "d": [1, 2, 3]})
+
+    summary = nw.from_native(MySchema.interrogate(df).summary)
+    assert summary.select("column", "operation", "n_failed").rows() == [
+        ("a", "existence", 0),
+        ("a", "`nullable=False`", 0),
+        ("b", "existence", 0),
+        ("b", "cast", 1),
+        ("c", "existence", 0),
+        ("c", "`nullable=False`", 0),
+        ("c", "`allow_nan=False`", 0),
+        ("c", "`allow_inf=False`", 0),
+        ("d", "existence", 0),
+        ("d", "`nullable=False`", 0),
+        ("d", "less_than", 1),
+    ]
+
+    # Every column that could be cast is cast
+    out = nw.from_native(MySchema.filter(df))
+    assert out.schema["a"] == nw.Int64
+    assert out.schema["c"] == nw.Float64
+    assert out.schema["d"] == nw.UInt8
+
+
+@pytest.mark.parametrize("df_type", [pl.DataFrame, pl.LazyFrame])
+def test_coerce(df_type):
+    class MySchema(cf.Schema):
+        a = cf.UInt8(cast="coerce", nullable=True, checks=[cf.Check.lt(100)])
+        b = cf.Int32(cast="coerce")
+
+    df = df_type({"a": [1, -1, 300, 150, None], "b": [1, 2, 3, 4, 5]})
+
+    res = MySchema.interrogate(df)
+    summary = nw.from_native(res.summary).lazy().collect()
+    assert summary.select("column", "operation", "n_failed").rows() == [
+        ("a", "existence", 0),
+        ("a", "cast", 2),
+        ("a", "less_than", 1),
+        ("b", "existence", 0),
+        ("b", "cast", 0),
+        ("b", "`nullable=False`", 0),
+    ]
+
+    out = nw.from_native(res.df).lazy().collect()
+    assert out.schema["a"] == nw.UInt8
+    assert out["a"].to_list() == [1, None, None, 150, None]
+
+    # Coerced casts keep the checks of the column even if casts are fused
+    fused = nw.from_native(MySchema.interrogate(df, fuse_casts=True).summary)
+    fused = fused.lazy().collect()
+    assert fused.rows() == summary.rows()
+
+
+@pytest.mark.parametrize("df_type", [pl.DataFrame, pd.DataFrame, pa.table])
+def test_parse_strings(df_type):
+    class MySchema(cf.Schema):
+        a = cf.UInt8(cast=True)
+        b = cf.Float64(cast=True)
+        c = cf.Date(cast=True, format="%Y-%m-%d")
+        d = cf.Datetime("ms", cast=True, format="%Y-%m-%d %H:%M")
+
+    data = {
+        "a": ["1", "x", "300", "4"],
+        "b": ["1.5", "-2", "abc", "1e3"],
+        "c": ["2024-01-05", "05/01/2024", "2024-01-06", "2024-02-01"],
+        "d": ["2024-01-05 10:00", "bad", "2024-01-05 11:30", "2024-01-06 00:00"],
+    }
+
+    summary = nw.from_native(MySchema.interrogate(df_type(data)).summary)
+    assert summary.filter(nw.col("operation") == "cast").select(
+        "column", "n_failed"
+    ).rows() == [("a", 2), ("b", 1), ("c", 1), ("d", 1)]
+
+    # Rows that parse pass validation
+    out = nw.from_native(
+        MySchema.validate(df_type({k: v[:1] for k, v in data.items()}))
+    )
+    assert out.schema == {
+        "a": nw.UInt8,
+        "b": nw.Float64,
+        "c": nw.Date,
+        "d": nw.Datetime("ms"),
+    }
+    assert out.row(0) == (1, 1.5, date(2024, 1, 5), datetime(2024, 1, 5, 10))
@@ -69,6 +69,40 @@ def test_ordered_parsing():
     assert B.columns() == ["x", "b", "a"]
 
 
+def test_compiled_schema():
+    class A(cf.Schema):
+        a = cf.Float64(checks=[cf.Check.lt(3)])
+        b = cf.Float64(nullable=True, allow_nan=True)
+        c = cf.Union(cf.Int64(), cf.String(nullable=True))
+
+        @cf.Check
+        def frame_check() -> bool:
+            return True
+
+    compiled = A._parse_into_schema()._compiled
+
+    assert [c.name for c in compiled.columns] == ["a", "b", "c"]
+
+    a, b, c = compiled.columns
+    assert [check.name for check in a.builtin_checks] == [
+        "`nullable=False`",
+        "`allow_nan=False`",
+        "`allow_inf=False`",
+    ]
+    assert [name for name, _ in a.checks] == ["less_than"]
+    assert [check.name for check in b.builtin_checks] == ["`allow_inf=False`"]
+    assert c.dtype is None
+    assert [len(m.builtin_checks) for m in c.members] == [1, 0]
+    assert [name for name, _ in compiled.checks] == ["frame_check"]
+
+    # Built-in checks are shared by every column instead of being rebuilt per column
+    assert a.builtin_checks[-1] is b.builtin_checks[0]
+
+    # The compiled schema is immutable
+    with pytest.raises(AttributeError):
+        compiled.columns = ()  # type: ignore[misc]
+
+
 @pytest.mark.parametrize("dtype", TYPES)
 def test_name_override(dtype):
     name = "Reason Code"
@@ -1,7 +1,17 @@
+import pickle
+import subprocess
+import sys
+import threading
+
+import narwhals.stable.v1 as nw
+import pandas as pd
 import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 
 import checkedframe as cf
+from checkedframe._parquet import _decide, _Statistics
 
 
 def test_readme_example():
@@ -119,3 +129,922 @@ def test_nan_inf_passes_if_allowed():
     df = pl.DataFrame({"x": [float("nan"), float("inf"), float("-inf")]})
 
     MySchema.validate(df)
+
+
+def test_lazy_validation():
+    class MySchema(cf.Schema):
+        x = cf.Int64()
+        y = cf.String(nullable=True)
+
+        @cf.Check(columns="x")
+        def check_x_is_positive(name: str) -> pl.Expr:
+            return pl.col(name) > 0
+
+    lf = pl.LazyFrame({"x": [1, 2, -3], "y": ["a", None, "c"]})
+
+    res = MySchema.interrogate(lf)
+    assert isinstance(res.df, pl.LazyFrame)
+    assert isinstance(res.mask, pl.LazyFrame)
+    assert res.is_good.collect()["is_good"].to_list() == [True, True, False]
+    assert res.summary.collect()["n_failed"].sum() == 1
+
+    assert MySchema.filter(lf).collect()["x"].to_list() == [1, 2]
+
+    with pytest.raises(cf.exceptions.SchemaError):
+        MySchema.validate(lf, engine="streaming")
+
+    out = MySchema.validate(lf.filter(pl.col("x") > 0))
+    assert isinstance(out, pl.LazyFrame)
+
+
+def test_lazy_validation_with_eager_checks():
+    class MySchema(cf.Schema):
+        x = cf.Int32(cast=True)
+
+        @cf.Check
+        def check_height(df: pl.DataFrame) -> bool:
+            return df.height == 3
+
+    lf = pl.LazyFrame({"x": [1, 2, 3]})
+
+    out = MySchema.validate(lf)
+    assert isinstance(out, pl.LazyFrame)
+    assert out.collect_schema()["x"] == pl.Int32
+
+    with pytest.raises(cf.exceptions.SchemaError):
+        MySchema.validate(lf.head(2))
+
+
+def test_plan_cache():
+    class MySchema(cf.Schema):
+        x = cf.Int64(cast=True)
+        y = cf.Union(cf.Int64(), cf.String(cast=True))
+
+        @cf.Check(columns="x")
+        def check_x_is_positive(s: pl.Series) -> pl.Series:
+            return s > 0
+
+    cf.clear_plan_cache()
+
+    MySchema.validate(pl.DataFrame({"x": [1, 2], "y": [1, 2]}))
+    MySchema.validate(pl.DataFrame({"x": [3, 4], "y": [1, 2]}))
+    assert cf.plan_cache_info().hits == 1
+    assert cf.plan_cache_info().misses == 1
+
+    # The plan is reused, but Series checks and casts still see the new data
+    with pytest.raises(cf.exceptions.SchemaError):
+        MySchema.validate(pl.DataFrame({"x": [-1, 2], "y": [1, 2]}))
+
+    out = MySchema.validate(pl.DataFrame({"x": [1.0, 2.0], "y": [1.0, 2.0]}))
+    assert out.schema == {"x": pl.Int64, "y": pl.String}
+    assert cf.plan_cache_info().misses == 2
+
+    cf.set_plan_cache_maxsize(1)
+    try:
+        assert cf.plan_cache_info().currsize == 1
+
+        MySchema.validate(pl.DataFrame({"x": [1, 2], "y": [1, 2]}))
+        assert cf.plan_cache_info().misses == 3
+    finally:
+        cf.set_plan_cache_maxsize(128)
+        cf.clear_plan_cache()
+
+    assert cf.plan_cache_info() == (0, 0, 128, 0)
+
+
+def test_plan_cache_modified_schema():
+    schema = cf.Schema({"x": cf.Int64()})
+    df = pl.DataFrame({"x": [1, None]})
+
+    with pytest.raises(cf.exceptions.SchemaError):
+        schema.validate(df)
+
+    # Modifying the schema in place invalidates its plan
+    schema.expected_schema["x"].nullable = True
+    schema.validate(df)
+
+    schema.expected_schema["x"].checks.append(cf.Check.gt(1))
+    with pytest.raises(cf.exceptions.SchemaError, match="greater_than"):
+        schema.validate(df)
+
+    schema.expected_schema["x"].checks.clear()
+    schema.checks.append(cf.Check.is_id("x"))
+    schema.validate(df)
+
+    schema.expected_schema["y"] = cf.String()
+    with pytest.raises(cf.exceptions.SchemaError, match="Column marked as required"):
+        schema.validate(df)
+
+
+@pytest.mark.parametrize("engine", [pl.DataFrame, pl.LazyFrame])
+def test_fail_fast(engine):
+    n_calls = 0
+
+    class MySchema(cf.Schema):
+        x = cf.Int64(checks=[cf.Check.gt(0)])
+        y = cf.Int32(cast=True)
+
+        @cf.Check(columns="x")
+        def check_x_is_small(s: pl.Series) -> pl.Series:
+            nonlocal n_calls
+            n_calls += 1
+
+            return s < 100
+
+    with pytest.raises(cf.exceptions.SchemaError, match="required but not found"):
+        MySchema.validate(engine({"x": [1, 2]}), fail_fast=True)
+
+    # The Series check never runs since the expression checks already fail
+    with pytest.raises(cf.exceptions.SchemaError, match="Found 2 error") as e:
+        MySchema.validate(engine({"x": [-1, 2], "y": [1.5, 2.0]}), fail_fast=True)
+
+    assert "greater_than" in str(e.value)
+    assert n_calls == 0
+
+    with pytest.raises(cf.exceptions.SchemaError, match="Found 1 error"):
+        MySchema.validate(engine({"x": [1, 200], "y": [1.0, 2.0]}), fail_fast=True)
+
+    assert n_calls == 1
+
+    out = MySchema.validate(engine({"x": [1, 2], "y": [1.0, 2.0]}), fail_fast=True)
+    assert isinstance(out, engine)
+    assert out.collect_schema()["y"] == pl.Int32
+
+
+@pytest.mark.parametrize("engine", [pd.DataFrame, pl.DataFrame, pl.LazyFrame])
+def test_interrogate_without_mask(engine):
+    class MySchema(cf.Schema):
+        x = cf.Int64(checks=[cf.Check.gt(0)])
+        y = cf.Float64(allow_nan=False, cast=True)
+        z = cf.String(required=False)
+
+        @cf.Check(columns="x")
+        def check_x_is_small(s: cf.Series) -> cf.Series:
+            return s < 100
+
+        @cf.Check
+        def check_height(df: cf.DataFrame) -> bool:
+            return df.shape[0] == 3
+
+        @cf.Check
+        def check_x_sum() -> cf.Expr:
+            return cf.col("x").sum() > 1_000
+
+    df = engine({"x": [-1, 2, 200, 4], "y": [1, 2, 3, 4]})
+
+    expected = MySchema.interrogate(df)
+    res = MySchema.interrogate(df, mask=False)
+
+    assert res.mask is None
+    assert res.is_good is None
+
+    def _collect(x):
+        return x.collect() if isinstance(x, pl.LazyFrame) else x
+
+    assert sorted(nw.from_native(_collect(res.summary)).rows()) == sorted(
+        nw.from_native(_collect(expected.summary)).rows()
+    )
+    assert nw.from_native(res.df).collect_schema()["y"] == nw.Float64
+
+
+def test_batches():
+    class MySchema(cf.Schema):
+        x = cf.Int64(checks=[cf.Check.gt(0)])
+        y = cf.Float64(cast=True)
+
+    df = pl.DataFrame({"x": [1, -2, 3, -4, 5], "y": [1, 2, 3, 4, 5]})
+
+    batches = MySchema.interrogate_batches(df.iter_slices(2), mask=False)
+    assert batches.summary is None
+    assert [nw.from_native(r.df).shape[0] for r in batches] == [2, 2, 1]
+    assert batches.n_rows == 5
+
+    summary = batches.summary.filter(pl.col("operation") == "greater_than")
+    assert summary["n_failed"].to_list() == [2]
+    assert summary["pct_failed"].to_list() == [0.4]
+
+    batches = MySchema.validate_batches(
+        pd.DataFrame({"x": [1, 2, 3], "y": [1, 2, 3]}) for _ in range(3)
+    )
+    for batch in batches:
+        assert isinstance(batch, pd.DataFrame)
+        assert batch["y"].dtype == "float64"
+
+    assert batches.n_rows == 9
+    assert batches.summary["n_failed"].sum() == 0
+
+    with pytest.raises(cf.exceptions.SchemaError):
+        list(MySchema.validate_batches(df.iter_slices(2)))
+
+
+def test_n_threads():
+    # Both checks have to be waiting at the same time to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    class MySchema(cf.Schema):
+        x = cf.Int32(cast=True)
+
+        @cf.Check(columns="x")
+        def check_x_is_positive(s: pl.Series) -> pl.Series:
+            barrier.wait()
+            return s > 0
+
+        @cf.Check
+        def check_x_is_sorted(df: pl.DataFrame) -> bool:
+            barrier.wait()
+            return df["x"].is_sorted()
+
+    df = pl.DataFrame({"x": [-1, 2, 3]})
+
+    res = MySchema.interrogate(df, n_threads=2)
+    assert res.is_good.to_list() == [False, True, True]
+    assert res.df.schema["x"] == pl.Int32
+
+    with pytest.raises(cf.exceptions.SchemaError):
+        MySchema.validate(df, n_threads=2)
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars", "pyarrow"])
+def test_n_processes(backend):
+    class MySchema(cf.Schema):
+        x = cf.Int64(checks=[cf.Check.is_between(0, 5), cf.Check.lt("y")])
+        y = cf.Float64(allow_nan=False, checks=[cf.Check.gt(cf.col("y").mean())])
+        z = cf.String(checks=[cf.Check.str_starts_with("a")])
+
+        _id_check = cf.Check.is_id("x")
+
+    df = pd.DataFrame(
+        {
+            "x": [1, 2, 3, 4, 5, 6, 7],
+            "y": [2.0, 1.0, float("nan"), 8.0, 6.0, 9.0, 10.0],
+            "z": ["a", "b", "a", "a", "c", "a", "a"],
+        }
+    )
+    if backend == "polars":
+        df = pl.from_pandas(df)
+    elif backend == "pyarrow":
+        df = pa.Table.from_pandas(df)
+
+    expected = MySchema.interrogate(df)
+    res = MySchema.interrogate(df, n_processes=3)
+
+    assert nw.from_native(res.mask).rows() == nw.from_native(expected.mask).rows()
+    assert (
+        nw.from_native(res.is_good, series_only=True).to_list()
+        == nw.from_native(expected.is_good, series_only=True).to_list()
+    )
+    assert nw.from_native(res.summary).rows() == nw.from_native(expected.summary).rows()
+
+    summary = MySchema.interrogate(df, mask=False, n_processes=3).summary
+    assert (
+        nw.from_native(summary).rows()
+        == nw.from_native(MySchema.interrogate(df, mask=False).summary).rows()
+    )
+
+    with pytest.raises(cf.exceptions.SchemaError):
+        MySchema.validate(df, n_processes=3)
+
+
+def test_n_processes_without_main_guard(tmp_path):
+    # Polars workers are spawned, which re-imports the main module of a script
+    script = tmp_path / "script.py"
+    script.write_text(
+        "import checkedframe as cf\n"
+        "import polars as pl\n"
+        "\n"
+        "class MySchema(cf.Schema):\n"
+        "    x = cf.Int64(checks=[cf.Check.lt(5)])\n"
+        "\n"
+        "MySchema.interrogate(pl.DataFrame({'x': [1, 2, 3]}), n_processes=2)\n"
+    )
+
+    res = subprocess.run(
+        [sys.executable, str(script)], capture_output=True, text=True, timeout=120
+    )
+    assert res.returncode != 0
+    assert 'if __name__ == "__main__":' in res.stderr
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, pl.DataFrame, pl.LazyFrame])
+def test_compact_mask(df_type):
+    class MySchema(cf.Schema):
+        x = cf.Int64(checks=[cf.Check.is_between(0, 5)])
+        y = cf.Int64(checks=[cf.Check.lt(1000)])
+
+    df = df_type({"x": [1, 2, 8, 4, 9, 6, 7] * 100, "y": list(range(699)) + [2000]})
+
+    expected = MySchema.interrogate(df).mask
+    if isinstance(expected, pl.LazyFrame):
+        expected = expected.collect()
+
+    failures = MySchema.interrogate(df, mask="compact").mask
+
+    assert isinstance(failures, cf.FailureIndex)
+    assert failures.n_rows == 700
+    assert failures.columns == nw.from_native(expected).columns
+    assert nw.from_native(failures.to_mask()).rows() == nw.from_native(expected).rows()
+
+    x_failures = "__checkedframe_x_is_between__"
+    assert failures.n_failed(x_failures) == 400
+    assert failures.failing_rows(x_failures)[:4].tolist() == [2, 4, 5, 6]
+    y_failures = "__checkedframe_y_less_than__"
+    assert failures.n_failed(y_failures) == 1
+    assert failures.to_arrow(y_failures).to_pylist() == [699]
+
+    # Dense failures are stored as a bitmap (700 bits), sparse ones as row indices
+    assert failures.nbytes == 88 + 4
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, pl.DataFrame, pl.LazyFrame])
+def test_samples(df_type):
+    class MySchema(cf.Schema):
+        x = cf.Int64(checks=[cf.Check.is_between(0, 5)])
+        y = cf.String(checks=[cf.Check.str_starts_with("a")])
+        z = cf.Int64()
+
+        _id_check = cf.Check.is_id("y")
+
+    df = df_type(
+        {
+            "x": [1, 9, 3, 10, 11, 2],
+            "y": ["a", "b", "a", "c", "a", "a"],
+            "z": ["1", "2", "3", "4", "5", "6"],
+        }
+    )
+
+    res = MySchema.interrogate(df, n_samples=2)
+    # The data type of z and is_id fail the frame as a whole, not any of its rows
+    assert res.samples == [
+        cf.FailureSample("x", "is_between", 1, 9),
+        cf.FailureSample("x", "is_between", 3, 10),
+        cf.FailureSample("y", "starts_with", 1, "b"),
+        cf.FailureSample("y", "starts_with", 3, "c"),
+    ]
+    assert MySchema.interrogate(df).samples == []
+
+    with pytest.raises(cf.exceptions.SchemaError) as e:
+        MySchema.validate(df, n_samples=2)
+
+    assert e.value.samples == res.samples
+    assert "e.g. row 1 = 9, row 3 = 10" in str(e.value)
+    assert "e.g. row 1 = 'b', row 3 = 'c'" in str(e.value)
+    assert "is_id failed for 6 / 6 (100.00%) rows" in str(e.value)
+    assert "e.g. row 0" not in str(e.value)
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, pl.DataFrame, pl.LazyFrame])
+def test_scalar_results(df_type):
+    class MySchema(cf.Schema):
+        x = cf.Int64(checks=[cf.Check.lt(3)])
+        y = cf.Int64(nullable=True)
+
+        _sorted_check = cf.Check.is_sorted_by("x")
+
+    df = df_type({"x": [1, 2, 3], "y": [3, 2, 1]})
+
+    res = MySchema.interrogate(df)
+    mask = nw.from_native(res.mask)
+    summary = nw.from_native(res.summary)
+    if isinstance(mask, nw.LazyFrame):
+        mask, summary = mask.collect(), summary.collect()
+
+    # Existence and frame-level checks aren't broadcast into the mask
+    assert mask.columns == [
+        "__checkedframe_x_`nullable=False`__",
+        "__checkedframe_x_less_than__",
+    ]
+    assert summary.select("operation", "n_failed").rows() == [
+        ("existence", 0),
+        ("`nullable=False`", 0),
+        ("less_than", 1),
+        ("existence", 0),
+        ("is_sorted_by", 0),
+    ]
+
+    # A failing scalar result fails every row
+    df = nw.from_native(df).drop("y").to_native()
+    filtered = nw.from_native(MySchema.filter(df))
+    if isinstance(filtered, nw.LazyFrame):
+        filtered = filtered.collect()
+
+    assert filtered.shape[0] == 0
+
+    summary = nw.from_native(MySchema.interrogate(df, mask=False).summary)
+    if isinstance(summary, nw.LazyFrame):
+        summary = summary.collect()
+
+    assert summary.filter(nw.col("operation") == "existence")["n_failed"].to_list() == [
+        0,
+        3,
+    ]
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, pl.DataFrame])
+def test_summary_order(df_type):
+    class MySchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.lt(3)])
+        b = cf.Int64(nullable=True)
+
+        @cf.Check(columns="a")
+        def a_is_positive(s: cf.Series) -> cf.Series:
+            return s > 0
+
+        @cf.Check(columns="a")
+        def a_has_values(s: cf.Series) -> bool:
+            return len(s) > 0
+
+        @cf.Check
+        def frame_is_not_empty(df: cf.DataFrame) -> bool:
+            return len(df) > 0
+
+    df = df_type({"a": [1, 5], "b": [1, 2]})
+    res = MySchema.interrogate(df)
+
+    # Checks that take a Series are listed with their column, frame checks at the end
+    assert nw.from_native(res.summary).select("column", "operation").rows() == [
+        ("a", "existence"),
+        ("a", "`nullable=False`"),
+        ("a", "less_than"),
+        ("a", "a_is_positive"),
+        ("a", "a_has_values"),
+        ("b", "existence"),
+        ("__dataframe__", "frame_is_not_empty"),
+    ]
+    # Only checks that vary by row are in the mask
+    assert nw.from_native(res.mask).columns == [
+        "__checkedframe_a_`nullable=False`__",
+        "__checkedframe_a_less_than__",
+        "__checkedframe_a_a_is_positive__",
+    ]
+
+
+@pytest.mark.parametrize("mask", [True, False])
+@pytest.mark.parametrize(
+    "df_type", [pd.DataFrame, pa.table, pl.DataFrame, pl.LazyFrame]
+)
+def test_summary(df_type, mask):
+    def collect(frame):
+        frame = nw.from_native(frame)
+        return frame.collect() if isinstance(frame, nw.LazyFrame) else frame
+
+    # Enough columns that joining the counts to the metadata could reorder the rows
+    columns = {f"col_{i}": cf.Int64(checks=[cf.Check.lt(i)]) for i in range(30)}
+    WideSchema = type("WideSchema", (cf.Schema,), columns)
+
+    data = {f"col_{i}": [0, 100] for i in range(30)}
+    # Columns of the input that are named like mask and summary columns don't matter
+    data["__checkedframe_col_0_less_than__"] = [True, True]
+    data["n_failed"] = [0, 0]
+    data["id"] = ["a", "b"]
+    df = df_type(data)
+
+    summary = collect(WideSchema.interrogate(df, mask=mask).summary)
+    assert summary.columns == ["column", "operation", "n_failed", "pct_failed"]
+    assert summary.rows() == [
+        row
+        for i in range(30)
+        for row in [
+            (f"col_{i}", "existence", 0, 0.0),
+            (f"col_{i}", "`nullable=False`", 0, 0.0),
+            (f"col_{i}", "less_than", 2 if i == 0 else 1, 1.0 if i == 0 else 0.5),
+        ]
+    ]
+
+    # Scalar results are counted separately and mustn't turn the counts into floats
+    class MySchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.lt(3)])
+        b = cf.Int64()
+
+    summary = collect(MySchema.interrogate(df_type({"a": [1, 5]}), mask=mask).summary)
+    assert summary.rows() == [
+        ("a", "existence", 0, 0.0),
+        ("a", "`nullable=False`", 0, 0.0),
+        ("a", "less_than", 1, 0.5),
+        ("b", "existence", 2, 1.0),
+    ]
+    if df_type is pd.DataFrame:
+        assert summary.schema["n_failed"] == nw.Int64
+
+    class EmptySchema(cf.Schema):
+        pass
+
+    summary = collect(EmptySchema.interrogate(df, mask=mask).summary)
+    assert summary.columns == ["column", "operation", "n_failed", "pct_failed"]
+    assert summary.shape[0] == 0
+
+
+# NaN is a missing value in pandas, so it would also fail `nullable=False`
+@pytest.mark.parametrize("df_type", [pa.table, pl.DataFrame, pl.LazyFrame])
+def test_batched_builtin_checks(df_type):
+    class MySchema(cf.Schema):
+        a = cf.Float64()
+        b = cf.Float64(allow_nan=True, allow_inf=True, checks=[cf.Check.lt(3)])
+        c = cf.Float64(allow_inf=True)
+
+    df = df_type(
+        {
+            "a": [1.0, float("nan"), float("inf")],
+            "b": [1.0, None, 3.0],
+            "c": [float("nan"), float("nan"), None],
+        }
+    )
+
+    res = MySchema.interrogate(df)
+    mask = nw.from_native(res.mask)
+    summary = nw.from_native(res.summary)
+    if isinstance(mask, nw.LazyFrame):
+        mask, summary = mask.collect(), summary.collect()
+
+    # Batching the built-in checks of all columns doesn't change the order of results
+    assert mask.columns == [
+        "__checkedframe_a_`nullable=False`__",
+        "__checkedframe_a_`allow_nan=False`__",
+        "__checkedframe_a_`allow_inf=False`__",
+        "__checkedframe_b_`nullable=False`__",
+        "__checkedframe_b_less_than__",
+        "__checkedframe_c_`nullable=False`__",
+        "__checkedframe_c_`allow_nan=False`__",
+    ]
+    assert mask.select(nw.all().__invert__().sum()).row(0) == (0, 1, 1, 1, 1, 1, 2)
+    assert summary.select("column", "operation", "n_failed").rows() == [
+        ("a", "existence", 0),
+        ("a", "`nullable=False`", 0),
+        ("a", "`allow_nan=False`", 1),
+        ("a", "`allow_inf=False`", 1),
+        ("b", "existence", 0),
+        ("b", "`nullable=False`", 1),
+        ("b", "less_than", 1),
+        ("c", "existence", 0),
+        ("c", "`nullable=False`", 1),
+        ("c", "`allow_nan=False`", 2),
+    ]
+
+    summary = nw.from_native(MySchema.interrogate(df, mask=False).summary)
+    if isinstance(summary, nw.LazyFrame):
+        summary = summary.collect()
+
+    assert summary["n_failed"].to_list() == [0, 0, 1, 1, 0, 1, 1, 0, 1, 2]
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, pl.DataFrame])
+def test_schema_error_summary(df_type):
+    class MySchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.lt(3)])
+        b = cf.Int64(checks=[cf.Check.gt(1)])
+
+    df = df_type({"a": [1, 5, 6], "b": [2, 2, 0]})
+
+    with pytest.raises(cf.exceptions.SchemaError) as e:
+        MySchema.validate(df)
+
+    # The summary is available without rendering the message
+    summary = nw.from_native(e.value.summary, eager_only=True)
+    assert summary.filter(nw.col("n_failed") > 0).rows() == [
+        ("a", "less_than", 2, 2 / 3),
+        ("b", "greater_than", 1, 1 / 3),
+    ]
+
+    summary_message = (
+        "Found 2 error(s)\n"
+        "  a: 1 error(s)\n"
+        "    - less_than failed for 2 / 3 (66.67%) rows: Must be < 3\n"
+        "  b: 1 error(s)\n"
+        "    - greater_than failed for 1 / 3 (33.33%) rows: Must be > 1"
+    )
+    assert str(e.value) == summary_message
+    assert str(pickle.loads(pickle.dumps(e.value))) == str(e.value)
+    assert e.value.args == (str(e.value),)
+
+    # Context can be added by replacing the arguments, as with any exception
+    e.value.args = (f"While loading: {e.value}",)
+    assert e.value.args == (f"While loading: {summary_message}",)
+    assert str(e.value) == f"While loading: {summary_message}"
+
+
+@pytest.mark.parametrize(
+    "df_type", [pd.DataFrame, pa.table, pl.DataFrame, pl.LazyFrame]
+)
+def test_sample(df_type):
+    class MySchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.lt(900)])
+        b = cf.Int64(required=False)
+
+    df = df_type({"a": list(range(1_000))})
+
+    res = MySchema.interrogate(df, sample=100, seed=0)
+    sampled = nw.from_native(res.df)
+    summary = nw.from_native(res.summary)
+    if isinstance(summary, nw.LazyFrame):
+        sampled, summary = sampled.collect(), summary.collect()
+
+    # Rows are sampled independently, so the size of the sample is only about right
+    assert 95 <= sampled.shape[0] <= 105
+    # Rows keep their original order
+    assert sampled["a"].is_sorted()
+    assert summary.columns == [
+        "column",
+        "operation",
+        "n_failed",
+        "pct_failed",
+        "pct_failed_lower",
+        "pct_failed_upper",
+    ]
+
+    rows = {op: row for _, op, *row in summary.rows()}
+    # 10% of all rows fail
+    n_failed, pct_failed, lower, upper = rows["less_than"]
+    assert pct_failed == n_failed / sampled.shape[0]
+    assert lower < 0.1 < upper
+    # Existence doesn't depend on the rows, so it's exact
+    assert rows["existence"] == [0, 0.0, 0.0, 0.0]
+
+    # The sample is reproducible
+    assert (
+        nw.from_native(MySchema.interrogate(df, sample=100, seed=0).summary)
+        .lazy()
+        .collect()
+        .rows()
+        == summary.rows()
+    )
+
+    # Sampling every row is exact
+    summary = nw.from_native(MySchema.interrogate(df, sample=1.0).summary)
+    summary = summary.lazy().collect()
+    assert summary["pct_failed_lower"].to_list() == summary["pct_failed"].to_list()
+    assert summary["pct_failed_upper"].to_list() == summary["pct_failed"].to_list()
+
+    # A sample without rows says nothing about the frame
+    empty = nw.from_native(df).head(0).to_native()
+    summary = nw.from_native(MySchema.interrogate(empty, sample=0.5).summary)
+    summary = summary.lazy().collect()
+    assert summary["pct_failed"].is_null().all()
+    assert summary["pct_failed_lower"].to_list() == [0.0] * summary.shape[0]
+    assert summary["pct_failed_upper"].to_list() == [1.0] * summary.shape[0]
+
+    with pytest.raises(cf.exceptions.SchemaError, match="in a sample of 500 / 1,000"):
+        MySchema.validate(df, sample=0.5, seed=0)
+
+    class PassingSchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.lt(1_000)])
+
+    # The input is returned as is
+    assert PassingSchema.validate(df, sample=10) is df
+
+    with pytest.raises(ValueError):
+        MySchema.interrogate(df, sample=0)
+
+    with pytest.raises(ValueError):
+        MySchema.interrogate(df, sample=1.5)
+
+    class CastSchema(cf.Schema):
+        a = cf.Int32(cast=True)
+
+    # Only the sample would be cast
+    with pytest.raises(ValueError, match="cast columns: a"):
+        CastSchema.validate(df, sample=10)
+
+    res = CastSchema.interrogate(df, sample=10)
+    assert nw.from_native(res.df).collect_schema()["a"] == nw.Int32
+
+
+@pytest.mark.parametrize("df_type", [pd.DataFrame, pl.DataFrame, pl.LazyFrame])
+def test_incremental_validator(df_type):
+    class MySchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.is_sorted(), cf.Check.lt(100)])
+        b = cf.String()
+        c = cf.Int64(cast=True)
+
+        _id_check = cf.Check.is_id("a")
+        _cardinality_check = cf.Check.cardinality_ratio(
+            "b", "c", "m:1", allow_duplicates=True
+        )
+
+    data = {"a": [1, 2, 3], "b": ["x", "y", "x"], "c": [1, 2, 1]}
+    validator = cf.IncrementalValidator(MySchema)
+
+    validator.validate(df_type(data))
+    assert validator.n_rows == 3
+
+    data = {"a": [1, 2, 3, 4, 5], "b": ["x", "y", "x", "y", "z"], "c": [1, 2, 1, 2, 3]}
+    new = nw.from_native(validator.validate(df_type(data))).lazy().collect()
+    assert new["a"].to_list() == [4, 5]
+    assert validator.n_rows == 5
+
+    # Each of these only fails when compared to the rows validated so far
+    for a, b, c in [
+        ([5, 6], ["z", "w"], [3, 4]),  # duplicate key
+        ([4, 6], ["w", "v"], [4, 5]),  # not sorted
+        ([6, 7], ["x", "w"], [2, 4]),  # x maps to both 1 and 2
+    ]:
+        failing = df_type({"a": data["a"] + a, "b": data["b"] + b, "c": data["c"] + c})
+        with pytest.raises(cf.exceptions.SchemaError):
+            MySchema.validate(failing)
+
+        with pytest.raises(cf.exceptions.SchemaError):
+            validator.validate(failing)
+
+        # The watermark doesn't move on failure
+        assert validator.n_rows == 5
+
+    # Checks that aren't row-local are run on the whole table
+    class AggregateSchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.gt(cf.col("a").max().__sub__(10))])
+
+    validator = cf.IncrementalValidator(AggregateSchema)
+    validator.validate(df_type({"a": [1, 2, 3]}))
+    # The new row passes, but the rows validated before no longer do
+    with pytest.raises(cf.exceptions.SchemaError):
+        validator.validate(df_type({"a": [1, 2, 3, 20]}))
+
+    validator.reset()
+    assert validator.n_rows == 0
+
+
+def test_projection_pushdown():
+    seen_columns = []
+
+    class MySchema(cf.Schema):
+        a = cf.Int32(cast=True, checks=[cf.Check.le("b")])
+        c = cf.Int64(checks=[cf.Check.is_sorted()])
+
+        _id_check = cf.Check.is_id("d")
+
+        @cf.Check(depends_on="e")
+        def frame_check(df: nw.DataFrame) -> bool:
+            seen_columns.append(df.columns)
+            return True
+
+    lf = pl.LazyFrame({name: [1, 2, 3] for name in "abcdefg"})
+
+    out = MySchema.validate(lf)
+    # Only the columns of the schema and the columns the checks read are collected
+    assert seen_columns == [["a", "b", "c", "d", "e"]]
+    assert isinstance(out, pl.LazyFrame)
+    assert out.collect().columns == list("abcdefg")
+    assert out.collect_schema()["a"] == pl.Int32
+
+    assert MySchema.filter(lf).collect().columns == list("abcdefg")
+
+    class UndeclaredSchema(cf.Schema):
+        a = cf.Int64()
+
+        @cf.Check
+        def frame_check(df: nw.DataFrame) -> bool:
+            seen_columns.append(df.columns)
+            return True
+
+    # Without declared dependencies, a check may read any column
+    UndeclaredSchema.validate(lf)
+    assert seen_columns[-1] == list("abcdefg")
+
+
+def test_validate_parquet(tmp_path):
+    path = tmp_path / "data.parquet"
+    pq.write_table(
+        pa.table(
+            {
+                "a": [1, 2, 3, 4, 5, 6, 7],
+                "b": ["x", "x", "x", "x", "y", "z", "x"],
+                "c": [None, 1, 1, 1, 1, 1, 1],
+            }
+        ),
+        path,
+        row_group_size=2,
+    )
+
+    class MySchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.is_between(0, 10)])
+        b = cf.String(checks=[cf.Check.is_in(["x", "y", "z"])])
+        c = cf.Int64(nullable=True, checks=[cf.Check.lt(2)])
+
+    res = MySchema.validate_parquet(path)
+    # Only the row group with "y" and "z" can't be decided from statistics
+    assert res.to_pydict() == {
+        "row_group": [0, 1, 2, 3],
+        "n_rows": [2, 2, 2, 1],
+        "status": ["passed", "passed", "scanned", "passed"],
+    }
+
+    class FailingSchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.lt(5)])
+        b = cf.String(checks=[cf.Check.is_in(["x", "y", "z"])])
+        c = cf.Int64()
+
+    # Failures proven from statistics are reported without reading any data
+    with pytest.raises(cf.exceptions.SchemaError) as e:
+        FailingSchema.validate_parquet(path)
+
+    assert "less_than failed for row group(s) 2, 3" in str(e.value)
+    assert "`nullable=False` failed for row group(s) 0" in str(e.value)
+    # Only rows that were read can fail checks that aren't decided from statistics
+    assert "is_in" not in str(e.value)
+
+    class BetweenSchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.is_between(3, 4)])
+
+    with pytest.raises(cf.exceptions.SchemaError) as e:
+        BetweenSchema.validate_parquet(path)
+
+    assert "is_between failed for row group(s) 0, 2, 3" in str(e.value)
+
+    # The minimum and maximum are only bounds, e.g. the maximum may be rounded up, so a
+    # failure is only proven if every value within the bounds fails
+    stats = _Statistics(null_count=0, min=1, max=5)
+    assert _decide(cf.Check.lt(5), stats) is None
+    assert _decide(cf.Check.le(5), stats) is True
+    assert _decide(cf.Check.lt(1), stats) is False
+    assert _decide(cf.Check.gt(5), stats) is False
+    assert _decide(cf.Check.gt(4), stats) is None
+    assert _decide(cf.Check.is_between(6, 9), stats) is False
+    assert _decide(cf.Check.is_between(0, 1, closed="left"), stats) is False
+    assert _decide(cf.Check.is_between(0, 2), stats) is None
+    assert _decide(cf.Check.is_in([1, 5]), stats) is None
+    assert _decide(cf.Check.is_in([1]), _Statistics(0, 1, 1)) is True
+    assert _decide(cf.Check.is_not_null(), _Statistics(1, 1, 5)) is False
+    # Every value is null, which passes every check but `nullable=False`
+    assert _decide(cf.Check.gt(5), _Statistics(2, None, None)) is True
+
+    class ScannedSchema(cf.Schema):
+        b = cf.String(checks=[cf.Check.str_starts_with("x")])
+
+    with pytest.raises(cf.exceptions.SchemaError, match="starts_with failed"):
+        ScannedSchema.validate_parquet(path)
+
+    class FrameSchema(cf.Schema):
+        a = cf.Int64()
+
+        _id_check = cf.Check.is_id("a")
+
+    # Frame checks need every row
+    assert FrameSchema.validate_parquet(path)["status"].to_pylist() == ["scanned"] * 4
+
+
+def test_native_and_narwhals_expressions():
+    class MySchema(cf.Schema):
+        a = cf.Int64(checks=[cf.Check.lt(3)])
+        b = cf.Int64()
+
+        @cf.Check
+        def native_check() -> pl.Expr:
+            return pl.col("a").lt(pl.col("b"))
+
+        @cf.Check(columns="b")
+        def series_check(s: pl.Series) -> pl.Series:
+            return s.gt(1)
+
+    df = pl.DataFrame({"a": [1, 2, 3], "b": [2, 1, 4]})
+
+    # Native and narwhals expressions are evaluated in the same query
+    mask = MySchema.interrogate(df).mask
+    assert mask.columns == [
+        "__checkedframe_a_`nullable=False`__",
+        "__checkedframe_a_less_than__",
+        "__checkedframe_b_`nullable=False`__",
+        "__checkedframe__native_check__",
+        "__checkedframe_b_series_check__",
+    ]
+    assert mask.select(
+        "__checkedframe_a_less_than__",
+        "__checkedframe_b_series_check__",
+        "__checkedframe__native_check__",
+    ).rows() == [(True, True, True), (True, False, False), (False, True, True)]
+
+
+@pytest.mark.parametrize("df_type", [pl.DataFrame, pd.DataFrame, pl.LazyFrame])
+def test_optimize(df_type):
+    class MySchema(cf.Schema):
+        a = cf.Int64(cast=True, checks=[cf.Check.ge(0)])
+        b = cf.Int64(cast=True)
+        c = cf.Float64(cast=True)
+        d = cf.Float64(cast=True)
+        e = cf.Int64()
+        f = cf.Union(cf.Int16(), cf.Int64())
+
+    df = df_type(
+        {
+            "a": [25, 40, 61],
+            "b": [1, 70_000, -3],
+            "c": [1.5, 0.25, 2.0],
+            "d": [0.1, 0.2, 0.3],
+            "e": [1, 2, 3],
+            "f": [1, 2, 3],
+        }
+    )
+
+    res = MySchema.optimize(df)
+    summary = nw.from_native(res.summary)
+    assert summary.rows() == [
+        ("a", "Int64", "Int8", 21),
+        ("b", "Int64", "Int32", 12),
+        ("c", "Float64", "Float32", 12),
+        ("d", "Float64", "Float64", 0),
+        ("e", "Int64", "Int64", 0),
+        ("f", "Int64", "Int16", 18),
+    ]
+    assert res.bytes_saved == 63
+
+    # The schema still accepts the shrunk frame
+    MySchema.validate(res.df)
+
+    with pytest.raises(cf.exceptions.SchemaError):
+        MySchema.optimize(df_type({**{c: [1] for c in "abcdef"}, "a": [-1]}))